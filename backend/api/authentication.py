@@ -0,0 +1,110 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from core.metrics import metrics
+from core.versions import get_cached_version, get_token_version_name
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+User = get_user_model()
+
+TOKEN_KEY = 'auth:token:{}:{}'
+# The password hash stays out of the cache, it is loaded on access.
+USER_FIELDS = [field.attname for field in User._meta.concrete_fields
+               if field.attname != 'password']
+
+
+class TokenCache:
+    """
+    Token key -> user field values, an LRU of TOKEN_CACHE_SIZE entries per
+    worker, backed by the shared cache with TOKEN_CACHE_SHARED.
+
+    Entries carry the version of their token, which signals bump on logout
+    and when its user changes. Other workers notice it when the cache is
+    shared and drop their entries after TOKEN_CACHE_TTL seconds otherwise.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get_shared_key(self, key, version):
+        # Raw token keys never end up in the cache backend.
+        return TOKEN_KEY.format(version, hashlib.sha256(
+            key.encode()).hexdigest())
+
+    def get_local(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, entry_version, _ = entry
+            if entry_version != version or expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def get(self, key, version):
+        values = self.get_local(key, version)
+        if values is not None or not settings.TOKEN_CACHE_SHARED:
+            return values
+        values = cache.get(self.get_shared_key(key, version))
+        if values is not None:
+            self.set_local(key, version, values)
+        return values
+
+    def set(self, key, version, values):
+        self.set_local(key, version, values)
+        if settings.TOKEN_CACHE_SHARED:
+            cache.set(self.get_shared_key(key, version), values,
+                      settings.TOKEN_CACHE_TTL)
+
+    def set_local(self, key, version, values):
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + settings.TOKEN_CACHE_TTL, version, values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.TOKEN_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+
+token_cache = TokenCache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication without the token query on cache hits."""
+
+    def authenticate_credentials(self, key):
+        if settings.TOKEN_CACHE_TTL <= 0:
+            return super().authenticate_credentials(key)
+        # Read before the query, so a logout racing it is not cached over.
+        version = get_cached_version(get_token_version_name(key))
+        cached = token_cache.get(key, version)
+        metrics.inc('foodgram_cache_requests_total', cache='token',
+                    result='miss' if cached is None else 'hit')
+        if cached is None:
+            user, token = super().authenticate_credentials(key)
+            token_cache.set(key, version, (
+                token.created,
+                [getattr(user, name) for name in USER_FIELDS]
+            ))
+            return user, token
+        created, values = cached
+        # A fresh instance per request, nothing leaks between requests.
+        user = User.from_db(DEFAULT_DB_ALIAS, USER_FIELDS, values)
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(
+                gettext_lazy('User inactive or deleted.'))
+        token = Token.from_db(DEFAULT_DB_ALIAS, ['key', 'user_id', 'created'],
+                              [key, user.pk, created])
+        token.user = user
+        return user, token
@@ -0,0 +1,40 @@
+import hashlib
+
+from core.metrics import metrics
+from core.versions import get_versions
+from django.conf import settings
+from django.core.cache import cache
+
+RECIPE_LIST_KEY = 'recipes:list:{}'
+RECIPE_LIST_VERSIONS = ('recipes', 'tags', 'ingredients', 'users')
+
+
+def get_recipe_list_key(request):
+    # Read once: a list built before a bump must not be stored under the
+    # key of the new generation.
+    if hasattr(request, 'recipe_list_key'):
+        return request.recipe_list_key
+    query = sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        for value in values
+    )
+    versions = get_versions(RECIPE_LIST_VERSIONS)
+    generation = '-'.join(
+        str(versions[name][0]) for name in RECIPE_LIST_VERSIONS)
+    raw = f'{generation}|{request.get_host()}|{query}'
+    request.recipe_list_key = RECIPE_LIST_KEY.format(
+        hashlib.md5(raw.encode()).hexdigest())
+    return request.recipe_list_key
+
+
+def get_cached_recipe_list(request):
+    data = cache.get(get_recipe_list_key(request))
+    metrics.inc('foodgram_cache_requests_total', cache='recipe_list',
+                result='miss' if data is None else 'hit')
+    return data
+
+
+def set_cached_recipe_list(request, data):
+    cache.set(get_recipe_list_key(request), data,
+              settings.RECIPE_LIST_CACHE_TIMEOUT)
@@ -0,0 +1,56 @@
+from core.models import Recipe
+from core.versions import get_versions
+
+VERSIONS = ('tags', 'ingredients', 'users')
+
+
+def get_request_versions(request):
+    # ETag and Last-Modified of a request share one query.
+    if not hasattr(request, 'versions'):
+        request.versions = get_versions(VERSIONS)
+    return request.versions
+
+
+def tags_etag(request, *args, **kwargs):
+    return f'tags-{get_request_versions(request)["tags"][0]}'
+
+
+def tags_last_modified(request, *args, **kwargs):
+    return get_request_versions(request)['tags'][1]
+
+
+def ingredients_etag(request, *args, **kwargs):
+    return f'ingredients-{get_request_versions(request)["ingredients"][0]}'
+
+
+def ingredients_last_modified(request, *args, **kwargs):
+    return get_request_versions(request)['ingredients'][1]
+
+
+def get_recipe_updated_at(request, id):
+    if request.user.is_authenticated or not str(id).isdigit():
+        return None
+    if not hasattr(request, 'recipe_updated_at'):
+        request.recipe_updated_at = Recipe.objects.filter(
+            id=id).values_list('updated_at', flat=True).first()
+    return request.recipe_updated_at
+
+
+def recipe_etag(request, *args, **kwargs):
+    updated_at = get_recipe_updated_at(request, kwargs['id'])
+    if updated_at is None:
+        return None
+    versions = get_request_versions(request)
+    return (f'recipe-{kwargs["id"]}-{updated_at.timestamp()}-'
+            f'{versions["tags"][0]}-{versions["ingredients"][0]}-'
+            f'{versions["users"][0]}')
+
+
+def recipe_last_modified(request, *args, **kwargs):
+    updated_at = get_recipe_updated_at(request, kwargs['id'])
+    if updated_at is None:
+        return None
+    return max([updated_at] + [
+        modified for _, modified in get_request_versions(request).values()
+        if modified is not None
+    ])
@@ -0,0 +1,115 @@
+import base64
+import binascii
+import re
+import uuid
+from tempfile import SpooledTemporaryFile
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from PIL import Image
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+
+DATA_URI_RE = re.compile(r'^data:image/[\w.+-]+;base64,')
+# Multiple of 4 so every chunk decodes on its own.
+DECODE_CHUNK_SIZE = 64 * 1024
+HEADER_SCAN_SIZE = 4 * DECODE_CHUNK_SIZE
+EXTENSIONS = {'jpeg': 'jpg'}
+
+
+class StreamingBase64ImageField(serializers.ImageField):
+    default_error_messages = {
+        'invalid_image': 'Неверный формат изображения',
+        'max_size': 'Размер изображения не должен превышать {limit} байт',
+        'max_pixels': ('Разрешение изображения не должно превышать '
+                       '{limit} пикселей'),
+    }
+
+    def check_size(self, size):
+        if size > settings.IMAGE_UPLOAD_MAX_SIZE:
+            self.fail('max_size', limit=settings.IMAGE_UPLOAD_MAX_SIZE)
+
+    def open_image(self, file):
+        file.seek(0)
+        try:
+            image = Image.open(file)
+        except Image.DecompressionBombError:
+            self.fail('max_pixels', limit=settings.IMAGE_UPLOAD_MAX_PIXELS)
+        width, height = image.size
+        if width * height > settings.IMAGE_UPLOAD_MAX_PIXELS:
+            self.fail('max_pixels', limit=settings.IMAGE_UPLOAD_MAX_PIXELS)
+        return image
+
+    def verify(self, file):
+        try:
+            image = self.open_image(file)
+            image.verify()
+        except (OSError, SyntaxError, ValueError):
+            self.fail('invalid_image')
+        file.seek(0)
+        return image.format.lower()
+
+    def decode(self, data):
+        match = DATA_URI_RE.match(data)
+        start = match.end() if match else 0
+        encoded_size = len(data) - start
+        padding = len(data) - len(data.rstrip('='))
+        self.check_size(encoded_size // 4 * 3 - padding)
+        file = SpooledTemporaryFile(
+            max_size=settings.IMAGE_UPLOAD_SPOOL_SIZE)
+        header_checked = False
+        try:
+            for position in range(start, len(data), DECODE_CHUNK_SIZE):
+                file.write(base64.b64decode(
+                    data[position:position + DECODE_CHUNK_SIZE],
+                    validate=True))
+                if header_checked or position - start >= HEADER_SCAN_SIZE:
+                    continue
+                # Dimensions are in the first few chunks, so a decompression
+                # bomb fails before the rest of it is decoded.
+                try:
+                    self.open_image(file)
+                    header_checked = True
+                except OSError:
+                    pass
+                file.seek(0, 2)
+        except (binascii.Error, ValueError):
+            file.close()
+            self.fail('invalid_image')
+        except serializers.ValidationError:
+            file.close()
+            raise
+        return file
+
+    def is_stored_url(self, url):
+        instance = getattr(self.parent, 'instance', None)
+        if instance is None:
+            return False
+        stored = getattr(instance, self.source)
+        # Only the path, the host depends on the proxy in front.
+        return bool(stored) and urlparse(url).path == urlparse(
+            stored.url).path
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            self.check_size(getattr(data, 'size', 0))
+            self.verify(data)
+            return super().to_internal_value(data)
+        if data.startswith('http'):
+            # Clients echoing the stored image URL back keep the image.
+            if self.is_stored_url(data):
+                raise SkipField()
+            self.fail('invalid_image')
+        file = self.decode(data)
+        try:
+            extension = self.verify(file)
+        except serializers.ValidationError:
+            file.close()
+            raise
+        size = file.seek(0, 2)
+        file.seek(0)
+        extension = EXTENSIONS.get(extension, extension)
+        return UploadedFile(
+            file, name=f'{uuid.uuid4()}.{extension}',
+            content_type=f'image/{extension}', size=size)
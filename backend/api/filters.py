@@ -1,10 +1,27 @@
 import django_filters
-from core.models import Ingredient, Recipe
+from core.models import Favorite, Ingredient, Recipe, ShoppingCart
+from django import forms
+from django.db.models import Case, Exists, IntegerField, OuterRef, Value, When
+
+
+class MultipleValueField(forms.MultipleChoiceField):
+    def valid_value(self, value):
+        return True
+
+
+class MultipleCharFilter(django_filters.MultipleChoiceFilter):
+    field_class = MultipleValueField
+
+
+def filter_exists(queryset, name, subquery, value):
+    if name not in queryset.query.annotations:
+        queryset = queryset.annotate(**{name: Exists(subquery)})
+    return queryset.filter(**{name: bool(value)})
 
 
 class RecipeFilter(django_filters.FilterSet):
     author = django_filters.CharFilter()
-    tags = django_filters.AllValuesMultipleFilter(field_name='tags__slug')
+    tags = MultipleCharFilter(method='get_tags')
     is_favorited = django_filters.NumberFilter(method='get_favorite')
     is_in_shopping_cart = django_filters.NumberFilter(
         method='get_is_in_shopping_cart')
@@ -13,19 +30,26 @@ class RecipeFilter(django_filters.FilterSet):
         model = Recipe
         fields = ('tags', 'author')
 
+    def get_tags(self, queryset, name, value):
+        return filter_exists(
+            queryset, 'has_tags', Recipe.tags.through.objects.filter(
+                recipe=OuterRef('pk'), tag__slug__in=value), True)
+
     def get_favorite(self, queryset, name, value):
         user = self.request.user
-        if user.is_authenticated:
-            if value == 1:
-                return queryset.filter(favorite_recipe__user=user)
-        return queryset.exclude(favorite_recipe__user=user)
+        if not user.is_authenticated:
+            return queryset.none() if value else queryset
+        return filter_exists(
+            queryset, 'is_favorited', Favorite.objects.filter(
+                user=user, recipe=OuterRef('pk')), value)
 
     def get_is_in_shopping_cart(self, queryset, name, value):
         user = self.request.user
-        if not user.is_anonymous:
-            if value == 1:
-                return queryset.filter(shopping_recipe__user=user)
-        return queryset.exclude(shopping_recipe__user=user)
+        if not user.is_authenticated:
+            return queryset.none() if value else queryset
+        return filter_exists(
+            queryset, 'is_in_shopping_cart', ShoppingCart.objects.filter(
+                user=user, recipe=OuterRef('pk')), value)
 
 
 class IngredientFilter(django_filters.FilterSet):
@@ -36,4 +60,10 @@ class IngredientFilter(django_filters.FilterSet):
         fields = ('name',)
 
     def get_name(self, queryset, name, value):
-        return queryset.filter(name__icontains=value)
+        return queryset.filter(name__icontains=value).annotate(
+            rank=Case(
+                When(name__istartswith=value, then=Value(0)),
+                default=Value(1),
+                output_field=IntegerField()
+            )
+        ).order_by('rank', 'name')
@@ -1,6 +1,183 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from collections import OrderedDict
+
+from core.models import FeedItem, Recipe, Subscription
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int
+)
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class ValuesCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        # Counting pks only keeps per-row annotations out of COUNT(*).
+        if hasattr(self.object_list, 'values'):
+            return self.object_list.values('pk').count()
+        return super().count
 
 
 class CustomPagination(PageNumberPagination):
+    django_paginator_class = ValuesCountPaginator
+    page_size_query_param = 'limit'
+    page_size = 6
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = 'cursor'
     page_size_query_param = 'limit'
     page_size = 6
+    max_page_size = 100
+    ordering = ()
+    # Model and field names the cursor values are converted with,
+    # the names default to the ordering.
+    cursor_model = None
+    cursor_fields = None
+    invalid_cursor_message = 'Неверный курсор'
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True, cutoff=self.max_page_size)
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def encode_cursor(self, position):
+        return base64.urlsafe_b64encode(
+            json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if (not isinstance(position, list)
+                or len(position) != len(self.ordering)):
+            raise NotFound(self.invalid_cursor_message)
+        names = self.cursor_fields or [
+            field.lstrip('-') for field in self.ordering]
+        try:
+            position = [
+                self.cursor_model._meta.get_field(name).to_python(value)
+                for name, value in zip(names, position)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if None in position:
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def get_position_filter(self, position, ordering=None):
+        condition = Q()
+        equal = {}
+        for field, value in zip(ordering or self.ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+        return condition
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position))
+        page = list(queryset[:self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        page = page[:self.page_size]
+        self.next_position = None
+        if self.has_next:
+            self.next_position = [
+                str(getattr(page[-1], field.lstrip('-')))
+                for field in self.ordering
+            ]
+        return page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param,
+            self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data)
+        ]))
+
+
+class RecipeKeysetPagination(KeysetPagination):
+    ordering = ('-pub_date', '-id')
+    cursor_model = Recipe
+
+
+class FeedPagination(RecipeKeysetPagination):
+    feed_ordering = ('-pub_date', '-recipe_id')
+
+    def get_keys(self, queryset, ordering, position):
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(
+                self.get_position_filter(position, ordering))
+        return list(queryset.values_list(
+            *(field.lstrip('-') for field in ordering)
+        )[:self.page_size + 1])
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+        keys = self.get_keys(
+            FeedItem.objects.filter(user=request.user),
+            self.feed_ordering, position)
+        keys += self.get_keys(
+            Recipe.objects.filter(
+                author__in=FeedItem.objects.popular_authors(request.user)),
+            self.ordering, position)
+        keys = sorted(set(keys), reverse=True)
+        self.has_next = len(keys) > self.page_size
+        keys = keys[:self.page_size]
+        self.next_position = None
+        if self.has_next:
+            self.next_position = [str(value) for value in keys[-1]]
+        recipes = queryset.in_bulk([recipe for _, recipe in keys])
+        return [recipes[recipe] for _, recipe in keys]
+
+
+class SubscriptionKeysetPagination(KeysetPagination):
+    ordering = ('-subscription_id',)
+    cursor_model = Subscription
+    cursor_fields = ('id',)
+
+
+class KeysetPaginationMixin:
+    keyset_pagination_class = None
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            pagination_class = self.pagination_class
+            keyset_class = self.keyset_pagination_class
+            if (keyset_class is not None
+                    and keyset_class.cursor_query_param
+                    in self.request.query_params):
+                pagination_class = keyset_class
+            self._paginator = (
+                None if pagination_class is None else pagination_class())
+        return self._paginator
@@ -0,0 +1,27 @@
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.parsers import JSONParser
+
+
+class RequestTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'Размер запроса не должен превышать {limit} байт'
+    default_code = 'request_too_large'
+
+    def __init__(self, limit):
+        super().__init__(self.default_detail.format(limit=limit))
+
+
+class LimitedJSONParser(JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        request = parser_context['request']
+        limit = settings.UPLOAD_MAX_BODY_SIZE
+        try:
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            length = 0
+        # Checked before reading, so an oversized body never gets buffered.
+        if length > limit:
+            raise RequestTooLarge(limit)
+        return super().parse(stream, media_type, parser_context)
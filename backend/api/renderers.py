@@ -0,0 +1,58 @@
+import csv
+import json
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+class ShoppingCartRenderer(BaseRenderer):
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, dict):
+            # Error payloads (e.g. 401) are not rows, send them as JSON.
+            return JSONRenderer().render(data)
+        return ''.join(self.stream(data)).encode(self.charset)
+
+    def stream(self, rows):
+        raise NotImplementedError
+
+
+class ShoppingCartTxtRenderer(ShoppingCartRenderer):
+    media_type = 'text/plain'
+    format = 'txt'
+
+    def stream(self, rows):
+        for name, measurement_unit, amount in rows:
+            yield f'• {name} ({measurement_unit}) — {amount}\n'
+
+
+class ShoppingCartCsvRenderer(ShoppingCartRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+    def stream(self, rows):
+        writer = csv.writer(Echo())
+        yield writer.writerow(('name', 'measurement_unit', 'amount'))
+        for row in rows:
+            yield writer.writerow(row)
+
+
+class ShoppingCartJsonRenderer(ShoppingCartRenderer):
+    media_type = 'application/json'
+    format = 'json'
+
+    def stream(self, rows):
+        separator = '['
+        for name, measurement_unit, amount in rows:
+            yield separator + json.dumps({
+                'name': name,
+                'measurement_unit': measurement_unit,
+                'amount': amount
+            }, ensure_ascii=False)
+            separator = ','
+        yield '[]' if separator == '[' else ']'
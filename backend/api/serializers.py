@@ -1,5 +1,10 @@
+from functools import reduce
+from operator import or_
+
+from core.images import get_variant_urls, schedule_variants
 from core.models import (
     Favorite,
+    FeedItem,
     Ingredient,
     IngredientRecipe,
     Recipe,
@@ -8,11 +13,14 @@ from core.models import (
     Tag
 )
 from django.contrib.auth import authenticate, get_user_model
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
 from django.utils.translation import gettext_lazy
 from djoser.serializers import UserCreateSerializer
-from drf_base64.fields import Base64ImageField
 from rest_framework import serializers
 
+from .fields import StreamingBase64ImageField
+
 User = get_user_model()
 
 
@@ -92,7 +100,7 @@ class LoginSerializer(serializers.Serializer):
 
 
 class Ingredient2RecipeCreateSerializer(serializers.ModelSerializer):
-    id = serializers.PrimaryKeyRelatedField(queryset=Ingredient.objects.all())
+    id = serializers.IntegerField()
 
     class Meta:
         model = IngredientRecipe
@@ -101,7 +109,7 @@ class Ingredient2RecipeCreateSerializer(serializers.ModelSerializer):
 
 class RecipeCreateSerializer(serializers.ModelSerializer):
     ingredients = Ingredient2RecipeCreateSerializer(many=True)
-    image = Base64ImageField(use_url=False)
+    image = StreamingBase64ImageField(use_url=False)
 
     class Meta:
         model = Recipe
@@ -109,36 +117,57 @@ class RecipeCreateSerializer(serializers.ModelSerializer):
             'ingredients', 'tags', 'image', 'name', 'text', 'cooking_time'
         )
 
-    def validate(self, attrs):
-        unique_ingredients = []
-        ingredients = attrs.get('ingredients')
+    def validate_ingredients(self, ingredients):
+        unique_ingredients = set()
+        duplicates = set()
         for ingredient in ingredients:
             ingredient_id = ingredient['id']
-            if ingredient_id not in unique_ingredients:
-                unique_ingredients.append(ingredient_id)
-            else:
-                raise serializers.ValidationError(
-                    f'Нельзя дублировать ингредиент: '
-                    f'({ingredient_id})')
-        return attrs
+            if ingredient_id in unique_ingredients:
+                duplicates.add(ingredient_id)
+            unique_ingredients.add(ingredient_id)
+        if duplicates:
+            raise serializers.ValidationError(
+                f'Нельзя дублировать ингредиенты: '
+                f'({", ".join(map(str, sorted(duplicates)))})')
+        missing = unique_ingredients - set(Ingredient.objects.filter(
+            id__in=unique_ingredients).values_list('id', flat=True))
+        if missing:
+            raise serializers.ValidationError(
+                f'Ингредиенты не найдены: '
+                f'({", ".join(map(str, sorted(missing)))})')
+        return ingredients
 
     def add_tags(self, tags, recipe):
-        if recipe.tags:
-            recipe.tags.clear()
-        for tag in tags:
-            recipe.tags.add(tag)
+        recipe.tags.set(tags)
+
+    def get_ingredient_recipes(self, pairs):
+        if not pairs:
+            return {}
+        return dict(
+            ((ingredient_id, amount), pk)
+            for pk, ingredient_id, amount
+            in IngredientRecipe.objects.filter(
+                reduce(or_, (Q(ingredient_id=ingredient_id, amount=amount)
+                             for ingredient_id, amount in pairs))
+            ).values_list('id', 'ingredient_id', 'amount')
+        )
 
     def add_ingredients(self, ingredients, recipe):
-        if recipe.ingredients:
-            recipe.ingredients.clear()
-        for ingredient in ingredients:
-            ingredient_id = ingredient.get('id').id
-            amount = ingredient['amount']
-            ingredient_recipe, _ = IngredientRecipe.objects.get_or_create(
-                ingredient_id=ingredient_id, amount=amount)
-            recipe.ingredients.add(ingredient_recipe)
+        pairs = {(ingredient['id'], ingredient['amount'])
+                 for ingredient in ingredients}
+        ingredient_recipes = self.get_ingredient_recipes(pairs)
+        missing = pairs - ingredient_recipes.keys()
+        if missing:
+            IngredientRecipe.objects.bulk_create(
+                [IngredientRecipe(ingredient_id=ingredient_id, amount=amount)
+                 for ingredient_id, amount in missing],
+                ignore_conflicts=True
+            )
+            ingredient_recipes.update(self.get_ingredient_recipes(missing))
+        recipe.ingredients.set(ingredient_recipes.values())
         return recipe
 
+    @transaction.atomic
     def create(self, validated_data):
         author = self.context.get('request').user
         tags = validated_data.pop('tags')
@@ -146,14 +175,40 @@ class RecipeCreateSerializer(serializers.ModelSerializer):
         recipe = Recipe.objects.create(author=author, **validated_data)
         self.add_tags(tags, recipe)
         self.add_ingredients(ingredients, recipe)
+        FeedItem.objects.fan_out(recipe)
+        schedule_variants(recipe)
         return recipe
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         ingredients = validated_data.pop('ingredients')
         tags = validated_data.pop('tags')
         self.add_ingredients(ingredients, instance)
         self.add_tags(tags, instance)
-        return super().update(instance, validated_data)
+        old_image = instance.image.name
+        instance = super().update(instance, validated_data)
+        # Re-uploading the same picture maps to the same stored file.
+        if instance.image.name == old_image:
+            return instance
+        instance.image_processed = False
+        Recipe.objects.filter(pk=instance.pk).update(image_processed=False)
+        schedule_variants(instance)
+        return instance
+
+
+class ImageVariantsField(serializers.Field):
+    def __init__(self, **kwargs):
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, recipe):
+        urls = get_variant_urls(recipe)
+        request = self.context.get('request')
+        if request is None:
+            return urls
+        return {variant: request.build_absolute_uri(url)
+                for variant, url in urls.items()}
 
 
 class TagSerializer(serializers.ModelSerializer):
@@ -164,8 +219,8 @@ class TagSerializer(serializers.ModelSerializer):
 
 class IngredientSerializer(serializers.ModelSerializer):
     id = serializers.IntegerField(source='ingredient.id')
-    name = serializers.StringRelatedField(source='ingredient')
-    measurement_unit = serializers.StringRelatedField(
+    name = serializers.CharField(source='ingredient.name')
+    measurement_unit = serializers.CharField(
         source='ingredient.measurement_unit')
 
     class Meta:
@@ -180,6 +235,8 @@ class UserEventSerializer(serializers.ModelSerializer):
         user = self.context.get('request').user
         if not user.is_authenticated:
             return False
+        if hasattr(obj, 'is_subscribed'):
+            return obj.is_subscribed
         return Subscription.objects.filter(user=user, author=obj).exists()
 
     class Meta:
@@ -200,9 +257,12 @@ class RecipeSerializer(serializers.ModelSerializer):
     tags = TagSerializer(many=True)
     is_favorited = serializers.SerializerMethodField()
     is_in_shopping_cart = serializers.SerializerMethodField()
+    image_variants = ImageVariantsField()
 
     def get_author(self, obj):
         request = self.context['request']
+        if hasattr(obj, 'author_is_subscribed'):
+            obj.author.is_subscribed = obj.author_is_subscribed
         serializer = UserEventSerializer(
             obj.author,
             context={'request': request},
@@ -213,19 +273,24 @@ class RecipeSerializer(serializers.ModelSerializer):
         user = self.context.get('request').user
         if not user.is_authenticated:
             return False
+        if hasattr(obj, 'is_favorited'):
+            return obj.is_favorited
         return Favorite.objects.filter(user=user, recipe=obj).exists()
 
     def get_is_in_shopping_cart(self, obj):
         user = self.context.get('request').user
         if not user.is_authenticated:
             return False
+        if hasattr(obj, 'is_in_shopping_cart'):
+            return obj.is_in_shopping_cart
         return ShoppingCart.objects.filter(user=user, recipe=obj).exists()
 
     class Meta:
         model = Recipe
         fields = (
             'id', 'tags', 'author', 'ingredients', 'is_favorited',
-            'is_in_shopping_cart', 'name', 'image', 'text', 'cooking_time'
+            'is_in_shopping_cart', 'name', 'image', 'image_variants', 'text',
+            'cooking_time'
         )
 
 
@@ -253,11 +318,13 @@ class ShoppingCartSerializer(serializers.ModelSerializer):
         author = self.validated_data.get('recipe')
         return user, author
 
+    @transaction.atomic
     def save(self):
         user, recipe = self.user_recipe_determiner()
         ShoppingCart.objects.create(user=user, recipe=recipe)
         return self.to_representation(recipe)
 
+    @transaction.atomic
     def destroy(self):
         user, recipe = self.user_recipe_determiner()
         ShoppingCart.objects.filter(user=user, recipe=recipe).delete()
@@ -267,9 +334,11 @@ class ShoppingCartSerializer(serializers.ModelSerializer):
 
 
 class RecipeSubSerializer(serializers.ModelSerializer):
+    image_variants = ImageVariantsField()
+
     class Meta:
         model = Recipe
-        fields = ('id', 'name', 'image', 'cooking_time')
+        fields = ('id', 'name', 'image', 'image_variants', 'cooking_time')
 
 
 class SubscriptionEventSerializer(serializers.ModelSerializer):
@@ -301,14 +370,18 @@ class SubscriptionEventSerializer(serializers.ModelSerializer):
         author = self.validated_data.get('author')
         return user, author
 
+    @transaction.atomic
     def save(self):
         user, author = self.user_author_determiner()
         Subscription.objects.create(user=user, author=author)
+        FeedItem.objects.follow(user, author)
         return self.to_representation(author)
 
+    @transaction.atomic
     def destroy(self):
         user, author = self.user_author_determiner()
         Subscription.objects.filter(user=user, author=author).delete()
+        FeedItem.objects.unfollow(user, author)
 
     def to_representation(self, instance):
         return SubscriptionSerializer(
@@ -317,8 +390,27 @@ class SubscriptionEventSerializer(serializers.ModelSerializer):
         ).data
 
 
+def get_recipes_limit(request):
+    try:
+        limit = int(request.query_params.get('recipes_limit'))
+    except (TypeError, ValueError):
+        return None
+    return limit if limit >= 0 else None
+
+
+def get_recipes_preview(recipes, limit):
+    recipes = recipes.order_by('-pub_date', '-id')
+    if limit is None:
+        return recipes
+    return recipes.filter(pk__in=Subquery(
+        Recipe.objects.filter(
+            author=OuterRef('author')
+        ).order_by('-pub_date', '-id').values('pk')[:limit]
+    ))
+
+
 class SubscriptionSerializer(serializers.ModelSerializer):
-    recipes = RecipeSubSerializer(many=True)
+    recipes = serializers.SerializerMethodField()
     recipes_count = serializers.SerializerMethodField()
     is_subscribed = serializers.SerializerMethodField()
 
@@ -326,10 +418,22 @@ class SubscriptionSerializer(serializers.ModelSerializer):
         user = self.context.get('request').user
         if not user.is_authenticated:
             return False
+        if hasattr(obj, 'is_subscribed'):
+            return obj.is_subscribed
         return Subscription.objects.filter(user=user, author=obj).exists()
 
+    def get_recipes(self, obj):
+        recipes = getattr(obj, 'recipes_preview', None)
+        if recipes is None:
+            recipes = obj.recipes.order_by('-pub_date', '-id')
+            limit = get_recipes_limit(self.context.get('request'))
+            if limit is not None:
+                recipes = recipes[:limit]
+        return RecipeSubSerializer(
+            recipes, many=True, context=self.context).data
+
     def get_recipes_count(self, obj):
-        return Recipe.objects.filter(author=obj.id).count()
+        return obj.recipes_count
 
     class Meta:
         model = User
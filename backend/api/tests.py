@@ -0,0 +1,264 @@
+from api.paginators import RecipeKeysetPagination
+from core.models import (
+    Favorite,
+    Ingredient,
+    IngredientRecipe,
+    Recipe,
+    ShoppingCart,
+    ShoppingListItem,
+    Tag,
+    Version
+)
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import pre_delete
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from users.models import User
+
+RECIPES = 48
+# count, page, tags, ingredients
+LIST_QUERIES = 4
+
+
+def create_user(username):
+    return User.objects.create(username=username,
+                               email=f'{username}@foodgram.ru',
+                               first_name=username, last_name=username)
+
+
+@override_settings(RECIPE_LIST_CACHE_TIMEOUT=0)
+class RecipeListTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user('reader')
+        authors = [create_user(f'author{index}') for index in range(3)]
+        cls.tags = [
+            Tag.objects.create(name=slug, color=color, slug=slug)
+            for slug, color in (('a', '#FF0000'), ('b', '#00FF00'),
+                                ('c', '#0000FF'))
+        ]
+        ingredients = [
+            IngredientRecipe.objects.create(
+                ingredient=Ingredient.objects.create(
+                    name=f'ingredient {index}', measurement_unit='г'),
+                amount=index + 1)
+            for index in range(4)
+        ]
+        # a, b, a and b, c: a recipe with both tags must not show up twice.
+        tag_sets = ([0], [1], [0, 1], [2])
+        for index in range(RECIPES):
+            recipe = Recipe.objects.create(
+                author=authors[index % len(authors)],
+                name=f'recipe {index}', text='text', cooking_time=10,
+                image='media/recipes/recipe.png')
+            recipe.tags.set(cls.tags[tag] for tag in tag_sets[index % 4])
+            recipe.ingredients.set(ingredients[index % 3:index % 3 + 2])
+            if index // 4 % 2 == 0:
+                Favorite.objects.create(user=cls.user, recipe=recipe)
+            if index // 8 % 2 == 0:
+                ShoppingCart.objects.create(user=cls.user, recipe=recipe)
+        # Equal publication dates, so pages rely on the id tie-breaker.
+        Recipe.objects.update(pub_date=Recipe.objects.first().pub_date)
+
+    def get(self, url):
+        with self.assertNumQueries(LIST_QUERIES):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_list_queries_do_not_depend_on_page_size(self):
+        for authenticated in (False, True):
+            if authenticated:
+                self.client.force_authenticate(self.user)
+            for limit in (6, 100):
+                with self.subTest(authenticated=authenticated, limit=limit):
+                    data = self.get(f'/api/recipes/?limit={limit}')
+                    self.assertEqual(len(data['results']),
+                                     min(limit, RECIPES))
+
+    def test_list_flags_are_annotated(self):
+        self.client.force_authenticate(self.user)
+        data = self.get('/api/recipes/?limit=100')
+        favorited = set(Favorite.objects.filter(
+            user=self.user).values_list('recipe', flat=True))
+        in_cart = set(ShoppingCart.objects.filter(
+            user=self.user).values_list('recipe', flat=True))
+        for recipe in data['results']:
+            self.assertEqual(recipe['is_favorited'],
+                             recipe['id'] in favorited)
+            self.assertEqual(recipe['is_in_shopping_cart'],
+                             recipe['id'] in in_cart)
+
+    def test_filters_paginate_distinct_recipes(self):
+        self.client.force_authenticate(self.user)
+        tagged = set(Recipe.objects.filter(
+            tags__slug__in=['a', 'b']).values_list('id', flat=True))
+        favorited = set(Favorite.objects.filter(
+            user=self.user).values_list('recipe', flat=True))
+        in_cart = set(ShoppingCart.objects.filter(
+            user=self.user).values_list('recipe', flat=True))
+        for is_favorited in (0, 1):
+            for is_in_shopping_cart in (0, 1):
+                expected = {
+                    pk for pk in tagged
+                    if (pk in favorited) == bool(is_favorited)
+                    and (pk in in_cart) == bool(is_in_shopping_cart)
+                }
+                url = (f'/api/recipes/?tags=a&tags=b&limit=4'
+                       f'&is_favorited={is_favorited}'
+                       f'&is_in_shopping_cart={is_in_shopping_cart}')
+                with self.subTest(is_favorited=is_favorited,
+                                  is_in_shopping_cart=is_in_shopping_cart):
+                    ids = []
+                    page = 1
+                    while True:
+                        data = self.get(f'{url}&page={page}')
+                        self.assertEqual(data['count'], len(expected))
+                        ids += [recipe['id'] for recipe in data['results']]
+                        if data['next'] is None:
+                            break
+                        page += 1
+                    self.assertEqual(len(ids), len(set(ids)))
+                    self.assertEqual(set(ids), expected)
+
+    def test_malformed_cursor_is_not_found(self):
+        for position in (['garbage', 'x'], [None, 1], [[1], {}], ['x']):
+            cursor = RecipeKeysetPagination().encode_cursor(position)
+            with self.subTest(position=position):
+                response = self.client.get(f'/api/recipes/?cursor={cursor}')
+                self.assertEqual(response.status_code, 404)
+
+
+class RecipeImageTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = create_user('author')
+        cls.tag = Tag.objects.create(name='a', color='#FF0000', slug='a')
+        cls.ingredient = Ingredient.objects.create(name='ingredient',
+                                                   measurement_unit='г')
+        cls.recipe = Recipe.objects.create(
+            author=cls.author, name='recipe', text='text', cooking_time=10,
+            image='media/recipes/recipe.png')
+
+    def setUp(self):
+        self.client.force_authenticate(self.author)
+
+    def get_data(self, image):
+        return {
+            'name': 'renamed', 'text': 'text', 'cooking_time': 10,
+            'image': image, 'tags': [self.tag.id],
+            'ingredients': [{'id': self.ingredient.id, 'amount': 1}],
+        }
+
+    def test_image_url_keeps_image(self):
+        url = f'/api/recipes/{self.recipe.id}/'
+        image = self.client.get(url).data['image']
+        response = self.client.put(url, self.get_data(image), format='json')
+        self.assertEqual(response.status_code, 200)
+        self.recipe.refresh_from_db()
+        self.assertEqual(self.recipe.name, 'renamed')
+        self.assertEqual(self.recipe.image.name, 'media/recipes/recipe.png')
+
+    def test_other_image_url_is_rejected(self):
+        data = self.get_data('http://example.com/recipe.png')
+        for method, url in (
+            ('post', '/api/recipes/'),
+            ('put', f'/api/recipes/{self.recipe.id}/'),
+        ):
+            with self.subTest(method=method):
+                response = getattr(self.client, method)(
+                    url, data, format='json')
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('image', response.data)
+        self.assertEqual(Recipe.objects.count(), 1)
+
+
+class ConditionalRequestTestCase(APITestCase):
+    def test_etag_follows_database_version(self):
+        Tag.objects.create(name='a', color='#FF0000', slug='a')
+        etag = self.client.get('/api/tags/')['ETag']
+        cache.clear()
+        self.assertEqual(self.client.get('/api/tags/')['ETag'], etag)
+        # A bump from another process never touches this process's cache.
+        Version.objects.filter(name='tags').update(value=F('value') + 1)
+        response = self.client.get('/api/tags/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        response = self.client.get('/api/tags/',
+                                   HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+
+class ShoppingListTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user('buyer')
+        author = create_user('author')
+        cls.ingredients = [
+            IngredientRecipe.objects.create(
+                ingredient=Ingredient.objects.create(
+                    name=f'ingredient {index}', measurement_unit='г'),
+                amount=index + 1)
+            for index in range(3)
+        ]
+        cls.recipe = Recipe.objects.create(
+            author=author, name='recipe', text='text', cooking_time=10,
+            image='media/recipes/recipe.png')
+        cls.recipe.ingredients.set(cls.ingredients[:2])
+        ShoppingCart.objects.create(user=cls.user, recipe=cls.recipe)
+
+    def assertInSync(self):
+        self.assertEqual(
+            set(ShoppingListItem.objects.expected()),
+            set(ShoppingListItem.objects.values_list(
+                'user', 'ingredient', 'total_amount')))
+
+    def test_ingredient_changes_follow_carts(self):
+        self.assertInSync()
+        self.recipe.ingredients.add(self.ingredients[2])
+        self.assertInSync()
+        self.recipe.ingredients.remove(self.ingredients[0])
+        self.assertInSync()
+        self.ingredients[2].ingredients.clear()
+        self.assertInSync()
+        self.recipe.ingredients.clear()
+        self.assertInSync()
+
+    def test_failed_recipe_delete_keeps_debiting_carts(self):
+        def fail(**kwargs):
+            raise ValueError
+
+        pre_delete.connect(fail, sender=Recipe)
+        try:
+            with self.assertRaises(ValueError), transaction.atomic():
+                Recipe.objects.get(pk=self.recipe.pk).delete()
+        finally:
+            pre_delete.disconnect(fail, sender=Recipe)
+        self.assertInSync()
+        ShoppingCart.objects.filter(user=self.user).delete()
+        self.assertInSync()
+        self.assertFalse(ShoppingListItem.objects.exists())
+
+
+class IngredientSearchTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ingredients = [
+            Ingredient.objects.create(name=f'ingredient {index}',
+                                      measurement_unit='г')
+            for index in range(3)
+        ]
+
+    @override_settings(INGREDIENT_SEARCH_LIMIT=2)
+    def test_search_is_limited(self):
+        response = self.client.get('/api/ingredients/?name=ingr')
+        self.assertEqual(len(response.data), 2)
+
+    def test_retrieve_ignores_search_limit(self):
+        ingredient = self.ingredients[0]
+        response = self.client.get(
+            f'/api/ingredients/{ingredient.id}/?name=ingr')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['id'], ingredient.id)
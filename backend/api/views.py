@@ -1,8 +1,22 @@
-from core.models import Ingredient, Recipe, Tag
+from core.catalog import ingredient_catalog
+from core.models import (
+    Favorite,
+    Ingredient,
+    IngredientRecipe,
+    Recipe,
+    ShoppingCart,
+    ShoppingListItem,
+    Subscription,
+    Tag
+)
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Sum
-from django.http import HttpResponse
+from django.db.models import BooleanField, Exists, F, OuterRef, Prefetch, Value
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend
 from djoser.views import TokenDestroyView, UserViewSet
 from rest_framework import status
@@ -13,9 +27,30 @@ from rest_framework.permissions import SAFE_METHODS, AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet, ModelViewSet, mixins
 
+from .caching import get_cached_recipe_list, set_cached_recipe_list
+from .conditions import (
+    get_request_versions,
+    ingredients_etag,
+    ingredients_last_modified,
+    recipe_etag,
+    recipe_last_modified,
+    tags_etag,
+    tags_last_modified
+)
 from .filters import IngredientFilter, RecipeFilter
-from .paginators import CustomPagination
+from .paginators import (
+    CustomPagination,
+    FeedPagination,
+    KeysetPaginationMixin,
+    RecipeKeysetPagination,
+    SubscriptionKeysetPagination
+)
 from .permissions import IsAuthenticatedAndOwnerOrAdmin
+from .renderers import (
+    ShoppingCartCsvRenderer,
+    ShoppingCartJsonRenderer,
+    ShoppingCartTxtRenderer
+)
 from .serializers import (
     FavoriteSerializer,
     IngredientModelSerializer,
@@ -25,20 +60,48 @@ from .serializers import (
     ShoppingCartSerializer,
     SubscriptionEventSerializer,
     SubscriptionSerializer,
-    TagSerializer
+    TagSerializer,
+    get_recipes_limit,
+    get_recipes_preview
 )
 
 User = get_user_model()
 
 
-class RecipeViewSet(ModelViewSet):
+class RecipeViewSet(KeysetPaginationMixin, ModelViewSet):
     queryset = Recipe.objects.all()
     filter_backends = (DjangoFilterBackend,)
     filterset_class = RecipeFilter
     lookup_field = 'id'
     pagination_class = CustomPagination
+    keyset_pagination_class = RecipeKeysetPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ('list', 'retrieve', 'feed'):
+            queryset = queryset.select_related('author').prefetch_related(
+                Prefetch('tags', queryset=Tag.objects.all()),
+                Prefetch(
+                    'ingredients',
+                    queryset=IngredientRecipe.objects.select_related(
+                        'ingredient')
+                ),
+            )
+        user = self.request.user
+        if not user.is_authenticated:
+            return queryset
+        return queryset.annotate(
+            is_favorited=Exists(Favorite.objects.filter(
+                user=user, recipe=OuterRef('pk'))),
+            is_in_shopping_cart=Exists(ShoppingCart.objects.filter(
+                user=user, recipe=OuterRef('pk'))),
+            author_is_subscribed=Exists(Subscription.objects.filter(
+                user=user, author=OuterRef('author'))),
+        )
 
     def get_permissions(self):
+        if self.action in ('download_shopping_cart', 'feed'):
+            return super().get_permissions()
         if self.request.method in SAFE_METHODS:
             permission_classes = [AllowAny]
         else:
@@ -71,6 +134,25 @@ class RecipeViewSet(ModelViewSet):
         serializer.destroy()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    def list(self, request, *args, **kwargs):
+        if (request.user.is_authenticated
+                or not settings.RECIPE_LIST_CACHE_TIMEOUT):
+            return super().list(request, *args, **kwargs)
+        data = get_cached_recipe_list(request)
+        if data is not None:
+            return Response(data)
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            set_cached_recipe_list(request, response.data)
+        return response
+
+    @method_decorator(condition(etag_func=recipe_etag,
+                                last_modified_func=recipe_last_modified))
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        patch_vary_headers(response, ('Authorization',))
+        return response
+
     def update(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data)
@@ -82,32 +164,43 @@ class RecipeViewSet(ModelViewSet):
             detail=False,
             url_path='download_shopping_cart',
             url_name='download_shopping_cart',
-            permission_classes=[IsAuthenticated]
+            permission_classes=[IsAuthenticated],
+            renderer_classes=[ShoppingCartTxtRenderer,
+                              ShoppingCartCsvRenderer,
+                              ShoppingCartJsonRenderer]
             )
     def download_shopping_cart(self, request, *args, **kwargs):
-        shopping_cart = {}
-        ingredients = Recipe.objects.filter(
-            shopping_recipe__user=request.user
+        renderer = request.accepted_renderer
+        ingredients = ShoppingListItem.objects.filter(
+            user=request.user
         ).values_list(
-            'ingredients__ingredient__name',
-            'ingredients__ingredient__measurement_unit'
-        ).annotate(amount=Sum('ingredients__amount'))
-        for name, measurement_unit, amount in ingredients:
-            if name not in shopping_cart:
-                shopping_cart[name] = {
-                    'measurement_unit': measurement_unit,
-                    'amount': amount
-                }
-        file_text = ([f"• {item} ({value['measurement_unit']}) — "
-                      f"{value['amount']}\n"
-                      for item, value in shopping_cart.items()])
-        response = HttpResponse(file_text, 'Content-Type: text/plain')
+            'ingredient__name',
+            'ingredient__measurement_unit',
+            'total_amount'
+        ).order_by('ingredient__name', 'ingredient__measurement_unit')
+        response = StreamingHttpResponse(
+            renderer.stream(ingredients.iterator()),
+            content_type=f'{renderer.media_type}; charset={renderer.charset}'
+        )
         response['Content-Disposition'] = (
             f'attachment; '
-            f'filename="{self.request.user.username} shopping cart.txt"'
+            f'filename="{request.user.username} shopping cart.'
+            f'{renderer.format}"'
         )
         return response
 
+    @action(methods=['GET'],
+            detail=False,
+            url_path='feed',
+            url_name='feed',
+            permission_classes=[IsAuthenticated],
+            pagination_class=FeedPagination,
+            keyset_pagination_class=FeedPagination)
+    def feed(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
     @action(methods=['POST', 'DELETE'],
             detail=True,
             url_path='shopping_cart',
@@ -136,6 +229,16 @@ class TagViewSet(mixins.RetrieveModelMixin,
     permission_classes = [AllowAny]
     pagination_class = None
 
+    @method_decorator(condition(etag_func=tags_etag,
+                                last_modified_func=tags_last_modified))
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @method_decorator(condition(etag_func=tags_etag,
+                                last_modified_func=tags_last_modified))
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
 
 class IngredientViewSet(mixins.RetrieveModelMixin,
                         mixins.ListModelMixin,
@@ -148,8 +251,36 @@ class IngredientViewSet(mixins.RetrieveModelMixin,
     permission_classes = (AllowAny,)
     pagination_class = None
 
+    @method_decorator(condition(etag_func=ingredients_etag,
+                                last_modified_func=ingredients_last_modified))
+    def list(self, request, *args, **kwargs):
+        if not settings.INGREDIENT_CATALOG_IN_MEMORY:
+            # Limited here, retrieve() runs the same filter and then get().
+            queryset = self.filter_queryset(self.get_queryset())
+            if request.query_params.get('name'):
+                queryset = queryset[:settings.INGREDIENT_SEARCH_LIMIT]
+            return Response(self.get_serializer(queryset, many=True).data)
+        return Response(ingredient_catalog.search(
+            request.query_params.get('name'),
+            version=get_request_versions(request)['ingredients'][0]))
+
+    @method_decorator(condition(etag_func=ingredients_etag,
+                                last_modified_func=ingredients_last_modified))
+    def retrieve(self, request, *args, **kwargs):
+        if not settings.INGREDIENT_CATALOG_IN_MEMORY:
+            return super().retrieve(request, *args, **kwargs)
+        try:
+            ingredient = ingredient_catalog.get(
+                int(kwargs['id']),
+                version=get_request_versions(request)['ingredients'][0])
+        except ValueError:
+            ingredient = None
+        if ingredient is None:
+            raise Http404
+        return Response(ingredient)
+
 
-class SubscriptionViewSet(UserViewSet):
+class SubscriptionViewSet(KeysetPaginationMixin, UserViewSet):
 
     def get_queryset(self):
         if self.action == 'retrieve':
@@ -178,11 +309,20 @@ class SubscriptionViewSet(UserViewSet):
             serializer_class=SubscriptionSerializer,
             permission_classes=[IsAuthenticated],
             filter_backends=(DjangoFilterBackend,),
-            pagination_class=CustomPagination
+            pagination_class=CustomPagination,
+            keyset_pagination_class=SubscriptionKeysetPagination
             )
     def subscriptions(self, request, *args, **kwargs):
         queryset = self.filter_queryset(
-            User.objects.filter(following__user=self.request.user))
+            User.objects.filter(following__user=self.request.user).annotate(
+                subscription_id=F('following__id'),
+                is_subscribed=Value(True, output_field=BooleanField())
+            ).prefetch_related(Prefetch(
+                'recipes',
+                queryset=get_recipes_preview(
+                    Recipe.objects.all(), get_recipes_limit(request)),
+                to_attr='recipes_preview'
+            )))
 
         page = self.paginate_queryset(queryset)
         if page is not None:
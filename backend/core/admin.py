@@ -2,10 +2,12 @@ from django.contrib import admin
 
 from .models import (
     Favorite,
+    FeedItem,
     Ingredient,
     IngredientRecipe,
     Recipe,
     ShoppingCart,
+    ShoppingListItem,
     Subscription,
     Tag
 )
@@ -17,12 +19,9 @@ class IngredientAdmin(admin.ModelAdmin):
 
 
 class RecipeAdmin(admin.ModelAdmin):
-    list_display = ('name', 'author')
+    list_display = ('name', 'author', 'favorites_count')
     list_filter = ('author', 'name', 'tags')
-    readonly_fields = ('favorite_count',)
-
-    def favorite_count(self, obj):
-        return Favorite.objects.filter(recipe=obj).count()
+    readonly_fields = ('favorites_count',)
 
 
 admin.site.register(Ingredient, IngredientAdmin)
@@ -30,5 +29,7 @@ admin.site.register(Tag)
 admin.site.register(Recipe, RecipeAdmin)
 admin.site.register(Subscription)
 admin.site.register(Favorite)
+admin.site.register(FeedItem)
 admin.site.register(IngredientRecipe)
 admin.site.register(ShoppingCart)
+admin.site.register(ShoppingListItem)
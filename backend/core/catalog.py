@@ -0,0 +1,82 @@
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+
+from .metrics import metrics
+from .models import Ingredient
+from .versions import get_version
+
+
+class IngredientCatalog:
+    """
+    Ingredients sorted by lowercased name, loaded on first use per worker.
+
+    Signals drop the copy in the current process. Other workers and
+    processes notice the bumped 'ingredients' version, and reload after
+    INGREDIENT_CATALOG_TTL seconds in any case.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = None
+        self._loaded_at = 0
+        self._version = None
+
+    def invalidate(self):
+        self._index = None
+
+    def get_index(self, version=None):
+        index = self._index
+        if version is None:
+            version = get_version('ingredients')
+        expired = (version != self._version
+                   or time.monotonic() - self._loaded_at
+                   > settings.INGREDIENT_CATALOG_TTL)
+        if index is not None and not expired:
+            metrics.inc('foodgram_cache_requests_total',
+                        cache='ingredient_catalog', result='hit')
+            return index
+        metrics.inc('foodgram_cache_requests_total',
+                    cache='ingredient_catalog', result='miss')
+        with self._lock:
+            if self._index is None or expired:
+                entries = sorted(
+                    Ingredient.objects.values(
+                        'id', 'name', 'measurement_unit').order_by(),
+                    key=lambda entry: (entry['name'].lower(), entry['id'])
+                )
+                self._index = (
+                    [entry['name'].lower() for entry in entries],
+                    entries,
+                    {entry['id']: entry for entry in entries}
+                )
+                self._loaded_at = time.monotonic()
+                self._version = version
+            return self._index
+
+    def get(self, pk, version=None):
+        return self.get_index(version)[2].get(pk)
+
+    def search(self, value=None, limit=None, version=None):
+        keys, entries, _ = self.get_index(version)
+        if not value:
+            return entries
+        value = value.lower()
+        limit = limit or settings.INGREDIENT_SEARCH_LIMIT
+        found = []
+        position = bisect_left(keys, value)
+        while (position < len(keys) and len(found) < limit
+               and keys[position].startswith(value)):
+            found.append(entries[position])
+            position += 1
+        for key, entry in zip(keys, entries):
+            if len(found) >= limit:
+                break
+            if value in key and not key.startswith(value):
+                found.append(entry)
+        return found
+
+
+ingredient_catalog = IngredientCatalog()
@@ -0,0 +1,133 @@
+import logging
+import os.path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from PIL import Image, ImageOps, features
+
+from .versions import bump_version
+
+EXTENSIONS = {'WEBP': 'webp', 'JPEG': 'jpg'}
+
+logger = logging.getLogger(__name__)
+
+
+class ThreadPoolQueue:
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.IMAGE_WORKERS,
+            thread_name_prefix='image-variants')
+
+    def enqueue(self, func, *args):
+        return self.executor.submit(self.run, func, *args)
+
+    def run(self, func, *args):
+        try:
+            return func(*args)
+        except Exception:
+            logger.exception('Image variants failed for %s', args)
+        finally:
+            connections.close_all()
+
+
+class SyncQueue:
+    def enqueue(self, func, *args):
+        return func(*args)
+
+
+@lru_cache(maxsize=None)
+def get_image_queue():
+    return import_string(settings.IMAGE_QUEUE)()
+
+
+def get_variant_format():
+    if settings.IMAGE_VARIANT_FORMAT == 'WEBP' and not features.check('webp'):
+        return 'JPEG'
+    return settings.IMAGE_VARIANT_FORMAT
+
+
+def get_variant_name(name, variant):
+    directory, filename = os.path.split(name)
+    return os.path.join(
+        directory, 'variants',
+        f'{os.path.splitext(filename)[0]}_{variant}.'
+        f'{EXTENSIONS[get_variant_format()]}')
+
+
+def get_variant_urls(recipe):
+    if not recipe.image:
+        return {}
+    if not recipe.image_processed:
+        return {variant: recipe.image.url
+                for variant in settings.IMAGE_VARIANTS}
+    return {
+        variant: default_storage.url(
+            get_variant_name(recipe.image.name, variant))
+        for variant in settings.IMAGE_VARIANTS
+    }
+
+
+def render_variant(image, size, image_format):
+    variant = image.copy()
+    variant.thumbnail(size, Image.LANCZOS)
+    if image_format == 'JPEG' and variant.mode != 'RGB':
+        variant = variant.convert('RGB')
+    content = BytesIO()
+    variant.save(content, image_format,
+                 quality=settings.IMAGE_VARIANT_QUALITY)
+    return content.getvalue()
+
+
+def save_variants(name):
+    image_format = get_variant_format()
+    with default_storage.open(name) as file:
+        image = ImageOps.exif_transpose(Image.open(file))
+        image.load()
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    for variant, size in settings.IMAGE_VARIANTS.items():
+        variant_name = get_variant_name(name, variant)
+        default_storage.delete(variant_name)
+        default_storage.save(variant_name, ContentFile(
+            render_variant(image, size, image_format)))
+
+
+def make_variants(recipe_id, name, force=False):
+    from .models import Recipe
+
+    # Images are content addressed, so a recipe reusing a stored picture
+    # finds its variants already rendered.
+    if force or not all(
+            default_storage.exists(get_variant_name(name, variant))
+            for variant in settings.IMAGE_VARIANTS):
+        save_variants(name)
+    updated = Recipe.objects.filter(pk=recipe_id, image=name).update(
+        image_processed=True, updated_at=timezone.now())
+    if updated:
+        bump_version('recipes')
+
+
+def schedule_variants(recipe):
+    if not recipe.image:
+        return
+    transaction.on_commit(lambda: get_image_queue().enqueue(
+        make_variants, recipe.id, recipe.image.name))
+
+
+def release_image(name):
+    # Only safe for names no upload can hand out again. Content addressed
+    # files are reclaimed by clearmedia once they are older than --min-age.
+    from .models import Recipe
+
+    if not name or Recipe.objects.filter(image=name).exists():
+        return
+    Recipe._meta.get_field('image').storage.delete(name)
+    for variant in settings.IMAGE_VARIANTS:
+        default_storage.delete(get_variant_name(name, variant))
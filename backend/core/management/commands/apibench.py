@@ -0,0 +1,177 @@
+import json
+import os.path
+import statistics
+import time
+
+from core.models import Ingredient, Recipe, ShoppingCart
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from foodgram.settings import BASE_DIR
+
+from .benchfeed import IMAGE
+
+BUDGETS_PATH = os.path.join(BASE_DIR, 'data', 'bench_budgets.json')
+SEARCH_TERMS = ('а', 'мо', 'сол', 'хлеб', 'сыр')
+# (name, method, url, authenticated)
+ENDPOINTS = (
+    ('recipes anonymous', 'get', '/api/recipes/', False),
+    ('recipes', 'get', '/api/recipes/', True),
+    ('recipes by tags', 'get', '/api/recipes/?tags={tag}', True),
+    ('favorited recipes', 'get', '/api/recipes/?is_favorited=1', True),
+    ('recipes in cart', 'get', '/api/recipes/?is_in_shopping_cart=1', True),
+    ('recipe detail', 'get', '/api/recipes/{recipe}/', True),
+    ('recipe create', 'post', '/api/recipes/', True),
+    ('recipe update', 'put', '/api/recipes/{own_recipe}/', True),
+    ('download cart', 'get', '/api/recipes/download_shopping_cart/', True),
+    ('subscriptions', 'get', '/api/users/subscriptions/?recipes_limit=3',
+     True),
+    ('feed', 'get', '/api/recipes/feed/', True),
+    ('ingredient search', 'get', '/api/ingredients/?name={term}', False),
+)
+
+
+class Command(BaseCommand):
+    help = ('Benchmarking hot API endpoints against latency, query count '
+            'and payload budgets, seed with recipegenerator 3000 500 first')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50)
+        parser.add_argument('--warmup', type=int, default=3)
+        parser.add_argument('--budgets', default=BUDGETS_PATH)
+        parser.add_argument('--only', nargs='*', metavar='ENDPOINT',
+                            help='names of endpoints to run')
+        parser.add_argument('--output', help='write results as JSON')
+        parser.add_argument(
+            '--write-budgets', action='store_true',
+            help='save measured values with headroom as the new budgets')
+
+    def get_payload(self, iteration):
+        return {
+            'name': f'apibench {iteration}',
+            'text': 'apibench',
+            'cooking_time': 10 + iteration % 2,
+            'image': IMAGE,
+            'tags': [self.params['tag_id']],
+            'ingredients': [
+                {'id': ingredient, 'amount': 1 + iteration % 2}
+                for ingredient in self.params['ingredients']
+            ],
+        }
+
+    def request(self, client, method, url, iteration):
+        url = url.format(
+            term=SEARCH_TERMS[iteration % len(SEARCH_TERMS)], **self.params)
+        if method == 'get':
+            response = client.get(url)
+        else:
+            response = getattr(client, method)(
+                url, self.get_payload(iteration), format='json')
+        if response.status_code >= 400:
+            raise CommandError(
+                f'{method.upper()} {url}: {response.status_code}')
+        if hasattr(response, 'streaming_content'):
+            return len(b''.join(response.streaming_content))
+        return len(response.content)
+
+    def measure(self, method, url, authenticated, options):
+        client = APIClient()
+        if authenticated:
+            client.force_authenticate(self.user)
+        for iteration in range(options['warmup']):
+            self.request(client, method, url, iteration)
+        timings = []
+        with CaptureQueriesContext(connection) as context:
+            size = self.request(client, method, url, 0)
+        # The log is reset by the next request, so count it right away.
+        queries = len(context)
+        for iteration in range(options['requests']):
+            started = time.perf_counter()
+            self.request(client, method, url, iteration)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        return {
+            'p50_ms': round(statistics.median(timings), 2),
+            'p95_ms': round(timings[max(int(len(timings) * 0.95) - 1, 0)], 2),
+            'queries': queries,
+            'bytes': size,
+        }
+
+    def get_params(self):
+        cart = ShoppingCart.objects.select_related('user', 'recipe').filter(
+            user__follower__isnull=False, user__favorite_user__isnull=False
+        ).first()
+        if cart is None:
+            raise CommandError('No seeded data, run recipegenerator first')
+        self.user = cart.user
+        return {
+            'recipe': cart.recipe_id,
+            'tag': cart.recipe.tags.values_list('slug', flat=True).first(),
+            'tag_id': cart.recipe.tags.values_list('id', flat=True).first(),
+            'ingredients': list(Ingredient.objects.order_by(
+                'id').values_list('id', flat=True)[:5]),
+        }
+
+    def check_budgets(self, results, budgets):
+        failures = []
+        for name, result in results.items():
+            budget = budgets.get(name, {})
+            for key in ('queries', 'p95_ms', 'bytes'):
+                if key in budget and result[key] > budget[key]:
+                    failures.append(
+                        f'{name}: {key} {result[key]} > {budget[key]}')
+        return failures
+
+    def write_budgets(self, path, results):
+        budgets = {
+            name: {
+                'queries': result['queries'],
+                'p95_ms': round(result['p95_ms'] * 3 + 20),
+                'bytes': int(result['bytes'] * 1.5),
+            }
+            for name, result in results.items()
+        }
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(budgets, file, ensure_ascii=False, indent=4)
+            file.write('\n')
+
+    @override_settings(RECIPE_LIST_CACHE_TIMEOUT=0)
+    def handle(self, *args, **options):
+        self.params = self.get_params()
+        endpoints = [endpoint for endpoint in ENDPOINTS
+                     if not options['only'] or endpoint[0] in options['only']]
+        results = {}
+        created = Recipe.objects.none()
+        try:
+            client = APIClient()
+            client.force_authenticate(self.user)
+            client.post('/api/recipes/', self.get_payload(0), format='json')
+            created = Recipe.objects.filter(author=self.user,
+                                            name__startswith='apibench')
+            self.params['own_recipe'] = created.latest('id').id
+            for name, method, url, authenticated in endpoints:
+                results[name] = self.measure(
+                    method, url, authenticated, options)
+                result = results[name]
+                print(f'{name:>20}: p50 {result["p50_ms"]:7.2f} ms, '
+                      f'p95 {result["p95_ms"]:7.2f} ms, '
+                      f'{result["queries"]:3} queries, '
+                      f'{result["bytes"]:7} bytes')
+        finally:
+            created.delete()
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                json.dump(results, file, indent=4)
+        if options['write_budgets']:
+            self.write_budgets(options['budgets'], results)
+            print(f'Budgets written to {options["budgets"]}')
+            return
+        with open(options['budgets'], encoding='utf-8') as file:
+            failures = self.check_budgets(results, json.load(file))
+        for failure in failures:
+            print(f'FAIL {failure}')
+        if failures:
+            raise CommandError(f'{len(failures)} budgets exceeded')
+        print('DONE! All budgets met')
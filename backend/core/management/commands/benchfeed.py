@@ -0,0 +1,97 @@
+import statistics
+import time
+
+from api.serializers import RecipeCreateSerializer
+from core.models import FeedItem, Ingredient, Recipe, Subscription, Tag
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.test import APIClient, APIRequestFactory
+from users.models import User
+
+IMAGE = (
+    'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABAgMAAABieywaAAAA'
+    'CVBMVEUAAAD///9fX1/S0ecCAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAACklEQVQImWNo'
+    'AAAAggCByxOyYQAAAABJRU5ErkJggg=='
+)
+
+
+class Command(BaseCommand):
+    help = 'Benchmarking recipe fan-out and the subscription feed'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--followers', type=int, default=10000)
+        parser.add_argument('--recipes', type=int, default=5)
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--keep', action='store_true',
+                            help='do not delete the generated users')
+
+    def create_users(self, prefix, count):
+        password = make_password('benchfeed')
+        User.objects.bulk_create(
+            (User(username=f'{prefix}{index}',
+                  email=f'{prefix}{index}@benchfeed.local',
+                  first_name='Bench', last_name='Feed', password=password)
+             for index in range(count))
+        )
+        return User.objects.filter(username__startswith=prefix)
+
+    def publish(self, author, index):
+        request = APIRequestFactory().post('/api/recipes/')
+        request.user = author
+        serializer = RecipeCreateSerializer(
+            data={
+                'name': f'benchfeed {index}',
+                'text': 'benchfeed',
+                'cooking_time': 1,
+                'image': IMAGE,
+                'tags': [Tag.objects.first().id],
+                'ingredients': [
+                    {'id': Ingredient.objects.first().id, 'amount': 1}],
+            },
+            context={'request': request}
+        )
+        serializer.is_valid(raise_exception=True)
+        started = time.perf_counter()
+        serializer.save()
+        return (time.perf_counter() - started) * 1000
+
+    def handle(self, *args, **options):
+        if not Tag.objects.exists() or not Ingredient.objects.exists():
+            raise CommandError('No tags or ingredients, run importjson first')
+        prefix = f'benchfeed{int(time.time())}_'
+        author = self.create_users(f'{prefix}author', 1).get()
+        followers = self.create_users(f'{prefix}follower',
+                                      options['followers'])
+        try:
+            Subscription.objects.bulk_create(
+                (Subscription(user_id=user, author=author)
+                 for user in followers.values_list('id', flat=True))
+            )
+            # bulk_create() skips the signals that keep the counter.
+            User.objects.filter(pk=author.pk).update(
+                followers_count=options['followers'])
+            popular = FeedItem.objects.is_popular(author.id)
+            print(f'{options["followers"]} followers, '
+                  f'{"read" if popular else "write"} time fan-out')
+            timings = [self.publish(author, index)
+                       for index in range(options['recipes'])]
+            print(f'publish: p50 {statistics.median(timings):.2f} ms, '
+                  f'max {max(timings):.2f} ms')
+            items = FeedItem.objects.filter(recipe__author=author).count()
+            print(f'feed items: {items}')
+            client = APIClient()
+            client.force_authenticate(followers.first())
+            timings = []
+            for _ in range(options['requests']):
+                started = time.perf_counter()
+                response = client.get('/api/recipes/feed/')
+                timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise CommandError(f'Feed returned {response.status_code}')
+            timings.sort()
+            print(f'feed: p50 {statistics.median(timings):.2f} ms, '
+                  f'p95 {timings[int(len(timings) * 0.95) - 1]:.2f} ms')
+        finally:
+            if not options['keep']:
+                Recipe.objects.filter(author=author).delete()
+                User.objects.filter(username__startswith=prefix).delete()
@@ -0,0 +1,62 @@
+import json
+import os.path
+import random
+import statistics
+import time
+
+from api.filters import IngredientFilter
+from core.models import Ingredient
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from foodgram.settings import BASE_DIR
+
+INGREDIENTS_JSON_PATH = os.path.join(BASE_DIR, 'data', 'ingredients.json')
+
+
+class Command(BaseCommand):
+    help = 'Benchmarking ingredient autocomplete over the full catalog'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--queries', type=int, default=500)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def get_terms(self, count, seed):
+        with open(INGREDIENTS_JSON_PATH, encoding='utf-8') as file:
+            names = [item['name'] for item in json.load(file)]
+        rnd = random.Random(seed)
+        terms = []
+        while len(terms) < count:
+            name = rnd.choice(names)
+            length = rnd.randint(1, 4)
+            start = 0 if rnd.random() < 0.7 else rnd.randint(
+                0, max(len(name) - length, 0))
+            terms.append(name[start:start + length])
+        return terms
+
+    def measure(self, search, terms):
+        timings = []
+        for term in terms:
+            started = time.perf_counter()
+            list(search(term))
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        return (statistics.median(timings),
+                timings[int(len(timings) * 0.95) - 1])
+
+    def handle(self, *args, **options):
+        if not Ingredient.objects.exists():
+            raise CommandError('No ingredients, run importjson first')
+        terms = self.get_terms(options['queries'], options['seed'])
+        searches = {
+            'icontains': lambda term: Ingredient.objects.filter(
+                name__icontains=term),
+            'ranked': lambda term: IngredientFilter(
+                {'name': term}, queryset=Ingredient.objects.all()).qs,
+        }
+        print(f'{Ingredient.objects.count()} ingredients, '
+              f'{len(terms)} queries, {connection.vendor}')
+        for label, search in searches.items():
+            p50, p95 = self.measure(search, terms)
+            print(f'{label:>10}: p50 {p50:.2f} ms, p95 {p95:.2f} ms')
+        print(searches['ranked'](terms[0]).explain())
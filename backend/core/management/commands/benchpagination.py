@@ -0,0 +1,52 @@
+import time
+
+from api.paginators import CustomPagination, RecipeKeysetPagination
+from core.models import Recipe
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+
+class Command(BaseCommand):
+    help = 'Comparing page-number and keyset pagination of the recipe feed'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page', type=int, default=10000)
+        parser.add_argument('--limit', type=int, default=6)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def measure(self, pagination_class, params, repeat):
+        request = Request(APIRequestFactory().get('/api/recipes/', params))
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            paginator = pagination_class()
+            paginator.paginate_queryset(Recipe.objects.all(), request)
+            timings.append((time.perf_counter() - started) * 1000)
+        return min(timings)
+
+    def handle(self, *args, **options):
+        page, limit = options['page'], options['limit']
+        total = Recipe.objects.count()
+        if total < page * limit:
+            raise CommandError(
+                f'{total} recipes is not enough for page {page}, '
+                f'run recipegenerator first')
+        keyset = RecipeKeysetPagination()
+        position = Recipe.objects.order_by(*keyset.ordering).values_list(
+            *(field.lstrip('-') for field in keyset.ordering)
+        )[(page - 1) * limit - 1]
+        cursor = keyset.encode_cursor([str(value) for value in position])
+        print(f'{total} recipes, page size {limit}')
+        for label, pagination_class, first, deep in (
+            ('page number', CustomPagination,
+             {'limit': limit}, {'limit': limit, 'page': page}),
+            ('keyset', RecipeKeysetPagination,
+             {'limit': limit, 'cursor': ''},
+             {'limit': limit, 'cursor': cursor}),
+        ):
+            print(f'{label:>12}: page 1 '
+                  f'{self.measure(pagination_class, first, options["repeat"]):.2f}'
+                  f' ms, page {page} '
+                  f'{self.measure(pagination_class, deep, options["repeat"]):.2f}'
+                  f' ms')
@@ -0,0 +1,105 @@
+import statistics
+import time
+
+from api.serializers import RecipeCreateSerializer
+from core.models import Ingredient, IngredientRecipe, Recipe, Tag
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from users.models import User
+
+from .benchfeed import IMAGE
+
+
+class RowByRowSerializer(RecipeCreateSerializer):
+    """The write path before the bulk rewrite, kept for comparison."""
+
+    def add_tags(self, tags, recipe):
+        recipe.tags.clear()
+        for tag in tags:
+            recipe.tags.add(tag)
+
+    def add_ingredients(self, ingredients, recipe):
+        recipe.ingredients.clear()
+        for ingredient in ingredients:
+            ingredient_recipe, _ = IngredientRecipe.objects.get_or_create(
+                ingredient_id=ingredient['id'], amount=ingredient['amount'])
+            recipe.ingredients.add(ingredient_recipe)
+        return recipe
+
+
+class Command(BaseCommand):
+    help = ('Comparing round-trips of the row-by-row and bulk recipe '
+            'write paths')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ingredients', type=int, default=20)
+        parser.add_argument('--tags', type=int, default=3)
+        parser.add_argument('--repeat', type=int, default=10)
+
+    def get_data(self, iteration):
+        # New amounts every time, so some ingredient rows must be created.
+        return {
+            'name': f'benchrecipewrite {iteration}',
+            'text': 'benchrecipewrite',
+            'cooking_time': 1,
+            'image': IMAGE,
+            'tags': self.tags,
+            'ingredients': [
+                {'id': ingredient, 'amount': 1000 + iteration * 7 + index}
+                for index, ingredient in enumerate(self.ingredients)
+            ],
+        }
+
+    def save(self, serializer_class, data, instance=None):
+        serializer = serializer_class(instance, data=data,
+                                      context={'request': self.request})
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as context:
+            serializer.is_valid(raise_exception=True)
+            recipe = serializer.save()
+        return recipe, len(context), (time.perf_counter() - started) * 1000
+
+    def measure(self, serializer_class, repeat):
+        results = {'create': [], 'update': []}
+        for iteration in range(repeat):
+            recipe, queries, elapsed = self.save(
+                serializer_class, self.get_data(iteration * 2))
+            results['create'].append((queries, elapsed))
+            _, queries, elapsed = self.save(
+                serializer_class, self.get_data(iteration * 2 + 1), recipe)
+            results['update'].append((queries, elapsed))
+        return {
+            name: (max(queries for queries, _ in values),
+                   statistics.median(elapsed for _, elapsed in values))
+            for name, values in results.items()
+        }
+
+    def handle(self, *args, **options):
+        self.ingredients = list(Ingredient.objects.order_by(
+            'id').values_list('id', flat=True)[:options['ingredients']])
+        self.tags = list(Tag.objects.order_by('id').values_list(
+            'id', flat=True)[:options['tags']])
+        author = User.objects.order_by('id').first()
+        if (len(self.ingredients) < options['ingredients']
+                or len(self.tags) < options['tags'] or author is None):
+            raise CommandError('Not enough data, run importjson and '
+                               'recipegenerator first')
+        self.request = APIRequestFactory().post('/api/recipes/')
+        self.request.user = author
+        print(f'{options["ingredients"]} ingredients, '
+              f'{options["tags"]} tags')
+        try:
+            for label, serializer_class in (
+                ('row by row', RowByRowSerializer),
+                ('bulk', RecipeCreateSerializer),
+            ):
+                for name, (queries, elapsed) in self.measure(
+                        serializer_class, options['repeat']).items():
+                    print(f'{label:>10} {name}: {queries:3} queries, '
+                          f'p50 {elapsed:.2f} ms')
+        finally:
+            Recipe.objects.filter(
+                author=author, name__startswith='benchrecipewrite').delete()
+        print('DONE!')
@@ -0,0 +1,126 @@
+import os
+import re
+import time
+
+from core.images import make_variants, release_image
+from core.models import Recipe
+from core.storage import get_content_hash
+from django.core.files import File
+from django.core.management.base import BaseCommand
+
+HASHED_NAME_RE = re.compile(r'(^|/)(?P<prefix>[0-9a-f]{2})/'
+                            r'(?P=prefix)[0-9a-f]{62}\.\w+$')
+
+
+def format_size(size):
+    return f'{size / 1024 / 1024:.1f} MiB'
+
+
+class Command(BaseCommand):
+    help = 'Reporting and reclaiming orphaned and duplicate recipe images'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--delete', action='store_true',
+            help='delete orphans and merge duplicates instead of reporting')
+        parser.add_argument(
+            '--min-age', type=int, default=3600,
+            help='skip files modified less than this many seconds ago')
+
+    def get_files(self, storage, directory):
+        started = time.time()
+        root = storage.path(directory)
+        for path, _, filenames in os.walk(root):
+            for filename in filenames:
+                full_path = os.path.join(path, filename)
+                stat = os.stat(full_path)
+                name = os.path.relpath(full_path, storage.location)
+                yield (name.replace(os.sep, '/'), stat.st_size,
+                       started - stat.st_mtime)
+
+    def is_reused(self, storage, name, min_age):
+        # ContentAddressedStorage touches a file it hands out again, so an
+        # upload may have picked an orphan up since it was listed.
+        try:
+            modified = os.stat(storage.path(name)).st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - modified < min_age
+
+    def get_owner(self, name):
+        # media/recipes/ab/variants/<stem>_<variant>.webp
+        # belongs to media/recipes/ab/<stem>.*
+        directory, filename = os.path.split(name)
+        stem = os.path.splitext(filename)[0].rsplit('_', 1)[0]
+        return os.path.dirname(directory), stem
+
+    def get_key(self, name):
+        directory, filename = os.path.split(name)
+        return directory, os.path.splitext(filename)[0]
+
+    def get_duplicates(self, storage, names):
+        by_hash = {}
+        for name in names:
+            with storage.open(name) as file:
+                by_hash.setdefault(get_content_hash(File(file)), []).append(
+                    name)
+        return by_hash
+
+    def merge(self, storage, name):
+        with storage.open(name) as file:
+            hashed_name = storage.save(name, File(file))
+        recipes = list(Recipe.objects.filter(image=name).values_list(
+            'id', flat=True))
+        Recipe.objects.filter(id__in=recipes).update(
+            image=hashed_name, image_processed=False)
+        release_image(name)
+        for recipe_id in recipes:
+            make_variants(recipe_id, hashed_name)
+
+    def handle(self, *args, **options):
+        storage = Recipe._meta.get_field('image').storage
+        directory = Recipe._meta.get_field('image').upload_to
+        referenced = set(Recipe.objects.exclude(image='').values_list(
+            'image', flat=True))
+        referenced_keys = {self.get_key(name) for name in referenced}
+        files = {}
+        images = {}
+        for name, size, age in self.get_files(storage, directory):
+            if '/variants/' not in name:
+                images[self.get_key(name)] = name
+            if age >= options['min_age']:
+                files[name] = size
+        orphans = [
+            name for name in files
+            if (self.get_owner(name) not in referenced_keys
+                if '/variants/' in name else name not in referenced)
+        ]
+        legacy = [name for name in files
+                  if name in referenced and not HASHED_NAME_RE.search(name)]
+        hashed = {os.path.basename(name).split('.')[0]
+                  for name in files if HASHED_NAME_RE.search(name)}
+        duplicates = []
+        for content_hash, names in self.get_duplicates(
+                storage, legacy).items():
+            # One copy survives unless the content is already stored.
+            duplicates += names if content_hash in hashed else names[1:]
+        print(f'files: {len(files)}, '
+              f'{format_size(sum(files.values()))}')
+        print(f'orphaned: {len(orphans)}, '
+              f'{format_size(sum(files[name] for name in orphans))}')
+        print(f'duplicates: {len(duplicates)}, '
+              f'{format_size(sum(files[name] for name in duplicates))}')
+        print(f'not content addressed: {len(legacy)}')
+        if not options['delete']:
+            return
+        print('Reclaiming...')
+        for name in orphans:
+            # Variants go with their image.
+            image = (images.get(self.get_owner(name))
+                     if '/variants/' in name else name)
+            if image is None or not self.is_reused(
+                    storage, image, options['min_age']):
+                storage.delete(name)
+        for name in legacy:
+            self.merge(storage, name)
+        print('DONE!')
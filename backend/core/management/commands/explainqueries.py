@@ -0,0 +1,103 @@
+import json
+
+from core.models import ShoppingCart
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+from users.models import User
+
+WATCHED_TABLES = {
+    'core_recipe', 'core_recipe_tags', 'core_recipe_ingredients',
+    'ingredientrecipes', 'favorites', 'shopping_cart', 'shopping_list',
+    'subscriptions',
+}
+ENDPOINTS = (
+    ('recipes', '/api/recipes/', False),
+    ('recipes authenticated', '/api/recipes/', True),
+    ('recipes by author', '/api/recipes/?author={user}', True),
+    ('recipes by tags', '/api/recipes/?tags={tag}', True),
+    ('favorited recipes', '/api/recipes/?is_favorited=1', True),
+    ('recipes in cart', '/api/recipes/?is_in_shopping_cart=1', True),
+    ('recipes keyset', '/api/recipes/?cursor=', True),
+    ('recipe detail', '/api/recipes/{recipe}/', True),
+    ('download cart', '/api/recipes/download_shopping_cart/', True),
+    ('subscriptions', '/api/users/subscriptions/', True),
+    ('subscriptions keyset', '/api/users/subscriptions/?cursor=', True),
+)
+
+
+class Command(BaseCommand):
+    help = 'Failing if a hot endpoint query falls back to a sequential scan'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int,
+                            help='user id, defaults to one with a cart')
+
+    def get_seq_scans_postgresql(self, cursor, sql):
+        cursor.execute('SET enable_seqscan = off')
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        nodes = [plan[0]['Plan']]
+        while nodes:
+            node = nodes.pop()
+            nodes.extend(node.get('Plans', ()))
+            if node['Node Type'] == 'Seq Scan':
+                yield node['Relation Name']
+
+    def get_seq_scans_sqlite(self, cursor, sql):
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        for row in cursor.fetchall():
+            words = row[-1].split()
+            if words[0] != 'SCAN' or 'USING' in words:
+                continue
+            yield words[2] if words[1] == 'TABLE' else words[1]
+
+    def get_seq_scans(self, sql):
+        explain = getattr(self, f'get_seq_scans_{connection.vendor}', None)
+        if explain is None:
+            raise CommandError(f'{connection.vendor} is not supported')
+        with connection.cursor() as cursor:
+            return set(explain(cursor, sql)) & WATCHED_TABLES
+
+    def get_user(self, user_id):
+        if user_id is not None:
+            return User.objects.get(id=user_id)
+        cart = ShoppingCart.objects.select_related('user').first()
+        if cart is None:
+            raise CommandError('No shopping carts, seed the database first')
+        return cart.user
+
+    @override_settings(RECIPE_LIST_CACHE_TIMEOUT=0)
+    def handle(self, *args, **options):
+        user = self.get_user(options['user'])
+        recipe = user.shopping_user.first().recipe
+        params = {
+            'user': user.id,
+            'recipe': recipe.id,
+            'tag': getattr(recipe.tags.first(), 'slug', ''),
+        }
+        failures = 0
+        for name, url, authenticated in ENDPOINTS:
+            client = APIClient()
+            if authenticated:
+                client.force_authenticate(user)
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(url.format(**params))
+                if hasattr(response, 'streaming_content'):
+                    b''.join(response.streaming_content)
+            queries = [query['sql'] for query in context.captured_queries
+                       if query['sql'].lstrip().upper().startswith('SELECT')]
+            scans = set()
+            for sql in queries:
+                scans |= self.get_seq_scans(sql)
+            status = 'FAIL' if scans else 'ok'
+            print(f'{status:>4} {name}: {response.status_code}, '
+                  f'{len(queries)} queries'
+                  + (f', seq scan on {", ".join(sorted(scans))}'
+                     if scans else ''))
+            failures += bool(scans)
+        if failures:
+            raise CommandError(f'{failures} endpoints use sequential scans')
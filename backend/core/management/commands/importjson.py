@@ -1,23 +1,148 @@
+import csv
+import io
 import json
 import os.path
+import time
+from itertools import islice
 
+from core.catalog import ingredient_catalog
 from core.models import Ingredient
-from django.core.management.base import BaseCommand
+from core.versions import bump_version
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
 
 from foodgram.settings import BASE_DIR
 
 FOODGRAM_PUB_DIR = os.path.abspath(os.path.join(BASE_DIR))
 INGREDIENTS_JSON_PATH = f'{FOODGRAM_PUB_DIR}/data/ingredients.json'
+READ_SIZE = 64 * 1024
+
+
+def read_json(file):
+    """Yields the objects of a top-level JSON array one at a time."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+    while True:
+        chunk = file.read(READ_SIZE)
+        buffer += chunk
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if not started and position < len(buffer):
+                if buffer[position] != '[':
+                    raise CommandError('JSON file must contain an array')
+                started = True
+                position += 1
+                continue
+            if position < len(buffer) and buffer[position] == ']':
+                return
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if not chunk:
+                    raise CommandError(f'Broken JSON at: {buffer[:50]}')
+                break
+            yield item['name'], item['measurement_unit']
+        buffer = buffer[position:]
+        if not chunk:
+            return
+
+
+def read_csv(file):
+    for row in csv.reader(file):
+        if row == ['name', 'measurement_unit']:
+            continue
+        if len(row) >= 2:
+            yield row[0], row[1]
+
+
+def get_batches(rows, batch_size):
+    name_length = Ingredient._meta.get_field('name').max_length
+    unit_length = Ingredient._meta.get_field('measurement_unit').max_length
+    rows = (
+        (name.strip(), measurement_unit.strip())
+        for name, measurement_unit in rows
+    )
+    rows = (
+        (name, measurement_unit) for name, measurement_unit in rows
+        if 0 < len(name) <= name_length
+        and 0 < len(measurement_unit) <= unit_length
+    )
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
 
 
 class Command(BaseCommand):
-    help = 'Loading data from JSON into DB'
+    help = 'Loading ingredients from JSON or CSV into DB'
 
-    def handle(self, *args, **options):
-        print('Take json file path...')
-        path = INGREDIENTS_JSON_PATH
-        print('Importing data...')
-        with open(path, encoding='utf-8') as file:
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default=INGREDIENTS_JSON_PATH)
+        parser.add_argument('--format', choices=('json', 'csv'),
+                            help='defaults to the file extension')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--no-copy', action='store_true',
+                            help='use INSERT batches on PostgreSQL too')
+
+    def load_bulk_create(self, batches):
+        read = 0
+        for batch in batches:
+            read += len(batch)
             Ingredient.objects.bulk_create(
-                objs=[Ingredient(**x) for x in json.load(file)])
-        print('DONE!')
\ No newline at end of file
+                [Ingredient(name=name, measurement_unit=measurement_unit)
+                 for name, measurement_unit in batch],
+                ignore_conflicts=True
+            )
+        return read
+
+    def load_copy(self, batches):
+        read = 0
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'CREATE TEMPORARY TABLE ingredient_import '
+                '(name varchar(200), measurement_unit varchar(20)) '
+                'ON COMMIT DROP')
+            for batch in batches:
+                read += len(batch)
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(batch)
+                buffer.seek(0)
+                cursor.copy_expert(
+                    'COPY ingredient_import FROM STDIN WITH (FORMAT csv)',
+                    buffer)
+            cursor.execute(
+                f'INSERT INTO {Ingredient._meta.db_table} '
+                f'(name, measurement_unit) '
+                f'SELECT DISTINCT name, measurement_unit '
+                f'FROM ingredient_import '
+                f'ON CONFLICT (name, measurement_unit) DO NOTHING')
+        return read
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or os.path.splitext(
+            path)[1].lstrip('.').lower()
+        readers = {'json': read_json, 'csv': read_csv}
+        if file_format not in readers:
+            raise CommandError(f'Unknown file format: {file_format}')
+        load = self.load_bulk_create
+        if connection.vendor == 'postgresql' and not options['no_copy']:
+            load = self.load_copy
+        print(f'Importing {path}...')
+        started = time.perf_counter()
+        before = Ingredient.objects.count()
+        with open(path, encoding='utf-8', newline='') as file:
+            with transaction.atomic():
+                read = load(get_batches(
+                    readers[file_format](file), options['batch_size']))
+        created = Ingredient.objects.count() - before
+        elapsed = time.perf_counter() - started
+        bump_version('ingredients')
+        ingredient_catalog.invalidate()
+        print(f'read: {read}, created: {created}, '
+              f'skipped: {read - created}')
+        print(f'DONE! {elapsed:.2f} s, {read / elapsed:.0f} rows/s')
@@ -0,0 +1,25 @@
+from core.images import make_variants
+from core.models import Recipe
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Generating resized image variants for recipes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all', action='store_true',
+            help='regenerate variants of already processed recipes too')
+
+    def handle(self, *args, **options):
+        recipes = Recipe.objects.exclude(image='')
+        if not options['all']:
+            recipes = recipes.filter(image_processed=False)
+        failed = 0
+        for recipe_id, name in recipes.values_list('id', 'image').iterator():
+            try:
+                make_variants(recipe_id, name, force=options['all'])
+            except (OSError, ValueError) as error:
+                failed += 1
+                print(f'{recipe_id}: {error}')
+        print(f'DONE! Failed: {failed}')
@@ -0,0 +1,38 @@
+from core.models import ShoppingListItem
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Rebuilding shopping lists from shopping carts and checking drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help='only report drift, exit with an error if there is any')
+
+    def handle(self, *args, **options):
+        expected = {
+            (user, ingredient): total_amount
+            for user, ingredient, total_amount
+            in ShoppingListItem.objects.expected().iterator()
+        }
+        actual = {
+            (user, ingredient): total_amount
+            for user, ingredient, total_amount
+            in ShoppingListItem.objects.values_list(
+                'user', 'ingredient', 'total_amount').iterator()
+        }
+        missing = expected.keys() - actual.keys()
+        extra = actual.keys() - expected.keys()
+        wrong = [key for key in expected.keys() & actual.keys()
+                 if expected[key] != actual[key]]
+        print(f'missing: {len(missing)}, extra: {len(extra)}, '
+              f'wrong amount: {len(wrong)}')
+        drift = missing or extra or wrong
+        if options['check']:
+            if drift:
+                raise CommandError('Shopping lists have drifted')
+            return
+        print('Rebuilding...')
+        ShoppingListItem.objects.rebuild()
+        print('DONE!')
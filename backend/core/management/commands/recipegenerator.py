@@ -1,81 +1,305 @@
-import base64
+import io
+import multiprocessing
 import random
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
 
-from core.models import Ingredient, IngredientRecipe, Recipe, Tag
+from core.images import save_variants
+from core.models import (
+    Favorite,
+    FeedItem,
+    Ingredient,
+    IngredientRecipe,
+    Recipe,
+    ShoppingCart,
+    Subscription,
+    Tag
+)
+from core.versions import bump_version
 from django.contrib.auth.hashers import make_password
-from django.core.management.base import BaseCommand
-from drf_base64.fields import Base64ImageField
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from PIL import Image
 from users.models import User
 
+PREFIX = 'genusername'
+PASSWORD = '12345'
+TAGS = (
+    ('Fast food', '#FF0000', 'fast_food'),
+    ('Homemade', '#00FF00', 'homemade'),
+    ('Newbee', '#0000FF', 'newbee'),
+)
+AMOUNTS = (1, 2, 3, 5, 10, 20, 50, 100, 150, 200, 250, 300, 500)
+EPOCH = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+# Filled in by the parent before forking, read by the workers.
+STATE = {}
+
+
+def zipf_cum_weights(count, exponent):
+    return list(accumulate(
+        1 / rank ** exponent for rank in range(1, count + 1)))
+
+
+def pick(rnd, population, cum_weights, mean):
+    if not population or mean <= 0:
+        return set()
+    return set(rnd.choices(population, cum_weights=cum_weights,
+                           k=int(rnd.expovariate(1 / mean))))
+
+
+def get_random(name, number):
+    # Seeded per row, so the data set does not depend on batch size or
+    # the number of processes.
+    return random.Random(f'{STATE["seed"]}:{name}:{number}')
+
+
+def create_users(chunk):
+    start, stop = chunk
+    User.objects.bulk_create(
+        (User(username=f'{PREFIX}{number}',
+              email=f'{PREFIX}{number}@mail.ru',
+              first_name=f'user{number}',
+              last_name=f'name{number}',
+              password=STATE['password'])
+         for number in range(start, stop)),
+        ignore_conflicts=True
+    )
+    return stop - start
+
+
+def create_recipes(chunk):
+    start, stop = chunk
+    recipes = []
+    tags = []
+    ingredients = []
+    for number in range(start, stop):
+        rnd = get_random('recipe', number)
+        recipes.append(Recipe(
+            author_id=rnd.choices(
+                STATE['authors'], cum_weights=STATE['author_weights'])[0],
+            name=f'Рецепт {number}',
+            image=rnd.choice(STATE['images']),
+            image_processed=True,
+            text='Рецепт, созданный через скрипт',
+            cooking_time=rnd.randint(5, 180),
+            pub_date=EPOCH + timedelta(minutes=number,
+                                       seconds=rnd.randint(0, 59)),
+        ))
+        tags.append(rnd.sample(STATE['tags'], rnd.randint(1, 2)))
+        ingredients.append([
+            STATE['ingredient_recipes'][ingredient, rnd.choice(AMOUNTS)]
+            for ingredient in set(rnd.choices(
+                STATE['ingredients'], cum_weights=STATE['ingredient_weights'],
+                k=rnd.randint(2, 12)))
+        ])
+    for recipe in recipes:
+        recipe.updated_at = recipe.pub_date
+    Recipe.objects.bulk_create(recipes)
+    if recipes[0].pk is None:
+        # No RETURNING on this backend; handle() allows a single
+        # process here, so the batch holds the newest ids.
+        ids = sorted(Recipe.objects.order_by('-id').values_list(
+            'id', flat=True)[:len(recipes)])
+        for recipe, recipe_id in zip(recipes, ids):
+            recipe.pk = recipe_id
+    Recipe.tags.through.objects.bulk_create(
+        Recipe.tags.through(recipe_id=recipe.pk, tag_id=tag)
+        for recipe, recipe_tags in zip(recipes, tags) for tag in recipe_tags
+    )
+    Recipe.ingredients.through.objects.bulk_create(
+        Recipe.ingredients.through(recipe_id=recipe.pk,
+                                   ingredientrecipe_id=ingredient_recipe)
+        for recipe, recipe_ingredients in zip(recipes, ingredients)
+        for ingredient_recipe in recipe_ingredients
+    )
+    return len(recipes)
+
+
+def create_social(chunk):
+    start, stop = chunk
+    subscriptions = []
+    favorites = []
+    carts = []
+    for number in range(start, stop):
+        user = STATE['users'][number]
+        rnd = get_random('user', number)
+        subscriptions += [
+            Subscription(user_id=user, author_id=author)
+            for author in pick(
+                rnd, STATE['authors'], STATE['author_weights'],
+                STATE['follows'])
+            if author != user
+        ]
+        favorites += [
+            Favorite(user_id=user, recipe_id=recipe)
+            for recipe in pick(
+                rnd, STATE['recipes'], STATE['recipe_weights'],
+                STATE['favorites'])
+        ]
+        carts += [
+            ShoppingCart(user_id=user, recipe_id=recipe)
+            for recipe in pick(
+                rnd, STATE['recipes'], STATE['recipe_weights'],
+                STATE['carts'])
+        ]
+    for model, objects in ((Subscription, subscriptions),
+                           (Favorite, favorites),
+                           (ShoppingCart, carts)):
+        model.objects.bulk_create(objects, ignore_conflicts=True)
+    return len(subscriptions) + len(favorites) + len(carts)
+
 
 class Command(BaseCommand):
-    help = 'Generating Users, IngerdientAmount, Tags, Recipes objects'
+    help = ('Generating a reproducible data set of users, recipes, '
+            'subscriptions, favorites and shopping carts')
 
     def add_arguments(self, parser):
-        parser.add_argument('count', type=int)
-        parser.add_argument('users', help='count of new users')
+        parser.add_argument('count', type=int, help='count of recipes')
+        parser.add_argument('users', type=int, help='count of new users')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--processes', type=int, default=1)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--zipf', type=float, default=1.1,
+                            help='popularity skew of authors and recipes')
+        parser.add_argument('--follows', type=float, default=10,
+                            help='mean subscriptions per user')
+        parser.add_argument('--favorites', type=float, default=20,
+                            help='mean favorites per user')
+        parser.add_argument('--carts', type=float, default=3,
+                            help='mean shopping cart recipes per user')
+        parser.add_argument('--images', type=int, default=10,
+                            help='count of distinct placeholder images')
+        parser.add_argument('--clear', action='store_true',
+                            help='delete previously generated data first')
 
-    def handle(self, *args, **options):
-        count = int(options['count'])
-        users = int(options['users'])
-        easy_password = '12345'
-        for i in range(users):
-            User.objects.create(
-                username=f'genusername{int(i)}',
-                password=make_password(easy_password),
-                email=f'genusername{int(i)}@mail.ru',
-                first_name=f'user{int(i)}',
-                last_name=f'name{int(i)}'
-            )
+    def run(self, label, func, total, options):
+        size = options['batch_size']
+        chunks = [(start, min(start + size, total))
+                  for start in range(0, total, size)]
+        started = time.perf_counter()
+        if options['processes'] == 1:
+            rows = sum(map(func, chunks))
+        else:
+            connections.close_all()
+            context = multiprocessing.get_context('fork')
+            with context.Pool(options['processes'],
+                              initializer=connections.close_all) as pool:
+                rows = sum(pool.imap_unordered(func, chunks))
+        elapsed = time.perf_counter() - started
+        print(f'{label}: {rows} rows, {elapsed:.1f} s, '
+              f'{rows / max(elapsed, 1e-6):.0f} rows/s')
 
-        # generating ingredient_amount objects
-        print('generating ingredient_amount objects...')
-        ingredient_objects = Ingredient.objects.all()
-        for n in range(15):
-            IngredientRecipe.objects.create(
-                ingredient=random.choice(ingredient_objects),
-                amount=random.randint(1, 500)
-            )
+    def create_images(self, rnd, count):
+        field = Recipe._meta.get_field('image')
+        names = []
+        for _ in range(count):
+            content = io.BytesIO()
+            Image.new('RGB', (640, 480), tuple(
+                rnd.randrange(256) for _ in range(3))).save(content, 'JPEG')
+            name = field.storage.save(f'{field.upload_to}generated.jpg',
+                                      ContentFile(content.getvalue()))
+            save_variants(name)
+            names.append(name)
+        return names
 
-        # generating tags
-        print('generating tags...')
-        Tag.objects.create(
-            name='Fast food',
-            color='#FF0000',
-            slug='fast_food'
-        )
-        Tag.objects.create(
-            name='Homemade',
-            color='#00FF00',
-            slug='homemade'
+    def prepare(self, options):
+        rnd = random.Random(f'{options["seed"]}:prepare')
+        for name, color, slug in TAGS:
+            Tag.objects.get_or_create(
+                slug=slug, defaults={'name': name, 'color': color})
+        ingredients = list(Ingredient.objects.order_by('id').values_list(
+            'id', flat=True))
+        if not ingredients:
+            raise CommandError('No ingredients, run importjson first')
+        IngredientRecipe.objects.bulk_create(
+            (IngredientRecipe(ingredient_id=ingredient, amount=amount)
+             for ingredient in ingredients for amount in AMOUNTS),
+            ignore_conflicts=True
         )
-        Tag.objects.create(
-            name='Newbee',
-            color='#0000FF',
-            slug='newbee'
+        rnd.shuffle(ingredients)
+        STATE.update(
+            tags=sorted(Tag.objects.values_list('id', flat=True)),
+            ingredients=ingredients,
+            ingredient_weights=zipf_cum_weights(
+                len(ingredients), options['zipf']),
+            ingredient_recipes={
+                (ingredient, amount): pk
+                for pk, ingredient, amount
+                in IngredientRecipe.objects.filter(
+                    amount__in=AMOUNTS
+                ).values_list('id', 'ingredient', 'amount').iterator()
+            },
+            images=self.create_images(rnd, options['images']),
         )
 
-        # generating recipes
-        print('generating recipes...')
-        ingredient_amount_objects = IngredientRecipe.objects.all()
-        tag_objects = Tag.objects.all()
-        user_objects = User.objects.all()
-        image_str = 'data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/4g9gSUNDX1BST0ZJTEUAAQEAAA9QYXBwbAIQAABtbnRyUkdCIFhZWiAH4gAGAAoAAwAaAA1hY3NwQVBQTAAAAABBUFBMAAAAAAAAAAAAAAAAAAAAAAAA9tYAAQAAAADTLWFwcGwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABFkZXNjAAABUAAAAGJkc2NtAAABtAAABDZjcHJ0AAAF7AAAACN3dHB0AAAGEAAAABRyWFlaAAAGJAAAABRnWFlaAAAGOAAAABRiWFlaAAAGTAAAABRyVFJDAAAGYAAACAxhYXJnAAAObAAAACB2Y2d0AAAOjAAAADBuZGluAAAOvAAAAD5jaGFkAAAO/AAAACxtbW9kAAAPKAAAAChiVFJDAAAGYAAACAxnVFJDAAAGYAAACAxhYWJnAAAObAAAACBhYWdnAAAObAAAACBkZXNjAAAAAAAAAAhEaXNwbGF5AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAbWx1YwAAAAAAAAAjAAAADGhySFIAAAAUAAABtGtvS1IAAAAMAAAByG5iTk8AAAASAAAB1GlkAAAAAAASAAAB5mh1SFUAAAAUAAAB+GNzQ1oAAAAWAAACDGRhREsAAAAcAAACIm5sTkwAAAAWAAACPmZpRkkAAAAQAAACVGl0SVQAAAAUAAACZHJvUk8AAAASAAACeGVzRVMAAAASAAACeGFyAAAAAAAUAAACinVrVUEAAAAcAAACnmhlSUwAAAAWAAACunpoVFcAAAAMAAAC0HZpVk4AAAAOAAAC3HNrU0sAAAAWAAAC6npoQ04AAAAMAAAC0HJ1UlUAAAAkAAADAGZyRlIAAAAWAAADJG1zAAAAAAASAAADOmhpSU4AAAASAAADTHRoVEgAAAAMAAADXmNhRVMAAAAYAAADamVzWEwAAAASAAACeGRlREUAAAAQAAADgmVuVVMAAAASAAADknB0QlIAAAAYAAADpHBsUEwAAAASAAADvGVsR1IAAAAiAAADznN2U0UAAAAQAAAD8HRyVFIAAAAUAAAEAHB0UFQAAAAWAAAEFGphSlAAAAAMAAAEKgBMAEMARAAgAHUAIABiAG8AagBpzuy37AAgAEwAQwBEAEYAYQByAGcAZQAtAEwAQwBEAEwAQwBEACAAVwBhAHIAbgBhAFMAegDtAG4AZQBzACAATABDAEQAQgBhAHIAZQB2AG4A/QAgAEwAQwBEAEwAQwBEAC0AZgBhAHIAdgBlAHMAawDmAHIAbQBLAGwAZQB1AHIAZQBuAC0ATABDAEQAVgDkAHIAaQAtAEwAQwBEAEwAQwBEACAAYwBvAGwAbwByAGkATABDAEQAIABjAG8AbABvAHIgDwBMAEMARAAgBkUGRAZIBkYGKQQaBD4EOwRMBD4EQAQ+BDIEOAQ5ACAATABDAEQgDwBMAEMARAAgBeYF0QXiBdUF4AXZX2mCcgAgAEwAQwBEAEwAQwBEACAATQDgAHUARgBhAHIAZQBiAG4A/QAgAEwAQwBEBCYEMgQ1BEIEPQQ+BDkAIAQWBBoALQQ0BDgEQQQ/BDsENQQ5AEwAQwBEACAAYwBvAHUAbABlAHUAcgBXAGEAcgBuAGEAIABMAEMARAkwCQIJFwlACSgAIABMAEMARABMAEMARAAgDioONQBMAEMARAAgAGUAbgAgAGMAbwBsAG8AcgBGAGEAcgBiAC0ATABDAEQAQwBvAGwAbwByACAATABDAEQATABDAEQAIABDAG8AbABvAHIAaQBkAG8ASwBvAGwAbwByACAATABDAEQDiAOzA8cDwQPJA7wDtwAgA78DuAPMA70DtwAgAEwAQwBEAEYA5AByAGcALQBMAEMARABSAGUAbgBrAGwAaQAgAEwAQwBEAEwAQwBEACAAYQAgAEMAbwByAGUAczCrMOkw/ABMAEMARAAAdGV4dAAAAABDb3B5cmlnaHQgQXBwbGUgSW5jLiwgMjAxOAAAWFlaIAAAAAAAAPMWAAEAAAABFspYWVogAAAAAAAAgo0AAD00////vFhZWiAAAAAAAABMDwAAtFQAAArjWFlaIAAAAAAAACg6AAAOeAAAyI5jdXJ2AAAAAAAABAAAAAAFAAoADwAUABkAHgAjACgALQAyADYAOwBAAEUASgBPAFQAWQBeAGMAaABtAHIAdwB8AIEAhgCLAJAAlQCaAJ8AowCoAK0AsgC3ALwAwQDGAMsA0ADVANsA4ADlAOsA8AD2APsBAQEHAQ0BEwEZAR8BJQErATIBOAE+AUUBTAFSAVkBYAFnAW4BdQF8AYMBiwGSAZoBoQGpAbEBuQHBAckB0QHZAeEB6QHyAfoCAwIMAhQCHQImAi8COAJBAksCVAJdAmcCcQJ6AoQCjgKYAqICrAK2AsECywLVAuAC6wL1AwADCwMWAyEDLQM4A0MDTwNaA2YDcgN+A4oDlgOiA64DugPHA9MD4APsA/kEBgQTBCAELQQ7BEgEVQRjBHEEfgSMBJoEqAS2BMQE0wThBPAE/gUNBRwFKwU6BUkFWAVnBXcFhgWWBaYFtQXFBdUF5QX2BgYGFgYnBjcGSAZZBmoGewaMBp0GrwbABtEG4wb1BwcHGQcrBz0HTwdhB3QHhgeZB6wHvwfSB+UH+AgLCB8IMghGCFoIbgiCCJYIqgi+CNII5wj7CRAJJQk6CU8JZAl5CY8JpAm6Cc8J5Qn7ChEKJwo9ClQKagqBCpgKrgrFCtwK8wsLCyILOQtRC2kLgAuYC7ALyAvhC/kMEgwqDEMMXAx1DI4MpwzADNkM8w0NDSYNQA1aDXQNjg2pDcMN3g34DhMOLg5JDmQOfw6bDrYO0g7uDwkPJQ9BD14Peg+WD7MPzw/sEAkQJhBDEGEQfhCbELkQ1xD1ERMRMRFPEW0RjBGqEckR6BIHEiYSRRJkEoQSoxLDEuMTAxMjE0MTYxODE6QTxRPlFAYUJxRJFGoUixStFM4U8BUSFTQVVhV4FZsVvRXgFgMWJhZJFmwWjxayFtYW+hcdF0EXZReJF64X0hf3GBsYQBhlGIoYrxjVGPoZIBlFGWsZkRm3Gd0aBBoqGlEadxqeGsUa7BsUGzsbYxuKG7Ib2hwCHCocUhx7HKMczBz1HR4dRx1wHZkdwx3sHhYeQB5qHpQevh7pHxMfPh9pH5Qfvx/qIBUgQSBsIJggxCDwIRwhSCF1IaEhziH7IiciVSKCIq8i3SMKIzgjZiOUI8Ij8CQfJE0kfCSrJNolCSU4JWgllyXHJfcmJyZXJocmtyboJxgnSSd6J6sn3CgNKD8ocSiiKNQpBik4KWspnSnQKgIqNSpoKpsqzysCKzYraSudK9EsBSw5LG4soizXLQwtQS12Last4S4WLkwugi63Lu4vJC9aL5Evxy/+MDUwbDCkMNsxEjFKMYIxujHyMioyYzKbMtQzDTNGM38zuDPxNCs0ZTSeNNg1EzVNNYc1wjX9Njc2cjauNuk3JDdgN5w31zgUOFA4jDjIOQU5Qjl/Obw5+To2OnQ6sjrvOy07azuqO+g8JzxlPKQ84z0iPWE9oT3gPiA+YD6gPuA/IT9hP6I/4kAjQGRApkDnQSlBakGsQe5CMEJyQrVC90M6Q31DwEQDREdEikTORRJFVUWaRd5GIkZnRqtG8Ec1R3tHwEgFSEtIkUjXSR1JY0mpSfBKN0p9SsRLDEtTS5pL4kwqTHJMuk0CTUpNk03cTiVObk63TwBPSU+TT91QJ1BxULtRBlFQUZtR5lIxUnxSx1MTU19TqlP2VEJUj1TbVShVdVXCVg9WXFapVvdXRFeSV+BYL1h9WMtZGllpWbhaB1pWWqZa9VtFW5Vb5Vw1XIZc1l0nXXhdyV4aXmxevV8PX2Ffs2AFYFdgqmD8YU9homH1YklinGLwY0Njl2PrZEBklGTpZT1lkmXnZj1mkmboZz1nk2fpaD9olmjsaUNpmmnxakhqn2r3a09rp2v/bFdsr20IbWBtuW4SbmtuxG8eb3hv0XArcIZw4HE6cZVx8HJLcqZzAXNdc7h0FHRwdMx1KHWFdeF2Pnabdvh3VnezeBF4bnjMeSp5iXnnekZ6pXsEe2N7wnwhfIF84X1BfaF+AX5ifsJ/I3+Ef+WAR4CogQqBa4HNgjCCkoL0g1eDuoQdhICE44VHhauGDoZyhteHO4efiASIaYjOiTOJmYn+imSKyoswi5aL/IxjjMqNMY2Yjf+OZo7OjzaPnpAGkG6Q1pE/kaiSEZJ6kuOTTZO2lCCUipT0lV+VyZY0lp+XCpd1l+CYTJi4mSSZkJn8mmia1ZtCm6+cHJyJnPedZJ3SnkCerp8dn4uf+qBpoNihR6G2oiailqMGo3aj5qRWpMelOKWpphqmi6b9p26n4KhSqMSpN6mpqhyqj6sCq3Wr6axcrNCtRK24ri2uoa8Wr4uwALB1sOqxYLHWskuywrM4s660JbSctRO1irYBtnm28Ldot+C4WbjRuUq5wro7urW7LrunvCG8m70VvY++Cr6Evv+/er/1wHDA7MFnwePCX8Lbw1jD1MRRxM7FS8XIxkbGw8dBx7/IPci8yTrJuco4yrfLNsu2zDXMtc01zbXONs62zzfPuNA50LrRPNG+0j/SwdNE08bUSdTL1U7V0dZV1tjXXNfg2GTY6Nls2fHadtr724DcBdyK3RDdlt4c3qLfKd+v4DbgveFE4cziU+Lb42Pj6+Rz5PzlhOYN5pbnH+ep6DLovOlG6dDqW+rl63Dr++yG7RHtnO4o7rTvQO/M8Fjw5fFy8f/yjPMZ86f0NPTC9VD13vZt9vv3ivgZ+Kj5OPnH+lf65/t3/Af8mP0p/br+S/7c/23//3BhcmEAAAAAAAMAAAACZmYAAPKnAAANWQAAE9AAAApbdmNndAAAAAAAAAABAAEAAAAAAAAAAQAAAAEAAAAAAAAAAQAAAAEAAAAAAAAAAQAAbmRpbgAAAAAAAAA2AACuAAAAUgAAAEPAAACwwAAAJsAAAA2AAABQAAAAVEAAAjMzAAIzMwACMzMAAAAAAAAAAHNmMzIAAAAAAAEMcgAABfj///MdAAAHugAA/XL///ud///9pAAAA9kAAMBxbW1vZAAAAAAAAAYQAACgNAAAAADSFniAAAAAAAAAAAAAAAAAAAAAAP/bAIQABQUFBQUFBQYGBQgIBwgICwoJCQoLEQwNDA0MERoQExAQExAaFxsWFRYbFykgHBwgKS8nJScvOTMzOUdER11dfQEFBQUFBQUFBgYFCAgHCAgLCgkJCgsRDA0MDQwRGhATEBATEBoXGxYVFhsXKSAcHCApLyclJy85MzM5R0RHXV19/8IAEQgCgwKAAwEhAAIRAQMRAf/EAB0AAQABBQEBAQAAAAAAAAAAAAAFAwQGBwgCAQn/2gAIAQEAAAAA67AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB8hcZg48SE5k019AAAAAAAAAAFvrnWOvMGiQBLZzsPZ2xrgAAAAAAAAAp6p0hqixAABfbX3ftaoAAAAAAAAIzQehMbAAABkm+9+SYAAAAAAALTn3nKLAAAr3laGBKdG9BXYAAAAAABqXk/GwAAX09muzcrxzk2nW9UPhknWG2gAAAAAARvKOkQqffHkFxf38hJ5nm+b5RctEcxyt2pw9mN3dXSQAAAAABg/GeKiezvMKlnZWtl4qy89kE9P5HXfIaacxaeu76xfIO0GVdmZwAAAAABqHjuzDJs46byI+/ABY3FtfaS1hTh4pSeIGgLzsTbwAAAAAaI5L8AyTOukcsWVW4AKEJPVNBa8EH6h/inj9Me+tN7gAAAAGh+SvgEzsXoLO1H1UAA5mjdiYNj/nFaMzD+bKED71rvgAAAADTXHHkBcbW3RtUpRVWV8+hS9+jUGtt8VOa0fjmVw8Z8gLcPXY+5QAAAA19w5agIrBun9nb88+luuMfnKhDSVSxufPM3jf+rNcscvb/FacXHfAuu49ggAAAENwbjkznWSy9axhNY6No9KZ31Na3VOncHijch8jZDGuaM82lzgtsYl4aPhvfgGR95TIAAADi6A3BmvqJsfcreWWF6Pudj9RVVrYTJRq/QGP8w33QHOlJi3ythtJ9+A272iAAANOYN5jdd5r6qU7zIpimv5H7Ea+3zk1Ghehb+qwGgtb1ds4FBoeErYirXNgB17vEAAAo2cJwnsbdfy3hq9hH2FKevq8hg+yNoFvZynyx8XsZd3oa90B4kZrGFrrre/Pidr458BL/oBLgAADlbnr70BtRG3F0Qdzf4bWicl3OQd3IQSWjErWD5zThl1dWprmyv8A7IIiOA6F6pAAAMa/P2gbe3jWhr+6I2nLRuD7M2IfPvyKkY6rf+imqNZ83SOQfIxDY/79lLGKgK/6BZKAAA5P0CGR7r2HYfZIp0LrUnQs6ABQg5m6Y5yjrHb4gMJyL34MRrAb+6wAAAjfzxsQ95ltDOal1cfT5pzpKY+fPSyr1geKVwOTOTuoL6hbY1guZZdjlojcPmgX36HSQAAOfuUh7zrbUuRUrT+X3prDobK4K5lLTGMmvAQeExtxkOc88cJ9CZijIfHorO6kTE22H5X9B1b0CAADg/ATMdw1pYsLivDzA1x0ZlEDN+6FC+LHE4HG4GpM5jFSWl+Qdoblu4qyjdT5lv3nnwi7adBn3eAAAY1+e/y63JnkVMfUfWuo27rkPCbxy8ITFYaCxn7Xvs8zOb+/NS8W63mumqO2NG+cAqTdrY3/AL1VsMH39CMlAAGheS5vfVfxKrOjf+42teEZXic62r5xjD8QgbKYs7fPM+zCqFrwBpN0febF1TKQ+I1Myhb75ovYF6DrTfQAA411P0PUkath5vatCzvaz5E3iy+bS1Rhkxc+ZLNcoya6BDzDi7lts3orALPJaekcmyi0NRXWVg3J2UAAPzxit+zHz5e0qXmtcvlh4kLH1Z0rf1NZdkU1fgfPFSyvXJHIKb3emJOy0PtHJoqPjMBg9ign/wBDwACC/O5d7CzfIflaoULb7eWkfYwshl2fZXeD4+ffpa0JEaK4A+OiOjI7VmN6yn8sj42xhcC2nUB+iM6AA1jw+Etk81mUn9fYyNs7a6v8u3ZUHz75evnn76AxD87sKby29f65sMIg93XOq3rUexpQHcGzgAGieRwY/gqpX3Zsb1eyF74p7H2YWXu68lOJ83cmBZchcqNrbfySKwvGda55PY/fXejM3yMHXG9gAHNXMwMUxA3HuKVrU6S4tc53Pbeq/wA82PyKyCt8+x8DOSYaw/PnH843VIZDraD0/tjI4u8p6EyrLgdM9KgAOWOeAYZjDNenZH588ULGjJS28ZRV+ffnx6HmjcAjuKOcpffmxNa3FnzvvTOrPHvOg8gzYHQ/U4ADlbnoGEY5sXpivZ2VrUkL5R1x0JtstLt8p+vtG4B8fWmuDIXoOpfTmPc2bg2L8x3xoOdzoHQvVIADlbnoGETHRlKtUvJOlQr3mq+Ze0eoFPzWWHmv8+XhHwOOYJmu12HcK6l6I2Huvn6C5n2vsepj9LQk9nQOheqQAHK3PQK+3ZS6++obI95ZTJ/bbkDAe27jzZ3z4+kXjGMRK7RnQCjy1x7vDae/ObYLmfZOzKsPG6PyLOAdC9UgAOYebwyzcdKJiLeU3PuuPkzzR/P7r7KD4fbfEsSxiR+zmcZl75X6SqNX8h+Nn7G1zjnNud7O92uL6lyjMgdIdPAAOfOVBkG0IqpKyt5ufYOJYtHpPZFbi3aOQxNr9mYOxj/dzP5plF+OeNtTSK5z0Dt/PsBw7nvI9vfbLT8VmWUA6r6DAAah4vPW1Zy7qX3rcue6tgrhTxTeMJz/AG0je3WN5Zc1ZLK82kgNIZLm7E9G6U2TLROt9Sd9ZzyJoGzZ/Ng7Q28AAxDgAyTd7FMY1hvbs/TVGlFSeMxPSOoad1fyl7I3srciyu/UZfVWmfspiEnzzge3DTW8e0a1r+dWhm0LoHf+XgAKX5xWbYmz7fQepch/VnXeuZW+pQMXd9L4PmZY3wCFl4Gf9Gm+ZdI9b9X3ultHGjf00lrtE/lfjOzgXn6O1QADhvWrPtq6iwnDOteptQ4/kTGYqns3b2BZHH3l3ckbY5AIyrfDTvGWp/1AzuT1zzWw3Pu0fEPCZ5yvxnmwNldyAADmbmpcZHiiJ/SH1r+jWx2EoznRF/jOP5jaWs28wklc+inFS70xPjPUX6jQWSxWOWv58/opk+l5apm+c/nZiwOlemQABrrhYGS/ozj2rfUTjKX3xOeo3UO4PPm0rXKn8jZf5jdLKfp85O89TYLruMmN5a42tpSBy6OudwaJ5QB3TsUAAUvzxhA213J815gmJ3OdbVvquJayh973cXZZDYLiuQ8Nkl6Gg8A6a5WyG7sMn6IhOdvefQ8tmH3gMJv9DqoAAcqc+BubthTxyxye4jcYynSkS2xl5F41mNxZxk/j3ueBrvnfZ+p5aYvm3rzR9hsx9ms6/N36Og+qwAAYVwP8Gwe/fHgxHnTlT9GJPV9P5K7vefHv1bYVlkkU1S1ulLkr5C3WU+6+V7m5qZzZX03sP81Pp974zUAADh3WY9dtbUg9Wc9c6Wkx+velIKndYx0JMx9b3WtV5HyC0q1g0TryE+ZurSHR/OcRnPmpkedfmp9NmdxAAANU8Tg9wev/AIbl/TDnS4p22Ibv2FTq0fFWp8jpIA17oaLtssk/Nx01o7Dc6M5kPzqHbG1gAADhjXAGG4udId88/wBygsf2Ju/58sbyoABGcoIudyFf9Iaf1rn1RuXXPCZsfucAAAa84W8g8a+iXR3f+gKnjG4mb6QVLa9hJWrb3IeadY5WjISQy9n24dOa/wA2q7FyzlvmV67p2GAAAHIuiwKGvI/bX6faShKGOeNwZJkNPxXKVvehaWE0aa1vi7Oa/QkxA6UvtqZhYfnzizenXQAAAIvgfHQLbXr9eaGr4LHN53EPmnw+gAi47U1/81JkO7thvsdLe3F+kWRd8SgAAAGsOI/AFvgP6C7/AFv9+63obFWtK/BTi4eGx/WWr8WdD9NW/qbcz7zyip95f5ie+3NngAAAHN3MQDxnH6EfaXzHvzk7c2sBSxjUmvMWxrDcMtBI/pPsJJa24Zkehc10zpc6d6RAAAAHnj3SoBmmW55K8e617+27J2tD3aY1pLQmuPgAlOkd5wnOEWBursL0AAAAFvxbqsAoYljnhuWZ9niD15AAA9ZFl1wAbU7SuAAAAALPi3V4AssYx6kAACpkOT3wA2h2leAAAAAFtx/poAKUDBRNMAFSVnZ6sAG5ewLkAAAAAPPMnOHkAHiMjbG1oeHuvdX0lJVAAeuj+m/QAAAAADUnIcQAAAAACX6822AAAAAAEJyfpwAAAAAbj6wmwAAAAAAGp+XMMAAAABmfUe2AAAAAAAA8aS5wxAAAABl/R+7fYAAAAAAADzrDQupLcAABcbb31s/0AAAAAAAABFap1XrHHgAGQ7O2ptaVAAAAAAAAAAY7guHYzBx4kJzJsxzrIgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP/EABsBAQACAwEBAAAAAAAAAAAAAAAEBQIDBgEH/9oACAECEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANcCzAAAAAAoeZs+viy/QAAAGHmwr+eqLnoqeRz1x0wAAAFf8436/fZ97c5Ra6BEy7aQAAACr5TtAIe/kokjK76MAAAFZyPbQ5g11zlG/bs7jMAAAIXD91q2h5TU0bLPPqrUAAANHzv6BhU3HrXsr6PXB35XXTAAAA+X/RPY0awyrt27jJ9Rv8AZ3aegAAjxPJMv5X9Fzwz073mig1Ve/Od0dgAAFfB3+ap3Cd7jpla9g5TTA27bO1uQAGe1F80RMdFD1OW5py2ee/PZOnKxlSekAAPdNVu2SfItHYWdfPqd0re4XTjn0WqH3HoAApsPPN2UJcU0jVGvM3N0Ga7xh9jNAAGio2a8vau0sPIeOyXir+SwymeugvgAAhQGPtJ028FRY4cvAXML2x60AANFLl6ouq2+6dxp3KHncugpc93dAACPR4+e+0nV6pcCzK+HZQ+f1XWiJP6jeAA1UGPh7S9Z5Iw2xauBJ233KxJ9jo1XliAB5Qx/fD2s6OWg18LG4soFrzsLObr0290ABV1eXnvnvkO0nU0NtuZTHZW10fbtg3XQgA85vEPfMNHmvKxs8kffs10FfM0arfpwAY85iPcfUDK0sfTHDalcjWXVRlc9OABFptfvnnvuvy6zxjyfY0l5P4yBexNNh0wADGrgY+5e6Lv3A999NFrwuq33xsOtAACJT+eeXGr15TWkogXvEJc6DF7YAAKSN603BSy7DXX2yJbcvgsqXR3oAA18/577Ht9nvjLzHNggwIt5ysjvfQACohe+ebc5+vPU3HnsVQwus5Hf3wABqofHmdvWTvIsWXM1UULr4flFC7DkN/egAFTBbLiRjSzdex7Vc1hO6+u3c7F7TjpHdAANNDkud+USHJ8158zUburg3UTRzrtuNmdoAAqoeErfwD6DGrK7DTpu7/Orn50lPs7nib7oAAPKDX5dfL4mn6bz8fbEnXlmQNm2kp5vcQLHIADVz8q05jiNtf9G1b90qQww2woeNxxFr1UwAAjUnRZfL62Pp+pzcMxp83wc5Wni72+n+gAI9dcxvlGmHbfQfdu3Xhv1+5wZujZxHWTsbDMADzXtqvl+rR23XV6bpzz80SNOj2dX2/B879LugABB+TRs/rsrn7TXu1+afJjmbHhep6v5Jn03egAB8sofofT8Xuv8PdudVY7HJec3J+h/Jptl9QAACojz5fyLoex1RJ2qJZHM0kON3Xz7fN+sgADVE9lVvyu2+i4Z18zZj5nSclH19x82sZf1kAARtcrPlPn+X1PVIx92atqu4qHh2vBb7H6qAAA4bifPqE7DPDaI3CRdHY8fjdfTAAAHAcdj9Hute0GPz6Fp7XlYfYduAAA4PjPO56JjnsPPeCro/0Lg9H1SzAAAcn898+jXGOevYxw28hz2n6txnn0QAAAjfJrro7UBD5+uz+gaJ2YAAA0Qa621bTTVw7XfjKlaJewAAAR4cOwPKmJcXPqm3T3uYAAA040/uGNd1UsNOiaAAAAQKfzdfbAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAH/xAAbAQEAAgMBAQAAAAAAAAAAAAAABAYCAwUBB//aAAgBAxAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADKTEAAAAAA6XXh8OdB8AAAAZMSV050DlT59tr9NAAAAlWrVn4i86B5nOts/H5zEAAABM7PAA24XXo7fK3UQAAATO3XtuoZbp9wb8dXzbWAAAEiw1zLEHc7srduwpPDAAADZaax7JjeMselYNvRkY1ynAAAAuFW82Z6fN+Hl7gdjfnC+beAAAww9yzuVXx9wzwM7RJ6ee1R+EAAGrVJx177dWM90XLEWbpTs93tZp4ADf0WPkeHjHs3O14smJbujvyz28SiAAPcvNG/ZK8iTfYe7TJx14LJYs8fJUf5l4AAI/vmMj3o7YErDLOLi61r3N/nnz7nAADGPu05+9TKK2+46/Uq19PHHeqlYAADXgwz7GjWCTozsNhZZuPRQAAxj++O9Fw8yxM8HUueWe3Xo+ZgADGM89d+O1btB1Z/H9t/S38ybl8yigAMY/nnvnvd044e4zu30OZqr9w78+sz5FA5AACNh749dPbodPrdHCv8+dzrFYe1Vev7TK6ABp0+gnT8LD0MoPBjPfOjfZPDlKzUwAIjz3z0ytXb2aORy/G/Q3fS/OH1MODSwAeRfPfPXnuN7kcjneDZravsfI4few5NCAAw0eHjXPtHG8e+MsXsH6LntwlwPnIADzTrYacO7vAG/l3zr5croavmgAAaIGPnf37PMW3XiT+HeexNrXb0/MQAA5ugsG4244e560zl3Sw4VeyYfLwABhyXvvU6msAzzslo59Uu8X5f4AAc+Nl55KtUHPD14E7r3Sv1e+RvlwABhy2LKfY4T3LHHPqT6zO39/dU79G+XgAEGKy6O12Ymesn9nLGr9LXYpNQv8AF+ZgANfK9dKRjn0dB725+uv9HkS5lhUv6DB+dAAIMbHf3bZ7TOj0ZOG/byuRj1IWPf7Gqj/SKvVQAHJwda/ypFGs7zGJyoJ0dWHc7cKhdbl4AAYcjfOsVp86FJmxo0bSz8xnys+ZeeTS8AADTzOvld5+6T861Z4Dd7on4xJF44NU1gAGqF0tv0D2fzqVtw07M9GzzCfFzxvlP48qHgAB5hsm3nbMqVdm6de7Xiyx3S9UPo8a19ilc4AASb7MfNdfX5/vnrJgtHMt1brP0fVwqsAAF67dJ4Vq1cX3zzzdq8W92YtE+jQOfSgAAl7oXn0ji1n3PD3PUWjs71LusGHRQAB7s8wnfRObSTZh5687lty106782JRAABl7j537o+d4+HnvjpXXfoqVthwaOAAAtNrlfOIg8Em9ydVUsevk04AABbrPLoHJ98Bl9AnR6lYPa3XAAAFstEyl19754e+XzqR6RbPKJDAAAWC6S/nvNPfGWeq3WWJ83sntPAAAN30TnVyIAk93sw6O1eAAADLPpwvfDZ0JMDVnGjeYeAAADLLpRB0ZPO5njqaoXjwAAAe+9bHLKbwI4bdsUAAAAl9JhyMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAH/xAA6EAABBAEDAgQFAwMEAQMFAAACAQMEBQYABxEQEhMUICEIFTAxQCIyUBczQRYjNDVCJEOQJSY2RWD/2gAIAQEAAQgA/wDhSUkFFVZmTY7X8rLlbqYDF5Q3t78DaXgP69Ydr+vWHa/r1h2v69Ydpne/A3V4OLupgMrhAh5NjthwsRCQkRU//gJMuLCaJ6Vcbv4NU9wpafEG8vI1NlvDnlhyiTr68slJZv0oN9eVqisKt3hzyv4Rav4g3k4G2p938Gtu0VjS4s1oXov8y88zHaN1/Id5sPpe9qNe735daKYQJ1pZWbiuz/woNpZVjiOwKLe/LqtQCfj282H3XY1JZeZkNA6x/KW11VUcUpVnkm/jDauMY9fZfkeTO99r+RQ5fkeMu99Vje/jDitsZDU3VVeRRlVn8hNnwq2M5Km5fvswyrkTGbe7tr6Wcu0/DCLKc/YFNZnwqP4/bxoZTHfVUXdtQywl1eIb7MPK3EyaFPhWUZuVC/jc33bo8WR2JDyTLL3K5aybX8H76YrJ8njwomMOKqLKpMVKc+jNZC2vsXERZkPbWhY4V/cliJBgUtbGeRBedEdDGfP3RYkhPuQkK8F1xvLL3FJaSarCN26PKUaiTP4q2t62jgvT7HOd5bS+R+BSqqqqqvVEUvZPBe/x4D+lbMfv6fddNxJT3CNt0No5xpvF5Ze7jeLxh48WPjUEyQW63Arp7t8tB2vmGorPgYJjkEf1RocWE34UbpuhMQrhhnQMuyTJRjxQZTlejjTbo8HJiEzyQ9UVUVFTBt5bShRiBdVNvW3kFmfXfw+aZ9S4XEU5WV5ldZhOWVY+jHWGn5xeK2yyynDcfCcjlx2JLBYJlKadw7JW/wBxYxcp+48dnDz3nRoi/q+SN6boVJeG4+KXTvHgRtvsmf8A3RtrZZe8mPtjTN+78XCsZicKDEWNFFBY6L7Iq6j2LrklBLpuQ+Tt1fqMJswZVD03ERyKb6dFRFThZUdWT5T0YpmV1h85JVdhefUuaREOL/C7j7pQ8SaOvrrCxm2sx+bO9OL/APMkdMSNDxqmX6704Wy7QYeR9tD03XstveKiqiIqrlmey35DsKpcccdMjMhQkVFmVycKbDQmZo2jzLjBqB9DAXBUCfYJg+F9FfYzaqYxNg7cbpQ8taCvsf4Pc/ddqjF+moXXXX3XHnfVi6ok19OmDkpYvVdZUomVERjPq+2qr9GT3eAfa00TpoAtNCyCAms4yifNs5dcz6LKN2Ej4AS2LBNkQqJEK9HWheBQJ1smjUC9DTrrDrbzW2G67V4LFNffwO626AUjT9HSkRGREXroDULRjpty94uNNh1djtPcKTbYNCgh9JEROuZRli5NbBqlp5V5OCHHLbD/AGh7L/HJ+PvAD+jAXAICdbcjOkGhRSJB0tSnb7OATZkBamseK33p6RIgISHandALtpijuvz91NyQxaKVVWOGbpmZ/QhymoUyI87ra2ShQ7WN6H3CbaIx8+/pmc4RiJ6IhH7+hx5tr94kJihD13OpjLytu1R3UihnhMYxrImciiOPBkta3ZVMoC6WEXx2+4ffUZSWO0pWTJi8rvWUz4LxJ6gM2jAw2r3JDKYo1Vn+buJnMXCqcnUnTZVlLkTJn0LG1YgIqalzpExzxHa1xXq6A6W285I18UddEYCooXQorB88hFYbJCTTniuuqitCoNtivWRHfJ8lSO14LSArhdgEWoXiuEbhvSmGFRHJDEaxhusu5FRSKCydiu0V5KoZwymIltGtYLT8bMcZYhshOgdLGP4LveNW8pgbZPMi+2QEQqJkOiJBFVJ59iUnZpUVFVF9MGbKrZceZD27zmLmtOLq/l5BfV+NVMu0n5Vk0/LLmVaTdVuPXVuqeSg7UXb6IsuPtHWiieYb2uxcP3f0zxPT+3GG/tSZtKwac1+U4RmdKwaxnhdF1xHtYg+knG6ktUDxR7ypdTT0dXXmj6OOC0CkTElt/lE6ce+nHAaFSNh43u4l9KIiInDlcj0gnTbAWgEAyygC/qnWkIVBSFcCnm1YuwysGWZEGW090lso+wY6bcNo0IFtU7PZVVVUlnuILSAmnDVwu5fViuTT8TuYtpCx++r8lqYlpA/JVURFVd286XKbhYEKg28vLoQfep9vscqew1ERAUEdTrqBAJGj8fIp39kaAXlQp8eBCiIiMakWVfEXh+9r8AydFGyyLZdEU3sYwWPOhQXqmwGIUdxp5ph0X2WXh6S2idZ4GGy8L4kvV1ht7t7kThERPoZPchR08qVo1UiVVqXhj2de8cqO1Yw32FfaVl95pek1rwZLiaiNtOPCDtgwxGUVB91XnCPqqKiqi+raTOlxa48hNRUVEVPxc53Ft8buFroi7v5V/j+ruV/4tdy8ot6+XAdrGI1XKGU3/rq90mdXmhz25T3KVnFrKaRpKzL66uFUBnPKZzhHWMmopPCAt07OImqj5JJl+9lHpqqL/ZQRH7KiF97qsbsYbopGe8UOCxGQ5JoYZOakK4LLitwVkKyqv+k5AjyiMuE4i89eU5VPRuNNlP3xRXDB/wAw0Y6w2/irCWHKyGM2xaSDZ6WzXKNuoKKbgNhbUmRxIhSJPSO0rzojqeyomjievZfOPndWtFP/ABXosaSieP8AJqj/ADftYvQVE+1mWlvKs7CZNPbm9rzcWos/lVZr5VWLqTQVElsgWPQ1PmDhTXMMx9z7OYDUl+x3b0PfwTwW4jcnGrjzRGyOIzkuQReBsAzap54fjZONk4QVvmb3V3Vz2XHZx7YTkdrp8JesiQLApyxNcN0RPSqic6dkiaqANNq4ujNtgE04+bi6huEXcJenOsWO5Zbmw3gVxtwEaPxGxJa50WZsczyFkl8u+nSaKlEk8QrCZAmx50a4zA8h26knF6RGPBbRVebR1sgUhUSVF9VDdTcetoNpCobmJkFRAtIn42+mYebnMY3E0JEJCQ4PnrVoDVbadLKO64DT8aJLamsA811nVr6SPP11daNTu9tTabcRUOwxaCL5yWY6ZBHaE4OQ2k6RFajStrYpLLtJfomd3mC5hR+3h0lVBRVV+SbxLqK0rrqJp10I4oiGZuEqk22ThcCyyLI8epUQkVFyykWiuH2A7kZlK2unpkmQANudbeE7FlvEsWS5FeF1u4GucnqVVFho3wbnSeyokjievYvL/KTn8al/i5fkTGLY9Y2rsqS/NkyJUjoiqioqYluS5FRqDdsSGJTIPsalRH4z5ToMOYxNa8RrrPrGpqtujFnPg4Maw0/ENt0pUTK5rctyCgbaRCYonny6qKL99EiKioq17ndwjLIMj2i826rpabhkvCmICCII9TcBvhSBxtxFUOm50EXaqJMTJyeZqXZjFfOZsoUaYxTkwM0fGt2mmpznhdL8V+WPvCIsOgBoDYB+3q834rRhptxDQvXFkvwpMeVHxDImMpx6utWvxN+MmKZcRKBn00OU2+Ou8w6PcujskFuay81IbF1mVXI66kmMxOMSFmb1dZafAm3Q8SNwBIqKnKZEYncTeMYYGPj9O2P1ZLqstKSf7jxpqNGRhFVemW1pWlBYRwvP+lt11tvcKLr9S76JEtx5XQ1QSOxJdYeibMURV624/L57UpPXsPkxQ7iXQPfh3NpHpKqwspNpYSLaxm2En0ttuOmINwdvbuzZXx8UxGuw9pRgBYOJwhuWUIW+X2VYFFRv0IiJzxdf9tYax40coqc+iqiIqqDjbiKodJM5qMSArD7chtDD1ONi6KgTMZtlVUfRl0Q617JImquc5W2EOYDToPNNutw5PlHkNXCEnDUJBqDDpdL4lqLyDaC2Yr4Zooi6HCy4qxj628JLCulR9Us1ZMbwnPVV2EipsYVhGprSPd1VfZRvwt+8hWLU11Gz6G2nHjFtqvwWaTYP2VXR1lQCDE6r/wCtmonR+UsVk3FgvzUZQ3fOSNedk686/qwMnJ0sywhSLF6nnVrI5IWBqm1FgjXU2QsZlSRVNw11CjrGZRF9VlkdRV8o/L3DdUlSI5n10SooBuBbcJzV5zDkkjc4SExEh3UZFm3nH0wWf57H4wl0snOAbBNZRB87SSyTF7YHqzwnoN0z4aAc2a3JEABx0QFdPSiXlBF50FRUnl8pvfGFFQkRU9WwmQrKqbGje/C3MvlyHMreQPWhwyyuOx52qoamhZVY0ZDmyFlH1mSCHiOxGjjGZFsdF/8AUJiD6FVBRVWYolKkEOF//i9P0fr5Dkk1RsEbAQTUhgJDagUaA1HJT9Eyzr68VWVKz6pZVUYk7hzCRUjTMovJwkDvuSroWl/zEpLOWIlGr8EcMO6fe4nIqwV9jEMiCMjdZL+IXLauNJYra7W2k/w5s6CWmIhPR5L4wK87+6ZgN3VTIpLKTAfABdJGzgxlqb2wr3K44rU+GUy9wGlv6oLTFTNxVUS6ZjCTyUGQlBL8xDRovVtnfLj2ZVEgvwcxt0osXvLHSqpKpLqHClWEhuNFx3BYld4cmxcdbYBTPh20NOREQFBHo7MIyVmJGijHQiXU6QXKRWI0cIzINB1nPHIcSExeRW45RUDBHEcxes9U7Iqau5F+TuHEFeIz+4NmfszKyq9loqHImNtkqvNPNvj3AgkuolbKmGgMVuCPGInOhY5TwOFbRERERNKiKiouYUIwXUmRtz69iDkfiM6oJ61dxAl6RUVEVJMlYzLnGI1LVFir90M2bJsZb8uVEHvkNJrP4ywLuvswAxMBMamwu2D8nV2NZYVMhY0/UOKpkjh3kZJdTOa1TSvKzm+fUiqKoSYdbpe4vR2P4O/lx5WgrasNUVDNvpXgx6ajr6OMjUZ6wFCVqO3AcdNHpiJwiImnpzLZdgeBKlf8ltptkUFvUiaSmrEWJEGOhEvWZNJC8tGhQxitrrIgFWGD1thZeJEnVpaMwbFSOwzCkg8ik3cGa5ykOZkFpYqYvuyUASLTVkRuiK6cQyNdLTy5jyeFSYFbeHy5AwiujqJymY7MYEbY9M2G1PiPxXt6oDsO4gd/TEbL5nQQXSiSmAs4siZlW4MexrzrKnVa0qkTus3hBKpDeUCEwEhbM2jAwybI7bLVqzmMQQb9z0qISKKzWVizJLOq6T5qGw6vq2DuPNUFlVn+BvjarOzNYiV0JyynRYbUGNW49BaiM+HLn/3WY7UcUFtVQUVVOwb5UGPLS5P/ACWWGmB7W9PSWY6cuKkub92Y7UcEFroRIKcq7LelkrMOJDaiiqDKmNxkRNJWlKFw5mEyXKrKI7LmQZhHqlKNEsLexszI5Z2MkiXiG+b7KGYgKKSiUcF5763FJkokciw8AmucLJiYTTR+FdjQYcMe2N6inu+IvCLyiL0+ItgQlNH128tVjvWMFcFv8drYs+Pb2j0WTYzX4jYE4YiLTYtAIJLjjLiyY508rlsoTrENx73VqDINgTTrlbHgXMhUxmRyMiOvq2OtVg5mkRfrqqIiquV2S3GS3k/UGY7AkNvs1E+BOjhKgK7OL9qhZH90rwNUV8AbbFEFyXGb/d5wj/s9k5797MRhle5Oiqgoqqc9CVQjeSekqhTBFtoEQTluPKrcRqOxDQnXZF4wC9rDU2zFwnk8JV55COThIIRMGsZxIaxNvQFB8zHw6iYRO6PV1sTjy/rVUFFVQdacVUDQwWxcUi6fEPF74sp0ulBIWLc17vREUvZK+Ooorp6kTQYNAS7NKzLJD7YqhCijAdFyO2iWEYGDEg1JmqBdrWWkrz0N5aZ/wLGOvrxSyWnyWjn6RUVEVPrZPPSrx28m6916Qp8yueR6JW7kS20ELGvyqjs+Ba8EyRFTybJfvBlpr2Dq9JYY/ueYlP8AswkFDVCk/wC0yGlnIftGkSGE95r14aJ2RXn3ny7na9lOFeKqobC3L/Yg4NXMoKy4tfBgiiRvTz6pkcpLSAMOCsYlMvRvfQFa0UlWutCg2lDVyRwCLWN0jXg7gQYrbUKU2+8LLZGpEpEpFnUTskw5aVdmp1EAkqK/Jp0VyxgzLon3E735xOD2hrIo/fV+PoCUCEkacR1ptxPT7prGJ6WmO0c36+8E1YeA3HHpgXtvWKnlP6ny4EYnZ1duti87tQ4t9XzhRYouSTT28Fw/7qLWQ1RVctYLaLp27QuexyyFV5F6bKf9jRFX2RuDJc44bqx9ldxelbs54sE002y2Lbfo46EhKn6RRU++uUTSutp9xMT9x9ebMo7Sqes6oDx++lNj022kq7SyGFo72XRvmbGVW79tIiuLYPIbiAOs3ivvQoz4Y06pRHm9bcZPcV1vBqI+7wwQyZpI/S7jf/b8tOlK74tbGX17PzVmYDT8/W3+lK1i9XGT1ZG52wQHqjrg/Zo5bxg03iWFpXI1Ps9CBmvAtVsg/wBzdawPCmLbTSfpKVHD7+aU/wC1gBD41knoluSG+1W4r/jgqrpSFPv3hpDFfZH0cJtUAu//AMtQxLxOfoWMILCFJiHu1i77tVJEum2L/D9rH6RcdSwoJ9iGMhjtb4r+SySYOTIJjKHxYpJvOPOqE9A0JEBCQWlVkHkId3Y6iRVcJDK0b8WtnB0xo+6I8C+rYGUruL2kZfrfEM/+jF43rycvaGHo24x7tE7mSzFff47WqxsfdzyLY8+ErUtteB5mIqo4iw//AHQkwW/2PWie6NYTMELhjpIltRu1DYkNSBVQ0iInsjnKgXHQimKa6jI8jI+Nwi67A++vZNWL7rDYeGTrp/urPFVku/07hVguCxL1ktQVHdT4C62/k+BkbALOlE2qNhi+Pz8hngy3ubLiHbQoMbWXRlXF5TywHlYmRnEWC/z7K9kEqljU7g1qMEnjaeHuZdHSpwq6xg/1Sw9fw8v/AKMojfX+IQy+a44HryYuZEYeuG4jKymw7Ui04xG2mmvAf14D+l821yuksGE573LQfdG3Z0h3lNNsPPL+lmr/AMusqsQ2jZo7du5gi+jrDT6IjjTDTCKjeuU5VOnGu0f8oIp9vQYCaKJjEjCvKeq2gBZ18mKW6mMFJhrYNao5Pk7msf1LNCkuLp/ch5qtbg1DjjjrhuORYpPkirmoJ/peyFNVUjzECC/plxHWwNLJB8sqrouO0tOf3D1jS8THk9fw9mXzXIw+v8Qn/b4768m/5rPTCsClZQayX6yrgU0JqHCclx2/u5aNp7A5YyT5RFJ11fdmO48qoLdV9lcbhRg+yxG0/tkLqEgDf7hMUl3GrG8GmI1ZuM+hIqJI8ZOikifdXm00Lgn9iMATkhlNGSCnqUkFOSRUJEVOmd1gsWSvpkkAau9tYQCSiqKjLySGWXukSGb3BmIiIog5aHiY3bp0xUu6kiarjI4w82SokVejn7D0f7i1jf8Azy9fw9/9vkX1/iE/7fHfXk3/ADWdYbiRX0lJEtuT5ZhqPFU3nl9wgyT0de83wRRmIB/tEBBOBcjMO+5+TQf2NVti9/ZTHbs0/XuJlMjFY51sIzIyIz22tll1+LTi6OOC0BGTUhp5OR6Ghdy86ZbLuRVejK6XcjURAJCLrKta6H/fkZjXt8+DMyuzk8o1d3M1SFpdubWTIKVFf6ZtC8zUeKm7FWsa4izw1iwMz8eqnTxaohSryC27dxIZ008D1k/vj1z0w4+6oUdVPPhu6tCRI6J0fNG2HjVV5VV1jf8Azy9fw9/9vkX1/iE/7fHfXX4PLyizZfcjVwQmmozLflW+ORmgP2+Ysp+4rGIA96yrevc54xiiybISQolTgFRBaFZjFJTx+PBEBFEQdTIUKwYONM3b+Hqri11pf4jtDYo7QyI2ob6SYsZ9NGAuCQk1CFpxDTp7a4T0S7msg8+NLzNPdIku8tJvKO9IkCbOJAjZBgV40ws8MHmCxZxg6yGG5TDzDmd4sllCsap2RHeivusPbdPK5j6hqltHaewaltye1yFIVdZQvGPXPTCHOY05vVYLiumoWjR8C50uD7KqwLpjY8znF9fw9/8Ab5F9f4hmeJGMP+rGcbO3d8d9llphoGmnpcaPyrr+QRg5Rp68nO8oAx7OaqFqNSWCqKLim10XlmfdttttALbcyLOel1rsfqa/4RUQkUVyGsTbLd+XXMYfK8zSMCvXlF1ymuU6SZcWGCnIm5iw3yMOdfWc1CV1Jpdyc6RFJURION289UUK3CoUbtOY200yAg0qIqKii2dXk0hnTLiPMtOj0zyuQXo84d1cfIHmLljbF3mFaM9DzoCp1jdMtLsxu3Xpg5f+pnjpiQ5HJSCRLdk8IestmDGqyZ6YwPL8ovX8PLPMjJ3/AK/xBx+6loJPpx+jcuZS9zltCgNBGhHOtJ6qIM0U133cZx+MHu6zCiR+PCESMhAcTxAK4W50/Vpl9fCMmY8nKL2QJ+GllauNh44TprRdwRctfrngKey+zJZbeZ18U8A4tzht43hOQx4TLqyZWdByqRXMttHV/St5YuryZXlovbw3mU0W0E59tNsXBN8LqXBLhp+0fkOKZx3leFeREjJBGBhdlLIXFh4PXtcLKiVdfBRPLejPYYV+XA+mOv8Aj08Iut1AGyrJUdbSG1Nhy4zu2ak1NuWC0uFh8iSems8eRnGpidMZsAr7MCc+/SfPjV0cn37SzkWskn3dYwHDMpz1/D5H7aW/k/X3vh+ZwV930ABOEIBWVc1YLERkaNhhkyWPHjutIrSuSIn90HBcFDFVQfvh2JpBFuxnypTENhx9+3yKbcqTMaNGbit9gdHXW2QU3J8rzh6xGvZg4xWR2chymPhUCHBHNLM898gN2y+jQNhpiR3qumyLnXeQgSol/LbNUcjPpIZB1ERSVEFMes5pd7MfBLtz3OvwJB95sGorq4USN692m0SZTu6wN9XachXpeZRAhMPtMWFlXQGiObiUyLYZPlUuLpLy1SB5DpuY721MFrVXVz7qwiV1fgPw+4hS0sJckttn8LsARI26GG51t86r6ypsqa54kjpj7fZXAXr2Qh+WwVh36+fwVssMySMnXE4STbuKhdLu4h0clhVc3WxwBLVhudfSBkNw/h9wCfkklMxyORIZisuPvWl6uQTibXRuEnb4d27dNMs/KmDd8s0cmfKSU/8ApZkI8bwrjHf/AKfqu/cmmmzMnheVa2ntCAVcDaSR/wCbW00MeFca21r2040zgFW2vJBhlCP7gxiib+zEOJGREY9DthFZNQMSQxQk1ZuuNg12RyI2WiLpu5/+jXWD2MOBXPlLnZ3HDkIMnI7u2eCKibeZBLhKTOdbD7mpIftNbdRpMK1uosrruZMRybXw0+GDBickT8xmdJsGFZw5MKbvXtA/t5YjY1vSE14EOM368AgrW4ZjcZfrPsjIYeZOyhnX2E6EfTb5lFesn+kqUzDjvSX7SwdtJz8t2yZ8vOkt6wTFJObZXT0TFVWQqWug1sDLLQ7GWtcwNG+zkSWbMWtCLOnSwbYaZJ0m2ZTT4ukM+eshVbDVdBKfPjRm2WgYaaZbyR3yWQ0Etevn2PM+X+i7U+I+TiIgNAiabCS7MUgMAcTg+u7ifoo11n2SXFFWU3y6Rkd/KVVe+HDFUdgy8xnxi4JR6buV1eDFbYD1n18vMc+CpgY7RQcZo6umgOutstk44nTIKKtyeksKezzvDrHBMmsaKdBZWRMjteuthnYWEGEDDIx2GWQ+vu3V/K87uUTpgMwW50uKWsvvynSSgMayVjtfZfT4VsRFiBdZZIuJ3y+ulSBEVEV1ZQbSxj1rjSc8JyqoiKq2E9XyVtvTniG2vg7e1DhynbN3WfsqsCC+lXKSbXQpGrCwkA8TTdY+++2aurFZ8bxvRJs2GPYWbaS44gJ6J8N+UTfZEgtReVT0btiXg0ha3ROSsmoEuFXW2tCuNYNjdYTZdpivTc2qfsce8ZjpleVRqSO6wz8L2H+Zl3GYS9GYNipHFyGA946Ov/OJGV1U2t1vXh9tnWOWVweNsd8px5fVtJV/NM7pkX8D4g6jg6C4DpElPwpDUliZmV1LaVtOl1GWTAdQdu6EcZwbGKlMzNRrowJphH0bRH9Wc5XFVhpeeF4YB5GUF+jpnriazDjw4bEGKxFjiPGswi+YoJnGDzPFr34xOR2HSQnJ7xR2gFutefN5RXoQoYkOvkqd2mIseIKqIkJpynVxwGgUz+ar3pwpIgqWgJCES65rUfOMemtDmFD89qiBrBKMr3NscqT4ROES0fvY82uKAIP+ZR9anKKO8ZeOLY7aY1ZPlIa/pPjXhvgW4OH2+E5PPqrPaihbxzb3FoI392xRQVkOJdzp89XpjLzb7TbrQGvsQUGRG48EGaYA4BAebYaGD5Xd1jXq+Hyo5O/uD/A3VpkucHuQT1YbWJc5Xj1eSIiIiJkkMpVYagvPC8aspqMgrQdKelnXcpGI1LSw6KIkeOCf56WjsRqDJSViMxIdyLS6MAcTghBtof0vz2wacJmI8b7AOH0NEcbVEZbVsfedDlvyGDZ0qoiKqzJSyHPaMwr7whr7ehURUVFyOvWqvLOHrbjFoK7jMXo6yrNI2PutxGn7uXakTrjTMdk3VbrMmn0zplFor2HfRPGY3o26az3F3Sj1QoFXWgOY23zO4eQK5USYx0Oyjt2LNeSx+ZHj6op62Vaw+fxE0IuQKW+D1bVUyU2D0wL+A8y3IZdZdySocob62qz9OyMUZO4lUpdL+gKMRyok6WsVpFQzJwiIokGZPc8OLW7eT3TbKfAr4dXHGNDROVTpd5QzSTmor1nbyrFwpM0jJl9t5qDKGdDjSh1Zk6oAAworxOtuLqTYxYpIBuvI4g9jAKIqq9bKT/7A6gx/AaRV9O6kHwbmFMSnmuV1lDlN/M2PlZ2Wp8x+xmSZb9c80sZgEKRHF8GSd5jWLZhUW7tFYMTgZdbfabebye3+T1Dz4yH247Lr71TOjzFjSo2ra4iVHlykASGIkOESeHrWKu7laM/by/D1Y3UOX19U1YMstx2WmWvwd/Mf8ta1t616dhjQNwGE6kXOrLGKa1LvkMYPjrBoax40eI2jUfVrbVlHBen2eCZ7W5984mVNxdVtBDWbY21u/fTH5wEKO1ypaA9EkxxKJh1k1KrRiei1luxWR8KNDkTXPZqK00ICmpc1mGHccG1flSkaXU+O4L5nqDDI3Ecc9W5VUs+hSUGkvE/0HZspqobjuSO45kEZPaYIioiaJEISTW3Fos2kKI5nkJZVIrwmAOgYHT1bFO2bLGlRF++sQNQyCQGsqYGTi2SNqnp2Dx/zNrZXrv4W4WOJlGKWcAVRRVUX0bWWoU+fY5IPRF/j0ZPneJYc2h3uU/FPWtNOs4vlecZRmstZV7spQJjm2eMx1z6xRmtbrwhuMPR2yYmpCdb8rLh10SAybUbHpZQbmIXUzQEVVBwHuU0Pb7oOpckIjBOkZyJr/K19eMMOV6uOAyCmbToPAhhp2Orj7TnV9luSw8w7cVx1FpOgmKk5UyW01Cd8GS0eo8VWHZJ6NhHHmHum30lYmSvx9WMZJkCbHVUUVVFT7pof2pqysGqyKUl5PfjWJjzkWr1C+Q3iIn2T0IikqIm3uOJi+KVkAvw92cbTHcvmeF6AImyEx233TrMngRK+e3LiPKSNWeYYpTLxZX3xFbbUymEfMfiWy27R2NQTJsuwkOyZmqCrdu7uoq2okdqJFjx28rmpLyKceo7rT7DTrL8GJKeYeeIkESJYckyfNFx+edlVRn3FVERV0RG6qpoGyaAi0wBCKqoISCKFMhtzW0A4sGPDFfD0FiybqNp0lxlktoKMMow0LaendWtRmxg2AVid5SmeiKn+Iznix2T0yDjYkh6onljZLQuprII3k7qzYRPumh/aOnWWnwUHdYU3329i9q/JAobtxU9G02NpkWXw/F/E3fxT/UeLvSWPSiqioqA66HKhdV/nWFMPt6NgqwbPdTGkMzRsDNWXSkOS5BaN1ts2gKxc8KG8ugUgVFTb+Z4sSWwpChCqabaRvno7IYZIRcfeUeBFoFAffSoioqabrW23UP6W5kRJGMuO6qS4nNalN9j8htW2gaRUGoc7ovbpFX35bUyAVOEqpc0fTPGfCvzPSfdND9k6KqIiquDRlbrX5RZzISLhuUPenaDFP9OYuzJf/EVEJFRd0MRXEsmfBn131Z4RrLa6/C60h7kPurZkoVlkaRB7Y7fW5IhBsV1gs3y9jEFdESCnKgYmnKSK2PJeR01aBTQvrXMAbOqsIRRVViY1324dk97Qqq880p/rfDrSR1lZHQtprcYESxgHpthG33XtNmhtgY6GO7MdaiswojUKJHjN7zTxgbfXKL12vxFctyZgHkRBRET8XczEUy7GZDLRCQEQF6jAXAICta0oD3t0+F6UjG5RsrMa8eHLaRpFRsE6d7feoauycWUwKaqXjZVDCK+kqMw+j4maCggKNBoXzJxOlss0iZaYjiYMti57JoZCGYoHpIhBFUm5DDqqLfXLYaQMkt2UuuFfYPRqSIijXPIzKbJem31ar1nKsT1uI6hWsNvoyHYy0HTHaXyQeaf18RN6qv0dAHQRIyEB2zxFMRxmOy7+PvVhPye0S/g+uTHalMmy7PgOwHlA9bHWiVW6OJulrIa4622kNoSoic6WIwsoZa2pocxzVdXyrSaxDi5BQRafGYbDGKv+PRwuhKJ9waaYQF5Xq+14zDrSQYfk2uxfTMjeaZ8PUSrNh4XT67tMMoFO+lhXSJFWzZN9Gl5aaXTbZuuA2FFVhUVkeKOr7H4l7FUDs8etqlxBkMxbac9WEzT40MUwkTNWllCp6+XYTszyV7LcjsrdzpsrhPzi0W/nfkXVPBv6ubWTsqxubil3MqpfrlRWZjJNOzoD0B5QOsnv1djAnsU9lGuamrs49tUxreMrTs/GraCRaUCFe1YtHa281xuLi2KxsdjKpZeCHQTtYM6h1T4dOERVXXPGkVCRFT6ku5q4JIEg8uoQ+2eWr+QvxG4eERv9w4Mm82wHg36eXDlwXjZlVMgpLPhaxDFxig1ZzOhL2iq6qrD5pCalqCJ0UkRFJd4NxlyeeVNWdMVxubld3DqolLTwaCrhVkH8ndHBRzGm8SK604y4bTvrkxWZbRNO2NY9Xn7/AA25Ul5t83Wn0NttSRVREROE1uFlVbTR66ndwJz2smusxk34zrQV0Y4kZGz9TjrTSdzj1/TMfvfzanb9m389NfaPPzyxZAjeud4qOP3C/Y72hyqVz28eWGq+GG8eWAqd2x26MLIXpVPbafjR5QKD8GHDhEIx+m4O68ulzivYq8Yy6jy+Ckuq0GuUTW726wOBIxug6NNOPOA01tdgo4dTeJK/L3m27V1HcoqfoONtvAQObM3y4FnLBmhCYoQ6L7r0ybJajEaaXcW1luVNyDcWPldrt9IB6VIJv1uutMApuzcxqYvItX+91TBlrCcn7u4kRE47J3rpQ5SLM3stD5SHYbl5jYcosmZLmOeJJ9FXZTKewhWMLbrcGq3ApGZkboBdwiutzM8j4ZTGLLjjjzhuu091Z0E9mfWUHxCEgg1fzN+8KisIcbNt6b3J2HIFd12Z27VpGsotvzCETEgPdfbY8alHcVf0cb3HzXDmzbpofxUZTXuo1c1nxS4VK9rG2+JfbqFFU4O5G5l3uRajJm6xexk00arkMxczpn04dTIqRfs9llEzzoczpC+/+saLT2cVLaL4U/OpxifgZPu1RQiPxcj3NyK+72WlVVXlfpVNxa0cxubV4X8R2RMGEO/i734W8Iq9kW/cSM0jGOXFzZ39g/Y2Xr2o22PJZQXFoIiAiAfmy4sadGfiytydtpeGyylxPoyIzMoFB6djzzXJxSEgJRLpTbw21dBjxJQb4L/5/wBcB1/XANf1wDR74Lx+idvNkT6KMS1ye/u1X5h9QRIlRBg48+7wcmPFYiAgM/R2222l5lLGXLiRY0GMxFi/n2FfDtYUiFN3F21nYZJKUx9KXAizE4el44+1yUZxp1klFz8Jtpx4kFuJjsh3gpESuiQkRGvpbdbazszkjKfr6+HVQo8KF/AzIcSwivxJe5O1crFjds6r6bzDL4qLsnHIrnKsSKKwZ5VDbNteD+oAG4vAR6Owf45jY3Gb4V9mOxHHtZ+ntttXKyk2rO1hw4lfFYiRP4MwB0DA9xNmTbWRbYwQG2RAf1HG23U4N6krXvfTmMMryrZ41LH9hUNkGlqLIeeflVjr5VY6Sosi+wUNkX3bxqWv72sYZT3cZpK1n302000nDf1BA3CEA272ZNxY9tk4ADQA2H8Nn+1NXlouzoN1Q22OznIVp/CUtDbZFObhVeAbU1eJC1OnfxN9jtPk0E4NrnGz1zjfizKv+CwfZ65yTwplpQ47T4zBCDVfxmY7RY7k5Oyo2VYFkmIuqlh+diuBZJlzqJX4dtFjuME1Kk/x7rTT7ZtO5ZsjR26uyaXIsEynFzP5j+VjuCZTlBh8uxPZGjqFak3TTTTDYNNfyRCJiQnkm0OIZB3utZDsnllR3uwJUSVBeJiX+JFiSpzwsRMe2Tyy37HZ+N7Q4hj/AGOuiIgIiH8vaUdPdNKzZW+xWIzkMoFxsRlcLuKutMSyalVfmH1qvEsmulT5fT7EZXN7SsajYrEYKAU+ro6elaRmt/nVRFRUWxxHF7fuWdP2SwWZyrU34e4JcrBlfD/kQc+We2Pzttf0f0c3B1/RzcHX9HNwdf0c3B0zsfnbi/ri/D/kR8eZhfD3BHhZ0DZLBYfCu12I4vUdqwURERET/wCKD//EAE0QAAIBAgIGBgQJCAoBBAMAAAECAwARBCEQEjFBUWEFEyAicZEwQoGhFCMyQFJicoKxBjNDUJKTwdEkU1Rjc5SissLSgxU0kOJgdKP/2gAIAQEACT8A/wDhSNhzrpzAw23POgNflHA/KJXk96rWJxcvNID/AMrVhOkv3Sf96wfSX7pP+9YPpL90n/esJ0l+6T/vWJxcXN4D/wAb1+UcCcpVeP3stdOYGa+5J0Jo3HL/APAcTFDEBm8jhFHiWtXSZxko9TCoZP8AUbLXQCqNz4mS/uSullwqH1cPEqV0vjMRfb1kzN6PpfGYe2zq5mWullxSD1cREr10ArDe+Gkt7nrpM4OU+pikMf8AqF1rExTREZPG4dT4Fb/rqVI41F2dyFUDiSanbpLEDYmH+R7Xauq6Nh/uhrye12rpCfEuSSWlkZ/xv8z6QnwzgghopGT8LV1XSUP96NST2OtTt0biDtTEfI9jrUqSRsLq6EMpHEEfrXHxYaEetIwF/Dia6N607BicTkvsSulJpl3RX1Y18EWw+c9KTQrvivrRt4o1xXRvVHYcThs19qVj4sTCfWjYG3jwP6xxUWHgQXaSRgqisOJn34yZbJ4olY6XEzMflSHZ4DcPmmHkbwU1g3HjYVgmGHBsZNq37eOlw0yn5UZ2+I3isOIX3YyFbp4ulYqLEQOLrJGwZT+riuP6SGRiRu5Ef7xqxzyWJ6uIZRR8lUfM8K5HEjVHvqYKN6JmfM10b1kg2sdi+LNsrHwwjeqAu1PPiW5sEX3VAkcF5X6tdm4UMg5tojNRGhY8+xjnjuR1kRzik5MporgOkjkInbuSn+7b9V4tMPh4xdnc+4cSaD4Ho85GQG08y/8AEdkX8Kif9k1A/wCyaRh4gjt4eRvBTWH1ftECp408LtWJdvABawbzNw7zV0GYV3O6iP8AGukY4hvWIF2rB/CX3vOdbyAsKw0cKfRjUKNJyw+EBPixJobSST4m9C78dK3rNPw7IfHdHjISE3nhX/kKxaYjDyC6uh9x4EfqiQS4x1JgwiHvtzPBaxHcUnqcOmUcQ5DsxhwsZYA7KiVB9UAfhWCV4pUDowlXMHxNdGeUiV0LMfABq6CxP7g10HMPHDn+VdEEeMB/lXRP/wDGuhyx5QH+VdBT/utWsJHCP7yQfwrpWJOUaFvxtWMxM3gVQV0WjnjKS/41h44l4IoXsAajGwG8aQSUURqByQCo2UhjtBH46JMxfLw0i4tQ7h2dnEdxiOuw75xyjmKkEWMRQZ8I5768xxX9TFMR0w67NqQc3rEvPiZmLPI5uST2t0X8dG7DgeXpwGNC3Ki2RuFrIVMYsOhKtOvy3I4cBTlnY3ZmJJJ4kmgCOdDxSm1dY2NLbSLg1mu49nEvBiYWDJIhsQRRTD9MIuzYk/NP1JOr9JG6zzjMYfkOL1IzyOxZ3YksSTckk5knt74j7jo3K48nOkZkXzoWINj6LbQ0ztFg4HMZRTYuy5Et2dhPeoWlSxDca2gkHSKHZkZJEYMjqSGBBuCCMwRU6p0kLLBOchiOR4P+op79JOCs86nLDg7h9emJYkkk7ydpJ9B6wYeY0fop5F889IzG+hYejGkEBpesHg4vVgxBZnbYqjea6X+N33i7tWeJ76kqbDbQMmokEbCKOZI8zUp1vDKhYjQO8vaYhgQQRuI2EGp7dJIAsE7HLEAbj9f9QShul5027RhkO886cs7klmY3JJNySTvPoZAiiVRc8zbR6kySDwYW/h2FuRWr5UAQSNmhgPHstajcdhLgAQz8t6mlD90o6NkGU1GIpYn1ZItbWsDmDS3aNC6+waflqPMaGuSozodxgM+YGnYcx2nKuhBVlNiCDcEEbxUoXpeBNuwYlBvHP58VfpHEAphIee92+qKnabETOXkdjmSfQ2ebcg/jT34AbBRuXw8ZJ8VvRsuKhZPFk7w0MASctMY9lLnz0AluFHMAdhSQTkaNzQ2A0xtwpwDwpRJBOhVhxBrOM3aGTc6UAwI1ZIzkGWmDxypZhwJyKmsOEiXKdAdl8g2kd1/xpvkkFfA1sNbiR5UbACrhr91jQz7U7Q4iFw8bqcwRRVOkcOAmLh57nX6p+eSasMK7N7MclVeZps3No4gSVijGxRo6NmlX6erZPNrCsZhsMOAvI1dLYiQ/UVUoYqTxl/kBWFn/AHzVPLC3LED+NdMnksyX9610S2KTfPhvjNX7ozoMJLnWD5NfnfQcxDqHxQ2prWxUefItbQ2S7R78tByoEEbj2DYUlk9XtC1Sdw7t9CygUo+ExAvA3BhtXwNAgqSCOYqW0U0ZYId7rVureJg1/C+nba6+Io2YGojr29l6OZNHNj7hoFiQO22aG0kRJCyxnapqTWhmXZvVhkytzHzo2Fqlv0XgXIS2yaXe9KMHhmsQ8oOuw4qtYX4XOLHrJ7N5LspQqgZAaJDJOdkEQLyH2CsJDgYjsec68niFWukMTi23qXKR+xVtWEij+yo0Y6CM8GcA1Bhp5DkJkRlkHg6gV0umKXaMJiCEl8FbINWElw2Lw05DRyqVIWTMGmu0bB7c1zyo910DDwYX07QQQKVgBe9+wNhoehI60jUhXi7Ubkkk0+qqTxlmG4A1IernjKlkO40b6jsh+6badhNx4GjZbGmtkbjkK45aRmD25rdF45gHJ2Qy7no3Fvm3R8Wosav1swY65b6NjUWC/dNS4L90alhiixEZR2hQq4U7QDesNHLImadcNdQeIGVGD93Xwc/cqLDn7h/gaRIQT32iyYjkTe1dClWPy5BIGdvEsKjni8VDfhXSMang90/ECsOJ7GzTyHViB/Fq6Uml4xQ/Ex+S5msBCp+kVDN5telA8ABQvSDrkUmJt4Izt4GsnXJh4U4YoWjB5IdAu4Hdom5JtfI9oXNKB2NvYuIYI06pd3fFy1SfFajB05k3DDw0YkJOjErrestNeKZ2kS/AnTuNjSlpHICIoJZidgAFdC4qDDC2vK6ECx07N9DJvQTXx2BQdSzHOSAfxX5th45PtqG/GuisJ+5T+VdEYIQ4aMufiEux2BRlvNERGeQuI4u4iAnJVC2AAqCF3kcnDTSKGNztQk+6ujsP+7WujsN+6WsBCnBkQKwNdHQNIE14pUBQSLszA2MtYV0+zI1YjEp7Q34iukz9+P8Akax0TMNliyNU7zKjFHjd1ZkYbirV+T8rDe8akVFioD9eOsIJSD+llWK/guZrovD/AOZP/WsKkMbuNYRya9iabOGYOo+rJ2BdjsFAWJ3aWyrZvNewUbDcBRvYdpV+FwKQ4JA10Gfup9ViDYjcaFjbMcCMvdRsobM8iLUe7YrpW56s2HgL1MUxMLh0fI2I8aKyY/VSLHxBbsin5Thdy6flttrfQzB7b6s2HkDDgw2FTyIp7w4mIOBvU7Cp8Dkfm814cLaXF23zHYn3RoYhgQQRlmN4qUJjQAscp2TfyfSP6Th314xufcyHk1HI3uDkysNqkbiN/YcR4uwDo2STKNz/AMDStDiY/wA7A+TJzHEHcajVh9YAj31hGZGzZYWKSRn6Uf8A1rHQdI4bcJrpILbiw3jnXRkmFbrNYksGRwNwIokKkaR24ljfscrUMz8kVuFZJfIVsG2tttlG5oUbnee0Lgg1+YkHWwn6rbvZR7swLp9pR3holLKuwdhLRu5KEbCDn5inYbmCsV1lO1SRubfSMIJY436onWMbuLsgOVwprNuHDSMjt9BNaHFXlwl90w2p94fNiC0MZEKH15WyVakLzTSNJI53sxuSdJsb0xkhyCYra6cnqVZInAKupBUjiCNC3drdfBsWYDeODjdTbDZlbJkYbQw2gjsMYcTF+anTJlPA8Qd4pBHPsSRfzc3NeB+ross3rpsSYDcefA0TYRkspyKsTYg8xahb4RiGI+ymXYF9G8U41b7a86Um5o25ChYdhgKa+le/BOFJ+rJX57BumITwTJgeRFNeOVAw5HeDzFAWKkLrbL0V1SAbLuJ0rdsPaYDkvyh7VpFKsAQbbiL0qjw7BsWBsaFmVirrvDA27chSaGRZI3G5lNwRRAaaMCZB6kq5MvzWT4nBIJZwN80naxF4SbvA92jaicDP9c3jPg1SrJGwuroQykciKlMGKA+WBdX5OPWFQ9RNubbG/wBlv4HsRh0bcaZni2K5zYDg3Ec6NxQAswGXIULf0aNva2fphmTYUSzGmuxtp/OBRKnMx50hcDBzFgBuCmn7rgyw/aG0dk2jIKleRFjenvJgpCik7492hCBuJBHYygxJCS8pAO63oJPicahlgB3TR/NGtFhYXlbnqi4Api02JmeVzzc9qNncnJVBJJ5AVIMCj73GtJY8FFT4l3Yd95JSQfBBZaUNR1UJAOsLi58L1LdTsUm4Hhftf1zVvwkXuW2jIU4bwOkFm4Cj29lZnieyLWjxKAcUkU+4g1thkVvEbxRujqHU8iL1GHWxDKeBpdVSTZeAo52Oj83OOrnHgLVmuR8RtoXVhWaG+qdI7xS6faXMUfjYe6b8O2xWbDTJKh5oaa8WKhSVeWsLkH5m9nxj9dP/AIUXZjZ3Y2VVBJJ4ACn+DqxASEZyOT7lrCIj2GtJtc+JPYzhgOfNtDsLDiRc1O5dzrWJvYGpPcKf3U48q2mVqN7I/uY6DkM2r1m9w0DvE2WiSzH3mj3ibt28WDIP0cfeauj0CcZWJPuqLDIOGoT+JrBYdjxswqD4Mx2PfWSmBVgCCMwQdhFbJMCGb2KRoa74YmFvBc10nabnwGgXfDgTL4Lk3up+/hyF5lTsokgbNxoZA3uaOdOfGpDQtFPZyOT7ffRuD23u+DfroP8ACl+ZvrQQv8Gg+xDl7z2AcNhT+kYZt9lagAYDvzPm58TQtElxCD7z2M5n/wBI3k17TxOj8xAc+DN2DYAUe6XYjwJvX9Uf9x0W1Ga+tQyAA0cdtEs3E7uxjI4uTML+wVBNPzsEX31gIo+bsXrHMqHakdkHurM0bVgJXQ7H1bL5m1YoxsdiR528Sacz4f1jazL42piEZviJDsBPqGsWkvSTwNDiwuYhQ/g+g5TRiRPtJob8za68jTlDJdVfV1gNUXuQN1MrPERdl2EML0Lo4KMOIYWIo5qSq89XMeYpWbCiZOvVcmMd+8BU0cTahZUU3jltu3lXo7Ds0jOM6jeDUe/CQPu7u2+rBM/waf7E2XuPzJwrw4V+rP12GqvvNG5JzOiBpZXOSrQXEYnIhNsaUwVQKBTCg+1zQsAMhpXXk3t6qUxeV/lud50ZzP8A6RW7aeJ7BzP5xuAoWHVke0GvUDr5Me1jkLj1E77eS10fJJzdgtYSCPxu1dIOindHZPwqUl243Y+Jpri9CoHlbggqcRD+rjzbzrBKzj15O+1Cw0AEWqPVw8pzUbEekCjEwCVwN7kkE6DZUlAf7LZNRuKcgsLAA7agA6Qkwsk2tLsCjNR4VKZJpWLOxrjfyzoG0qAPzaP+Yo5MAR4HOsdiY2xTCMxRSFQ5bKsJLh5gLlJBbI6B3Rs50LkRl18Vzo2STuN7e2bEHI04Z5sKnWH66jVb3j5i9nxmJLuOKQ6F1Y1t1sp2IKj7xA6yVrF3pDNLy+SKk123IPkihovLJuRM6k6uM/o0/iaQKu4DQuvNvO5OZNNryt8tz2BrTNw2LWcjZu1EaysQByNbYmEqc1fI6GVVG0sQPeaxHXv9GHveZ2Vg44RuZ7u1dIyOAc0U6qjxC2oZAUu3QDtpblrWWxLewCkWEMblpNvsUVI2Ib6PyUqJI0GxVAH4dpbpIpHgdxHMUuaJNCW5o2lryRL1MnilQmaBJlMkXFQcxWFKYeRAsjyCxC/QVRoGQFhS3OEkSbxUZNWakAjwNMVdGBVhuINwRWCSJsPAVDgEdZrbWzrvN7tGwg1+jlZR7DRzK2bxGXbe74PEh0HBJvmL3TA4aOPwZ++1EB55AoJ3XrK222bu3E0TBB9EfKIpAoo2HOkaZ/q7Paam1E/q4/4mkCjQ9juG81eCH/WR/CksPx0mw3k0O7fvS7hWbn5TnaTV3kOSoMyTTEu4IVRsSgQJtaB/vbKCz4rfndE8SKxTybbJsUeAFMFF9lqWxufbS5k52qwDcTWAlYbnIIX2FrViI4hwF3ahJO31jqr5LWFjiH1VA7YGoDs078Z+MWlvzkfWx/bTI1BEHZtdZWi6wuN6VB1WHeZmij+ipraxrcK2Sxsh+8LUbTwMUtxC0dVedZqqgKCc7DsbJFV/MWrcQ6+3I9t7JjsNJH4snfX5gaa4nxsrL9nWstW1lO8A+V6wxluBr3YFkbgQawqL9p/5VNFH9lS341K8x4MbL5ClVV5VMt+Az9wrCyvzI1R5tUiwrwTvN5mlu+92zb36TYc6jMzcRko8TUtxujXJaAVQKUMd8h+SKkvIc2kc0hlfyWpuqdlKdywsDtF6bOgWYnIKCa6PEYPrS2T3VjQPqxL/ADrDtKfrv/BbVgIIzxVAD5+gIAp1bwOgk53A0rnHiYHXwZSumTUAlAJ5NkdAvQIJyXQpY76yTr1mHg+Zo5ECjmosRWxyctFjbaaWxKFD7DetjnUP3u21hBjYmb7OtZqPpzYwYKd18QptpxDwyDeprCLMN8kXdbyOVdJmKQ+pNZDWKktuI1fxFF3+0xNRqvgOxKo5b/dWH1V+nJl5CpWmPDYvsAoqiDwAqJpT9LYvtJrFB+EMWz21Asa7iakLnnQzvZajCxDbK+S1K878B3FrCxx/ZUA+kaxuDTgta2XZS8kmHOrzeE669hgJOpCPzZDq1HEcUCfhLWu2sTl7LVEqTNIUawtrC1eytpo/nEMbDmlZvqarX4plXRUmIw8LEO6DhuA31hihS4K3/G9Apx0bY51HsYVtBB8q2OgPmL9s3M+CgdvEqL+nOc5hgH33Hax8qL9C+sv7LXrCCULbOFtRjfk1xXSkuDc7sRBl5pX5Q9HSg8HX+dY7DH7Iv/GukCRvCWWpYkYnazAsT4mptbktEIOQ1mqHXbc8p1vIC1TNq/RGQ8hQvUdhxbKpCeS0LYeIa8nPlUYRFFlVRYAcB2yL86Olx5imB9AL9XMh88qQjDTsZcOfqttX2HTthxJ8nFBWRwBIjbCBURjw3VlsOG2kHIsbX4VsT8dAukLN1nLWyBo/IkuByapY2weLxADxy7FJ2spG+oNSY4ZWxBAsGZjkdI7wUOfEG+jaoK/s9s5wGaA/cc+nP57HgnwRG7fryD3C+mRh4Gnld2ICqCSSTXxmL2pETdYv5toUseVAIOdXc0qrUovyz/CoHbmRqj31tKR9gd212NqWxU6GFMKYUc71f26AdUA+gNhKhF+B2g1FfFdHOZBzTfp9aOOQfdNtHSSJLAr/ABZ3BM7HgTWDmJmiEmEVkLI6G4LUhSEyMY1O5ScgfCtrgRr4tRNpEI8s6cqykEEXBBG8EUssmHxhCxzySa7NbYDe50DuA+ZrfBJ+Gg/Jk9xHbP5nHkjwdF9Od+Jk9yjt8WbsR5tdMMD73pMuJyFNrHgKkePwNESC20kr+FK6r9Sze8kmhKT9e9Mq+ApPa1NZZ42T27dF7nhRJsdAtW3SHBvuvRu+hF8hoNtYm7VIx8STROrfu37SXR1MMv4irlI3vGeKNmug5TxSR/xo2NrsaEgwuuDiZNihRn5mgtsFhhG1t18wugbJoiPOjYK4v4HI1ZhxvU5OBhkMkcepsJ+tQJbcCLaN6Eeejgp7Z34aT3MPTnIYWY+bdvdGT5nSCmDhIOIl3clHM0yKiKFRQtwAMgADWLf2KKxbeQqRHH1u7XdYbtvkRUV+bU9hwWkJ5033VruGNgVtuIN6GrIp1JF4NSXpbXOg56VFL2VBHA1Avl29rp3TwYZioD8LwTFZgBmYt/7Og21MRGT4E2NZgG3sFdFRYGyAFwQ1uainLuxJZmNyScyTQsgOZoZAR+5xoz1okJ8QLUpFxsraCNXRwNfSNb4j7j2zkcLCfJvT/wBkl/39v+qH4nQ7QdHo1jJbOQ71SoFhgj2AbzvJ5mpR7Mz7qjJ8aYKOX8zRZz7TRUWO8gVL7FqIHxzpmj+yTWNYtw1QacYoLIq4t7hVjudg4kU/cnhNhxZexIRncjSRRo01qv2zYc6II0p8XiUJYbrjJqFkinYIOCnMVtBB8q/SIr/tC+hSI77ePIULCt0BP7J0bi4/1UdhIHgK3sNG9TXE1/VN2/7JF/v9P/ZJf9/b/qh+JoMnR8R75GRkI9RaiSCCNQqIg2AUzOajt45UNZd+pmffXebeGyNKB4VGL8axEqe2pZn+zGWrD40ryiYVhJosbKtnmeNlEQPNtr0xLEkkneTT3YCNJDzQ9WdOwU2dsx2cqf2GmvbsYuNT9G928hc1DLKfYoorAn1c28zWJkZyLlmYmpSyhbpfiNK3aCQMfstkaiITEwhXYDIumgHWWLUJH1DasGJowSzqdllF7kGoEEaYdytl+SVFwRbR/ZpNB+TM48xej6wyraXHu0HJUY+wC+j+qbt/2SL/AH+n/skv+/tsYej40Akl3tY/JSsM8cEQCoqruFYOVjxYVhZB4KBUbr4ipfcaw7u25slrCtHhCf8A3E2SDwvm1FsbPbvNJ3U9irXReGTmI1vSBRwAGjBw4iB1IaOVBIpB4hga14ngVp5ujdqFNrGGm7+FxRYDk+Yo5SRq3mL6BkRUhy2DSOzil1voL3mrCeDSH+ArFMF+gndXTh3kPEDL2mhFMEjvJEhu62o2PWj2hxq6RdJFKN4EWpR18bEwud0i/JNRlJY2KupyIIr9HiXHmAaUNYFXU71avktC3kV0f2Z9G6RW8xansoA1udPdb21eBOjdA/vFtG6I/iO3/ZIv9/pwM0xKe9e0CuDQ58XI9UVGERAAqrsAqdF5XzqN5DxPdFFYx9UUkz822e+pgtzkubGo+sOTJhiLe16QIigAKosABwArpEwRQyM08IQMJlIsFJOzsgEEZg1l0X0oySRpuVMQcv2Ho96FmiPgMx6CdI15moDIdzv3VrEsEse4ndFKLaBc1hTGh9eTuin+EP8ARzVP5mo1RAMlUWFDKsjDipF8jcVsdQw8CL6RlKOrf7S5ioe44EeJIGxhsY16syN+0ujCN8LMXVFr9zZbW0b4beZ0b4lPkaPiDVgBsA0HvzsEA5DMnRuQDzPbAyTDJ729P6mMdP207JKYaOxmk/gKiDLGNVQMkAFF7fRjB95FFY/E3PuqR5Dy7oqBBztc++lJYkAAcTuFIGxZAKIdkX820A4qcbVj+SPFqkiw+RsqLreZa9Y6Vn1Rr6rkLesXKrcQ5qZpYXOqb7V+sKkEkbgFXGYIOjfDLAfGFw60xWOeGOZeTVh7/WanCeysU59tY2VQCMgeHhWFiZ/pZipLagIUJ3QAaxkoPANRZ23s7EmhYg0pJOQArDiBNzSkjyWp5Jm4DuLWDij5gAt5ns5JiVSY+PyWo5opQ/d07dUsh4MuYNIGSaJ0YHmLVujS/irEaMaTP1HXlLDUta9tG2R40Hta+hrRyqY2PC+l7ADujex4CjYbEQbFGjewHl2/XxiJ+wnpxnhsXBL5nU7AuxIA8TUfVQAXdmy12O0mryy235CpHTkGtY18bF9L1hTAijbxqMHEsLxRnZGDvP1qlCRoLsxoth8FvOx5KucySWNzmb79LWUUCEAIX20XCtBrkliWDSZmnlx2NMZ1Oue7FfpyNWGheLCO7wxICqgvkSc86B1VAVRuAAsAKa2VMaBJANhxNYdbcMwaVlBGxgQb0LnlWCnN/qED32qAIPrOBWKAG5If4k1hVQ732t7SfQb4ZF8mFbVcH9pdMwmxJUqoTNVJyuTWOhgABPxjhaTVgmYMmVsi2jGP8GtbU5cL6PXxN/YqmsK+IxeJkEcMSC7MxromHpPpZ7Szs7N1aH+qUCsE3R7KLKcKbL+ya6rE9Du1osdDHs4LKDfVap2kbmdPrszdsZ4nFzy+R1PTi7HBSOvjGNfsC6Q3lb7ulmDyglkUXyG807u1tgialiwayE2aO+uF9pNTT4jB4aS3R0M7syyzLtl8EpwsaKSzHcBUwXDxZx4fWGseDMNCCTvhX7wGqN5PhWHSRyx19bcKVUl1AZADdVO8CvkKLLSMhRrWbeOI5GhY9QPLdUZlfFQIiqNzKSK6Uw6PvUKzV01GPCI10zMfsxKK6SxJ9i1i8Q/kKw7Sc2aujkPiSawsUf2VA7L5jbYUbg6GK3JvajmVGn+//hWJSJdWO1zt21hWlO537q+wViLNOSqQQ2UtvIG81jcJhZ2+SJlaW3iFqaDpz/8AWJR1HKN6gkgnSJA8cilHUht4PY/RRGRvF6iskQbCYDm7fnH04aPEYWdCksUihldTlY3oPN0BjHtC+/Duf0T6fVjHbFmGCjdvGQa/pxdJEZG8GFqFnw88kTeKNbTuRE0OFjiQsx8Nw5mtrnuruVRsArYHJHgc6uoxMw66QD83CubvUAhwmFiWGFF3ItPbDwN8cw9Zxu8BU6CFo9SRDt2WsKnkPwmxaNjdQRvFRhTI+u9t7Wtc0HURuyNrqVzXaRejaIHz0L35pFQnlQsiKEUchlQ7hvG3gTb+PYvrXtfdf0MtkZrkb6IVVA91YpWUNe4b1eFqUEc+xxn/AAWsYYTNJOrnVVjZQpG2umsY/LrmqeWfFSvJhMJrnWCIvy3rfowcQxrzGJpwgEjIFvqlh2BrzYnFJhYuA1cmbwXMmk1cNg4FiTnbax5k5mmsijM6YBLhMXGUdT7mXmu2gSYWvDLawlhbNHFbGcX8Bme2LviJ44l8Xa1CyRoqL4KLfMFsmJKYlP8Ayi7aT+ejDL4pob+jQvZiPXcfwGjY66p8VqPv4hvgWE5ImcjVbXC2T7TZCjdsySd5OZJ8amTD4mGUSMhuUvRzrZRPVj3nRIoY2sxGsLVH8VGpSIne5yJ0bY5yP2hRzeIFvEZGjqBbZ7zWYFtVuNRrr8ewesfgNlQK1zsHZkAQDMGrs9s2PZGQeYU3xAik1BwYnPQmrKmEWSb/ABJu+2lCz4SUTMo+hazaZA+OdSEUepfe1Jfqb4TBlvpvnI+hwqgbSakWAxysi6zg66rscW3GukYZ+iuoaLFYbrrFSc+sC79H5OPgukegXZ4G1w5xeE2uMt61sjSw8W7a3TDF8S//AIhdfmK7Q+FkP+tdLlJYzdTUiQgizGNczpW7oQ6+yowjw4GJpeJlkGu/vNC+tikv4AE6GQvc31Lgcsjv46D3Qe8eJrbanV3z1iBYEUuqmWuwHdRBSBY4kCgaM2j1ZB900c4JLj7L1ErNxIru3NrjcBTFlsb33ad4I86xGX2aXPex29k2AqLue+tgF63gHSt5oh18XilD+lQEyQc+K+2kNpcfGJl4Ih1n9woZVhIcRgmcLi1JImUMbB0vYECsX/R+oC9Rqi2te+vrfwrGJZJXhdJSEa68juNddhi5uRAw1D7GqbGsXjZFbrAChIsGFhTNI1zJDiTsnibY9KA7YNMRNzfEDrGoa8jd2KPezViGcENkSQqDabCm1kYAqRvFNY7iKY3awhmJ2n6BpQysCCDsIORpbYZ5ziML/gS5oB9nZ212BMLGf9bfMR8ZhkGKj8Ycz21uk+NiVxxUG7aM3iYSW3kDI1t0H4xh5DTHllryH5KDnS3Y2Mkh+U50yhInjZCTv1hTdycGP27V0KCOdKFFWkdRkopCjEHLSaOd6m1UW28i2jIUe4NlbPW7OyhZY5mKfZbNaKI6YKfWj+lK1lDjQglxbWLX+RGp3mse0wvsV+6PACkVWc3e281i1KRsBNBISUIP4VdJFIEsLfKRqhB6X6PDTYNt773h8GpCoGFhAUixACimvBh7xR+I2n2muJ0K4lljLq1u5luvUsgOpqBdbugg3DDnRHWjuSfaWk78MpwsxA3SXZe2PjMShxUnjNmPmKho5FKOp3hhYituGxLovNdqn2jtDKCGeXyS2lCYSSXQepzHKluzGy0bsTtrDSTPwQE1OkMW1lQ6z+HCoRHGPM8ydODldZMO8qyr8ksGsI/E1MFVb2W9kjHAXpswQ6kcjcGtkqBvPQpsSdYjlSlVU3udDnW4LmRTXQgEHjet/Y8W0Dvtm3aGWIgs3jGaYqySCj8UsBlPgouRTFpJpC7X50yh9U93fkbVKolYXVd9Qsy4gaslhkCuxjVygIWdNzRnb7RtFMGR1DKw3g5g1nLIeqj+02+msiKXduQzJqQPGzjP3EEHRFK3WMVUomtatjAEeBF63FJV9uRpbvDEuIXxiYN2tuJxKI3JdrH2ClCxxqERRuCiwHzJO5i06iblJFs8x2jm+CxI7GFIk+mjFTWFeTk7kioEiQbFRQo92jHQ4TCRC7yzMFUVhpv/AE3BTiCPFSjV+ESWu2ou5RU5hgDhC2qWzbktG8SqVwaNcKBuJ8aSIAreYXOplUqPGllGodgFECbDAgjipzB7AzckFuFA2JuzmswoAF+Wg3Y7FG01EoQg7N1tCkqxvcUtlU5A7+2LyYJ+s+42TaG77NHGvhIcx7tCfGoLo1MIplI1ZQAWFZ1vBpry4JzH9xs1rbh5A/sORpbowIYHeCLEU7FGmLjW3XysNAvo2Phj7iDQvfo7ED/Qe0ncwidRDzkl2+Q+ZredE67D/wCLHmPOgQRu7LWjefqHPKYana6cw+FYi6xElpW8EW7V0HLPNsXE4yyR+IRa6WlxJBPVxfJij5IgyFJaXEwfDJubz9+rGTGNZvsLmaJ6uxC5EbDYmxp01Z+6EZgCx4CoQiMbtzOy5JprK0nVP4NpND2GrZcNHgo4mrvIxyFZysO8ew1hRuDolI1N2ldaOVCjjiGyIrbBKVB4rtB9opj8XIr25HLRs1gD4HKp3cSsGCtmFqRx1d+6DZTcb/DQe5i8OcvrJnWfWQunmKGYJ0cqVigZVsu27G2/Ruwr/iBQz+AYjP8A8bdkEk7qW07p12I/xZMz5fNEthccPhUPAa/yl7LEMpBUjcQbgg1iVg6aij1XV8hPqeuhrFROV+VquDbxtX5SdHYVuEuJRW8iax0/Sco3YOK6ftuVqBOh8K2XWAiXEkeOxaxMuInkJLyyuXdjzLX0A6+MxcMA/wDIwWhaKGNI0H1UAUCjePBoIl9mbWoHq2F1yK/jUAd4T3Cdx21sAJ8qb5RLDx25UbyZo/iujPlXyiMhW001zYXNMRY3BFL3t7HboBzNg2lrEG9Z2G3tLliIzG5+tHWySE+Y0Gt6CpTIS5IJ3AnIZcNB24gIfB8tAsBOxXwbPRwFRq6ki6sARcG40C4jgCe1jQyXA4gn92eyl8LgR8Km4HU+SvzWK+N6NvPFxZPXTtGpXW4z1SRlztQvNGCRzG8dkXTDGbEn/wASGhkoJPsr5Uszt5m+g95yQuROYFzW0jV88qOYORraGWQDk2RrfRudEqqWOQJrbRzOlyQDcD0Qzw88b+fdreCK3Mw0eo5HsOdLakCtbNb3tX9si/3DQPzsKN/DRwGkZ4iYkfZXKjbU6OxHmyEdmK2N6StPLxVPUT5qLgiktgcXefC8gdqeKn0C9xj8YBuJ3+B7A/M9FTt5sgrauGlI8dWuF/PS3dZr2ta1hoPdmDQnxOY0HLQW1rDYeFbfTfpoXUcm2g+w0LFZLNW+zeYpbZmt4DD2G2kX/pIc+Cd7Rvw5Hk1OxL2yJyAG4UcmUEaBeSZgq8hvJ5CskiQKPZTWfFGLDr4u47CXwOEtPiuYGxPFjQsAPmyXx2GvPhPtLtT7wpSGBIIO4jaCO2t1YEEGs4XJ1G/gdJ/P9FzqPFWV69eJ0/aBFDYoB8QLaHXXAvq3F7VbUEZvxuToNmjkDqeYzoZSxq37WdbK9tbCdmhW1SMyvGm1nCjWOixU7CO0bDialVjwB7AsvXl18H71evCppdajYHI+3Svcw8fVRni8mZ0ephh/qY6NyjQn9IkWwB9RTnbxOhskRsXP4tdE0qSxIAA3k7ABSWx2JtPi/tNsT7o+cRWwWPe06gZRT/yf0C3UjyO4is1PyG4jQ9kmxDYdj/joUGhPiJiZom+0c19h0J8cEKBuKk3sa9UAVGWlka3gOJpQTBMpd7ZuzixNbUBj/ZOhs6Nz2GtrKVv41IXbj2n1cwfKpQdU5AdiMCYtIhfiosbUA0UKxxygbV1tjHlp3oKUs7sAoG8k2AqxYDWlPF2zOgBJ1B6qa2Y/mDWEYqT3ZEuympmjQXEsPVktI2wC5oh5VzVBmqnROsWGw6F5HO4CgVSZ9WFD6kSZKumK+CwD2gUjKWf+SfOYg+HxEZRuI3hhzFC5jN45LZSxnY49Atwcwd4NC6nNW3EUbS4XERzofrRsGFEGHGYWKdSOEgvaiVZc43G0GsOZo9zx97zFKQ19hBrCvIS5vIQVT2saIlxkgHWy/wDFeVerqN5MK9Sc+TAHQM9BBB9LjYkb6N7n3XrGFvBGqA/BYNYgnJizb6QSRS4Z1lQ5rasRz+Dyn3K1Yd4pFNmVwRQu6WGW8Ut52F4oz6gO8g7zpF7A5CsHPhtZmHVTrquNU2zFDQbADaanv0ThJO86nLESrv8AAaRYyG8klsooxtc1EEw+HjCLxO8seZ+dIo6Uwd3w7b3XfHUZSRGKsrAggg2IIO8egUFT7jV2iJ7r04OJ6GnMB49U/fTTGpbjagAND62O6XmMUEQOYVO+0h5CuMbaWszDfTXa5OW6/bkVBxY2rpGHwU634XoTS+C297Wro9Rzke9Y7D4ROJ1V97V+UcuKb6GHLP8AhZa6ELfXxEn8FqPBRDlET+LVHgn8YiKSCDph3L4d1Flnj3oOa6MPHKm9XUMPfWEhiW1rIgXS/WYTou64yMGyzPJk6/dFYsOR+dhbKWI8GXsYm4N0x2LQ+cSHTGXkdgqqoJJJNgABvNIp6UxlnxDb0XdH88g74F8fCu8D9MP+XoVDIwzBqa3RHSYGFxf90Sbo/gDRBBGRGfYxSw4aBCfrO25EG9jQYQxzhY4FzEOHzARaa6S4ZXQ8Rf0Eiog2sxsKZsQ/1Ml8zXSsGFfeIwZWTkzCul58U/KN2Pm1dEYuXm5VBXQ2Gi5yO0ldLGBD6sCiOsTLM/0pHLH39mYx4nCzJNC43MhuKdY8bGoXG4S/eif/AKHcew6t0rilKYSP6O4yNyFOzu7FnZsySTckneTWMfD4mPY67+RB2g10NrcZ8IfxRqixuLkI/NLEI/MvUJ6MwD3DhH1ppAdzP2IO+RfAQtuB/TH/AI/PVBVgQQc7g7iKhJ6Kne7oM/gztu+wfRdJq8BH/tMWDLB7MwUr8ksDNx6l3h/710R0lgm5BJlo43Hz7oUgMXm0lf0fBQ5YTBI10i5ni50IrOmEjRkYkBgUGRIppIG+utx7CtdJQ+01jOsPBFJqSZfGOsRJ+7ao5pD4BaSLDRgG7t3iBzJsK6Sk6SxQ2RxNrKPFtgqUYHCHLqoDZiODPR9H0hPhMSnyZYXKNXRQ6UTdPBaKYeO5qXHYduDQhveprAmeTfiMSpRF8FrFPPiZdrtu5ADYB6CEjoqB7ohy+Euu77ApQFUAADKwG4D59AksEqFJI3AKspyIINBpuh5n+Lk2mEnYj+ijDrzo9Yv0PWFKQw2g6ejYcWYUVFl1yjFVr8nfKf8Amtfk6f8AMf8A1r8nT/mP/rX5On9//wDWvydF+c/8lrB4TDc7GQ++ulZ5l+gWsnsVbD0ouTuFHq0+j6xqMKPx9EGh6Hhf4yTYZiNqJUCRQRIEjjQAKqjIAAfqDDpNhp0KSRtsINa0/RErkRTb4+CSejiBNsmGTU/Wr9E5NSMjcGFvmaFmO4C9N1S/RGbVF3t7nNvR60HRETgSzb5OKR1h0hw0CBI412AD9RYdJsPKhWSNwGVgdxBpXn6IY3be+H5NxT0kSuvMVI0R4fKWoxIvFDSMp4MLelQseAF6i6teL5VK0h4DurUSoOQ9IrwdEKbrufEcl4JWHSHDxIFjjQBVUDcAP1IiujgqysAQwIsQQdxqK6ZvNgBtHOH/AK0pVgSGB2gjaCD6WNWH1gCPfWH1D9QkVimX7QBqeJvG4qFW8GFYR6wcnlWDk8qwj1CF8WFTRL5msU5+yAKg1z9ck1GqDkAPw9KpZiQFA2knYABUVkyeHAHaec3/AFpFRFAVVUABQBYAAbh+p9TB9LWv1gFkm5SCsE8EyE/KGT81O8H9S4J55nI+SMk5sdwFamM6WtfrCLpDyjH6qwSTxG9icnQ/SRhsNa+P6OGZ1VvNEPrr+o9fAdHHMay2mlH1FrBJBELXIzdz9J2O0/q0f+n49szLEvcc8XSsEWw97JiortE3z/BFcPez4qW6xLQ/9Qx65iWVe4h4on6wjSSNwQyMAykHaCDkRUo6NxRzMe2Bj4bVrouQQjZiIwZIj95fnfRchhO3ESAxxD7zVKOksUMxHsgU+G1qjSONAAqKAqgDYABkB+s1BUjMH8CKwp6PxTfpcLkCeLJsoR9JwD+p7svtQ1hpYJlNmSRCjDxDAfNcNLPMxsqRoXY+AUGhH0ZAf67vS+xBWFPSGKX9LiswDxVNlKAoGQH4AfrjozD4pP72MNbwJ2VLisBIdmq/Wp5NWJwuPTcAxifyaug8XABtcxEp7GW49P0Hi5wdjiIhPazWFYnC4BN4LGV/JalxWPkG3Wfqk8lrozD4VP7qMLfxI2/r4XFdAYKZjtcwqG81sawuJwjf3Mx/B9avyjnTgJoVf3giumcBN9oPHUGDl5rOP+Vq6FT/ADEVdCr/AJiKuhV/zEVdCp/mIqgwcXNpx/xvXTOAh+yHkr8o534iGFU95JrC4nFt/fTH8E1a6AwULDY4hUt5tc0LD/4of//EAEsRAAIBAwAHAwgHBQUFCQEAAAECAwAEEQUQEiExQVETYXEGIjJAUoGRsRQgMDRCocEjYmNycxUkM1OSFoKistE1Q1BUZICQwvHh/9oACAECAQE/AP8A3nSTRQjakkRB1YgChpnRrSrElztMSB5oJAz34x/4NpHT1rZqyQuJZuAA9EHvNQWN/ppzcTTeZnG2f/qKu9HW+jdG3TxZMhCguT1YcKQ5RCegpr+zVyhnTNAhgCDkHgfW2kRPScDuJAoTRNuWaMnoG+pc6VsLTPa3KbXRfOP5VdeVQ3i2t89Gk4fAUbrTOliUDuVPELhUqw8noosPdESN7I3qKREjVURQqgYAAwBWnyfoBX25EWtJ3oRDbRnzsAOeg6atFXhikEDt5jnze4+taVkeLR126NssEODUFtd6RkfYzI4GSS2/86bQ+k49/wBFb/dIJrsdJxb+zuV7xtV9L0qu76RcDu2mrZ0rd7v7zJ4liKt/J27lwZmWIe5jVvoCwgILqZW6vw+FKqooVVAA5AYGq1mMyMW4hq03vjsl5G6TNXpBu7ghgQXJBByKBzmgSCCDg8jVpMLi3ik5kb/Ees6a/wCy73+T9a8mfvc4/hfqPsIrtZZ3iC7hwNRQrCGC8zmr+7e6nbf5ikhBUbbJHSs4ONWhrjZkeAnc29fEes6ZGdF3v8n615NffZf6J+Y1Jcs120OzuA49/wBWXPZSbPHZOK0dEfPlI7lrS8zxWwVTgu2yT3awcordNUcjRSJIp3qQRUbiWNHHBgCPWNJLtaPvR/Af5V5ONjSBHWJhqEMYlaUL5xGCfrAY5Vptc28R6P8ApVtZm4Qvt45DdmpY2idkbiDUR4imbZxu1aHl27UpnfGxHuPrFyhkt7hB+KNl+IrQLbOk4B7QYflnVIxSN2AyQCQKjv5i6BgCCRkAYokAZJwNYkQuyB8sOI1aTjMlnLgb1w3wrR0+D2JHUg1pFMTq3tL8qQ4YGpOApfRFaFk2Z5I/bT819ZsG7HSsH9bZ9xOzRIAyTu1fRLfbDhN4Oa0jtlYlHBid3U0g2UQHiAAdVtBItzNI+4ZOD1zUrObm3RWwMFjW3HIXizk4O0KZXtLkjnG9XeJ4tsDgMjUTtRg1GeIq0ZopklHBG3+FA5AIOR6nLcxx7uJ6U15KeCgeNLdTk7t/djNR3asQHGyevLVMOz0pIPZuT+T1KnaLs55g0zBQWPAVHIJEDD4aml/bJEoyeLdw1435xUUAjeR9rJYn4VpqHZnjl5OuD4irY7cGCc4yPdqi3qQaVdnO+oBhPE1o+cyR9mRvQAA9R6lcXJyUjPieepIkVQ8xIB4INxb/AKCpJncbIGwnsrSq7nCqSegGaiM8G51Ox38q0jATpG+YNvEu2B12vOpTtKD1ANSqXjdRxIq0V0jIYY38NSxoru49JsZ+rpufavYYfZjJPias8FZVJo1EfOIrJ2wOtKMKBWi/8SXfv2eH26LtNiuyWjCrAjJ39K/s63/e/wBVDR0AYHJOOR4VNYTOxYShieRGK+jOhJmUqg4nn7qadsbEfmJ0HE951aSTYu43/wAxMHxWrRi9rAxOcou/3US/bpj0Nnf465phCuTx5ConMkasRjPL6l5KTpW5aQfjZf0FWzqkoLHAwd9EgkkcCTUfpioYWc7Wz5o1WEwS9jU8GUr6hk+1U+2Ym2XORv3HFdtN/mv/AKjSXM+yw7RwRvFJpC4HEhvEYpNJI26SI+45qWGzlJCSBH6HgaNjIgLO4CDmMsa01bRS2ZeNyXjO1gjG7nWh37TRtqei4+BxqmvClwkSjIyAx8dTsbqcBTuzj3VdzbAESHGOJ6VbMXhQk5PDOvTtube/EwXzZcMPFeNGl4UvpL4iomwrr3btSylZlkH4WBHupSGVWHAgH1GeMxSEcjvFIQrAnhwPgaZSpKniDqP7WMNxZBhvCred4mID7iMd1aX7H6BdurFHAw0Z4bzjdWgUK6MhPtFz+eqGMyXzlhkKxJ/StIylUVB+Lie4VZ4hgkmYc8LWHlfqzGo0EaKg5a/KSAPawzc43wfBqjOY4z1X5btcTBo0YHlUzhRgc/lq0dL2tnCc5KjZPu9RuIhKmPxDhqbz0D813N+mpHKMGHvHUU6hT5pyp3g1pls6Pc89pVNaKXY0dZj+GD8d+rA3kCru1NxsFWAIyDmrmErDEkYJCngKtrfsvOb0z+WpmVAWZsAUrK6hlOQa0um3o27GOCZ+BzVuhawWT2JmQ+BAIrnqiz2KsD+IiiSd5OrQkm6eI8iG9Subcv56DfzFI2w28ZGMEdRTrsnccqeB1A5GznwPfWnGxaoueMg+Rq1ULbW69I1H5fX0g7vLHEOgIHeagi7GJEznHOryPtbW5jHFo2HxFaKgMuh9InGdl1ZfFRk60hAtZwq712H/AE/XXoqTs7xBycFfUp50gXJ3nkOtPM8jlm50HBBGvT33eH+erc5ggP8ADX5VtLkDO/pqWZWlaMcRz+o0EbypKfSUa/J9MxaUtm4CUrjxGKYYJB4jcaQZZR3irVduRo/8xGWpMgjNKcgGoX7KaJ/ZYH1G5uFgThljwFO7OxZjk9dQrJHA1tN1rTbExQA+0asfuVp/RT/lFIdu8Y8lGKlbYjdugqzUtIz9B+Z+pcXyxHZTzm/IV/aUwJJVMVbXSXKZHpDiK0MNm80yP4y/nk1fJ2d5cr0kaoBmVKt37OeFujr8CcVf2rC4nCru28j376iQkha2F4bO6rVtu3hbqgz4/bzTLChY+4VJI0rlmOSfqDVppf2ELdHx8RVl9ytP6KfKoIWjeVm5ndTqHVlPAiooxEgUap7yKDcTlui1NfTS7lwq9BxpmxVtYyTsGfKp15moQbG9CMcqwwD3GrW1W3a5kByZn2z8MVppNi/kPtKrflirNdqU9wxTZXPUVdsHljk5OiMPeKlUKQRwI1aLfbsk7mYfn9sWCgknAA3mriczPtcuQ+odelVzZyHoVqwObGzP8FPlrnvooiVXzm6VLfzSDAwo6DjXfW9mCouWPAVbaPSPDy+c/TkNWkI9uDbAyUOfdVmxe1gYnJKCvKGPE1vJ1Qj4GtHpgO9SHzHJ6Gs9pY2Mn7hQ/wC7W8gdBUjbKHryrQjZgmXo+fiPtr+bhED/ADVx8NXHVz1Gr9NqznHRc/DfWhpO10ban2QV/wBJxU08cAy58Bzqe9lmyBlV6CgNUUMlz5qLu5tyq2tI7cbt7Hi2tlDqyngRg1YbrSEHiAQfca0/Hm1if2ZPmKjIjjKgdAKnbZiarVi1nGM5Cu4+IBovsK2eBp3LtnlyFaDbz7heqqftWYKrMeQzTsXZmPEnOrefq8d9SIJEdDwYEH31oa4+j6PnRh56TFQPECizSszO2SedHdSJLLujjLd/KodG8GmbP7q0qqihVUADkNdxKYgmOZ1WX+C39R/nWk4+1sp16AN8DmiV2EA4irtvRX3mtHAvbXQ5oyv7jkGp5BuGrQrYumHVD8x9q6h1ZTwIxTqyMykbwa3/AFePhRoCpJtonHDlUMc07YjTxPKodHIuDK20enKgAoAUYA5fULKCATvNSRCQpnkdVgT2cw6TPUy7UMq4zlCMap22pW7t1aGiIaYE7pISMVIN3vpSSoJrRabFzE3Mg/bXFqk+8bn5GpYXibZceB5fU4+FGgtXDbMTd+6rOwEoEkno8h1pERFCooAHIamYKCTwFSSMwTY5mhnAzqaAtcLLtbgBu12Rw92nSQN/qGoSAXE0LcVdgPcanTNwVHPFaOYJdRjqCKktcyzLvztsN3caS32SMtkDlVq2zcwHq4Hx+3dEkGyy5FTWDrviOR0oo6nBUg94xWO7OoKBqkXtZII+TPQAAAAwBwGp121xmnXbUrSIEUCmZV9JgPGgysMg5H1IH2NIuh/7yIfFTqvyYdJXDDiHz8d9R/tLkuRwqyYLdQk8M4q4yl3Jj2vnUnpt40rbM9t/VX1K7lEceyPSbVnUn3u28W+WqUuEJQb6jbbRWxxoyxjcZEp224n7NgTg4xRzk5znv41aAiEZ6nH1J/2V3Zz8trYPv1aZXZ0hN3hT+VWsaoqs2/aAJqAZnhH74rSIxceKiiCDvouO3jx+Fh6ldvtzv0G6s62ys9q3Lbx8akcRqWbgKRg6hlOQacHYcDjg41WW3tP7OKKg8VB8anZkicrxAq0LtPnaJ3HOdd8ubZyOKkN8DUT9pFG/tKDWl4g2kUzwMQPwJFAYjJ6kYqFtm4tu+VB+daWZUkhY81I+FPchtw8KG4jx9RlcRRu/QUTkk6sarjPZkjiCDSMtxCjEZDLSqEUKowBy1FUbig99BQu4Ae7UQCCCMg8qVEjyFUDw1yJto6dQRWi5Nu1Ck5KErWlk/vMD/wAMj4GncvgYwBypHzfWijgsqfOtNrmKBujEfGl9IeOoeoXs+2/Zg+avHvP1Y4DcbafunJrRrZtgPZYjUkYj2sHic0SAMk4FLPEzhA2808yIyoTvPL6mRnHPVo/KXl5Hy41pYf4DfzCpX7NC3PlVqT9Ktz/FX51pr7qn9QfI1wf30OIrkPt5pOyjZufLxrjvPE1nWEZt4jJ8BmrOHs4tojzmqxGw12nsymmIVSTwFIyuoYGrzOwnTNQIzSIQNwOSaNrmbbL5Gc41SzRwqXkcKOpq70yWBS2Uj988fdVhK/02BmckscEk5JzqiPZ6UG/c8dacZkt4XXiJMfEVAxkhkL7+NW/3iD+ovzrTAzZ+Dij/AInvpQSygdfUL2YM4jB3LxPfRrFRxNIwUDJqO2iiAwgJ6nUzBcZ51Dlb6/XqwaiMgg8CKij7JSueedXu1XmlIrfKR4eTu4Cp55bhy8j5P5Co43lcIikseAFNbS2VxbbePSVgRw3HVekxS2s4/C2DWnAGsAwO4OpqzYlJF6frVt94t/6i/OtKjNlJ3FT+dEjtKhGZoh++v288nZRM3Pl41xJ6mgvWiRVtD2UYz6R40AQWJbIPDVKcv4U42b9G/wAyHf4jWkqOSAd9O6xqzuwCjiTV7pV5sxwnYj68GP8A0FEYqC3muHCxJnv5CrOyjs0wN7n0mrTIOxA3RjSnaVT1ANX67Vsx9khqun7XQhOclCoPuaoZhF2m7iKtfvVv/UT51pL7jceA+dbIznnVkm3d26/vg/Df9vfSbcixg4C8fE1uFEmrOISSBj6KfOtK6Ug0Vb9rJvdjiNObtVzpvSV1tF7hkBO5IsgAfM1ZaYu7KWNmnkaEMC6Ek5FKwdVZWyCMg+NXsiwvYysdw2wffU2lHY4jGyOvOpLy5GcTPk1NfSzIEIAHMjiaMkzoqNISg3gE5rBzirTRLybMlwSByQcffUcccShEQKo5DVpdc2mejirZtu2gbrGvyqVduOReqkVGc6Mv16bB/OoYhLt78bK5qxG1eWo/ip86uozLbToOJQ41aGtsl7hh+6v2xOATUjlnY9STriCWlsXkOyFUu55Cr++k0ndyXMm5OESniqD9Tz1SuAAK+kdhYQzkb+yXC8skVcXs91s9q25eAxgCs5qOFZdrJ3iiuGK1DZXcwGzCcdTgCrLRsdtiSTz5fyXw+ppMZs5fFfnWjjmyt/5cfA4q4nSCMsTv/CO+o45BY3zlSFKqAeR84Ursmdk8Rg1osZ0ha/zVI+xin0VaySmQg7zkgHApEWNVRFwoGAPtpm2YpT+6dSWksiqwG49+Kit44RuALdTXlXessEVjGTtTefIRyjX/AKmgMnecDrTiAQRsrntcnbB6cq2e0Er7QGzg45nJxU6M+ibQfi2Yt3eRihoZzjamA6gDNLoaMcZmz4AUmirdeJZveBUVpbQnMcKA9cEnWsiuzAHeKnYrE5BwetKSVU9wrSX3Kb/d+Yq1vUt7GFfSfzt3LjUMU2kJg0r4Qcx8hWkQi6MnRBgKqgD3jVoVNrSER9lWP5YqU5c+oXZxbyUAWIA4k4FIoRVXoMar6+E+lNIzMMoytAngm74E08rOc4Ayqggc8VP5mUJGe6oUaSWONTvdgvxOKvcR26EcEeP4AjU7hNnPM4+rFF2TO2ePyqEEq+022Cd2/OrSX3Kb3fOtD2tubOKRogXJbJIzwNOwFwABgA4ArSX3G48B89WgF/vMz8liPzoniTQ4D7e6Xagk8M1ZR7cwbkozqvJvo9rczf5cTt8Bmrd443V3BbB3gc8gg6nbbb5VoSDt9JWiBDmNy7k9F4VfoWsrnHJQfgc08zfR43HFgv5jNR/tI0Ljfx1SSLGuT7hUErShiy4xz1SozoVU4JpEEahRq0j9ym93zrROP7PtsdD8c0WzIW/ezV8hktLhRxKH8tWh7doLOSVhgykYHcKJCgknAHE8qXSNpcGNILuIybQ80NvIoswdAFyDnJ6fbEBgQeBGKhhSFSFHHnz1abONFXx/h1uweuRjpUrYXxoFAjeadvaXBzuAryUtCIbm8cedIwRPAbzV3FmyuU6xP8qsCJbG32hnzcY8N1PI4ukUHAGBjVLCJdnzsYpQqYRdRIUEngBUM/a7fm4xXEA1cJ2kEydUNaEnDWcsfOMk+40c43UZUTZDuBngScCv7IszJ2nnYznZzgVLjYQAYHIV5S379vFZRsQoAZwPxE8Aa3o2PRYH4EVoK/N/YqXP7WM7D9TjgfePUdJxGfR95GvExNjxGqVstjpVrbSXdxDBEPPdgBVnbR2scNvGMJEuB39T76uHjjhleVtlApLHoK0M+1aEZ9Fz+e+sJna2d/WllDvsrvXGc9Dq2SXD8sUiOryktkMRgVdvhAo4tVmuEZup+WuylNreyJncxaM1eXItLd5cZPBR3mpprl3l7WR9pj5wbjXk9fyAmynzwzET8StOdyir+f6TpC5lzkNKceAOBSRtIWAxuUtv7q8lrgi8mh4B4c+JQ/8A99S01ZHR95MoXEbefGeWDUcck0ixohZ2O4AZNaC0P/ZqvPMQbhxgAcEFQDcTXlTpJmddHxdzSdT0WvJ2XKSIeaqfhuqfPZPsjJq1QrGSRjJzipJkIdFO8YBqMYRRquX25W6DdUS7EaL3a77MV7MRyfaHzrTk20looO5gXrs5HY+aScFsnp1pJzbz2VyrAldkkD907JHvAq/nEFjcXCnOxEWU/KlhkMRn2fMDhSe876hiaaRY0IBbmTgVoJ+z0xZfvF0PvU+pX1rb6QQxzptLyPMVZaLsrDJgiwx/G2WJ9+oYijJY7gMmp7hrq6nucsJ3n2lHdyryekaOcxyAhztLg8c8dUzFInYcQKtYchnfmd1O4jVmPACreUyoWI5kUIWNzgru2s+7j9TSybN1te0gNX8m2bYezFj8zQuHSSNm84INnGcZXmNTH6X5NNv3/Rj8Y/8A8pLh0glg3bMjKx6grq0WdnSujT/HUfHd6jK2yvjqAJOAKjj2d5OTWnbg22ib1wcEpsL4v5tIkscoVATIh5DJytaMuZGu+0d8sZFbOouoYJ11XjkskS+OKijEcarq2l2tjO/GfdTqXAG1jeDnVplMpBJ0JX41c/4nurbCq67IO2AM8xg5yKZtoIMDzRjI5781oHE2h5IuQaRP9Qz+uqNDI6IOLEAe+tGDOk9Hf109RmyT3UsbNwFIgTx66vK6TZ0fBGDvknX4KCaDSwSMQ2HGVJ/KrZyk8eDxODUEnaQQyHmgJpAzMX6VGMIorsU7XtSN+KklWMoD+I41CP8AatJniMAa9KLtWbn2SDV16SmpARxGDTEFiQuBXku391uV6S5+KirtOyurmP2ZXHwOKBIwQcEc60Ou3pfRy/xSfgpPqvlm+/RqdTI3wxQUscCs4II49a0Y/a6Ptz1UikXZUCpJAFbB3jdilGFUVJCJShJ9E/VvBtWlwP3CfhVwSCjdDU8jzM0jneTWBg+dv6V5Lf4N3/OvyrS67Ok78fxmPx1eTcfaaZgP+XFI/wCWz+vqvlj95sO6N/mNTcdwrQEm3o9B0P6Ciw2gtCFAXPtHJ+u67aOvVSKuh5o8akAG0FbI66vJZcWt03WXHwFaabs9K6SAUHbIGTy4HV5JW/n3lyRyWJf+Y+q+WK4lsH6o4+BFAE5wOAzT7Pm4zw35615MuTBIncDQU9oznhjdUTlwSetJ2nbSk7lwABTvsFepP1AwYZByOurSC7Lyr0kPzplXswQ+WOcjHDV5PxGPRkRIwXZn/StONtaVvT/Ex8BQ4CtD2f0KwgiI88jbfxb1XyugMlhBMB/hS7/BqR2QtsnipU+BqONppY4kGWdgoHjVnCtrfdinoi2UD3YFHpnjuFImwuNRjzKsmeAxjW67asucZFQxmJSCeerTEe3dThRvwG+AydQBYgAZJOAKtoRb28EI/Air8BivKXRbmX6bAhYEYlA455NWgdGi+mhleIiKAAvn8b5yPVry2jvLaa3k9GRSKvtHXWj5jHNHz81hwbwryd0a5l+mSoQibo88261nGlYu+A/Yy6QtIWKvKMjiACaM4utIK4XzWcDHdwrSOj2s32kGYm4HmK0FZ/Sb8OwykPnnx5UazvAxx51H6C+r3AUxnKg+IzqlyulrPviP66ijGYPncFx9SW4ghH7SUL3GptNRLkQxlj1O4Uj6U0kSsedjmR5oqDyehCgzyszdF3Choe1tsyx7RZeAY5AohWBDAEHiDVsqJHsqoAB4AYFKoYkURg4qL0F9XufQHjQGSAKv4imkdHP+EqU94/8A36hIUEk4A4mpL6a5dobBNtgN78h4VHoO+mYtM4TPEkkmrbQVrDhpMyt3jA+FBVQBVUADgBqIBBBp1KMVPKrc72FRjdUkYbeDvpBsqB6vNGZAMGoYSh2jxrTknYtYSey7H5VFpOzkUEy7B6MMGm0tZK2NsnvCnFNpezVSVLMemCK273S8vZouzGDvA4DvarOzisoRHGO9m5sfrTQrKOjdait3R8twx65f2CX8aKzlSpyCBmv9nP8A1f8Aw1/s4f8Azf8Aw1F5OxKwMs5cdAMVFDFAgjiQKo5D/wCOX//EAEYRAAIBAwAHAwkFBgQFBQEAAAECAwAEEQUQEiExQVETYZEGICJAUnGBobEUMDJiwSMzNEJycyRjgpIVQ1Oi0TVQgJCy8f/aAAgBAwEBPwD/AOZyI7nCIWPQAmjY3YQuYiAOpA/9mtNGzTlWcFI+Z5mpLi10eoijiy3Rf1NQXU13dwq4AQEnZHuptzMB1pdF37p2gtn2fn4GmUqxVlIIO8Hj62FduCk+4ZoxuOKH4jHmQ2VzN+CI46ncKh0Mdxml+C/+aENhZAMVAPU+kaudKO/owjYHtc6LFiSxyTxPOtGD/FA+ypNaE0aXdbuYDYGdgHiT11ac0eJomuY1/aIPSHVf/PrVkqvdwKy5BfhUs0Fqq7WEU7hhTihf2jf84fEEV2lm/wDPEe7dXY2Z39lF8qJsoN/7JPCpdKwJujBc9wwKl0lcyZCkIO7j40SSSScnrqddkitHAl5yBkiFsCtG7rC1BXBEYBGMGiMbO/iKIBBBGQRwq+tza3c0ONwb0fcd49Z0f/Gwe+tL/uYv6/0+4aPZQMaZi2M1o6zS1gT0f2jAFzQOKxuzq8obXbjjuVG9PRf3H1mw3Xlv/VWlv4eP+4PodRTEYfzV/Evvqdv5a0NAk10WcZEa7QHfrjOcr1GqaJZopInHoupBqWNoZZIm4oxU/D1i0OLq3P8AmL9a0qP8MD0catolQvLz9AnFzKvWP9RVzei3kVNjaOMnfiopBLGrjgRS0i7Wd+rT8AivRIBulUH4jd6xE2zLE3Rwa0kM2kncVOoDLAUYVwccfM2WADY3atFS9lfQ5O5sr41pGDI7YHhgEVo19qAr7LfWhxqLiacEMa8oodq2il5o+D7m9ZuRt2UvXs8/rQBJwBv1do+CNrdUOMsaPE6ncFFAPSlxsOSOgobSFHG4g5B7xSMl3aq3KRBVpmCXZJxk4Pw4aoj6Q7xUo4Gru3+1W08PtKce/lRBBIIwQeHqZcCu0bpQZ24Ln4ZoPyI1J6dmnfCPpUb9m21jkRSqWYKOJOKkjMblTqCjZLE+7zGbIUY3CtBTbdvJEeKNke41c+jPkDGcH46lPyNO21jdS8K05YC1mEyH0JmYkeyfUmfkNSRIiiSYkA8EG5j/AOBUk7uNlRsJ7K0iO5wqknoBmuymjHpJuqycPZ2/Qpjw3URgkVEwSRGPAGrpkeQFTndx1FiQAeXm6CQqsr+2ceFXYIaJ8UN4BpeNBQUJ551eUxPYWoxu2z9Pv7aJZpNljgYJr7DD+evsEB9vxxX/AA22/P8A7qGjYAwOScHgeFTaPmdi4lDE8iMV9ldGJmUqg4k8fhT3DY2Ih2adBxPeazWhZS9vJGT+Bsj3NVwMTzAcNs1u2T11qu0aYYOM+ZYDZgtdk8gT8auUZ4iFGTkbqAIAB4gChxraVSoZgCTuB56tPwmWwYgb42DfDgfvwSN4NdrJ7bf7qaSUg4lf/dXbTf8AVb/cajupwrASvkDIOc5pNJXK8SG94xSaTRt0kZ+BBqaGymYhJAj9DwNGxkQFncBBzGWNaKlgguQolJ7QbOCu7PKr9dm7mHfnx36ljyhY/DUB2aVEmcsacYY69GTdpb7H80e7x4UjAhW64p+J1TxBmhfowB92qeMTRSxng6lfEUylWZSN4JB9RYYNRkB1J4cD7juNMpVip4g6j+1iDZ9JNzd61bzvExAfcRju+NWUdvJewMp2HDZMZ4ZG/dWkmzdydwA1McQjvFQrk56VL6ThK3KvcBROSTr0TJszPH7S58KgOY8dCRROdQwy8ayQoB441aWhMF/cDG5jtj/V6iy7Q1N6cavzGFb9DqRyjBh8R1FSKFPonKneDWiR2l5C/NA2fCrw7V1OfzY1xSBM5FIw2mJNO+3uHDUAScAURg8KsW2buA/mx47qtpMXMsXVFcfA4NbtnUjYmdc8VVv0OvyjhG1bTDmCh+G8epOud440j7DZxkEYI6inXZO45U8DqByNnPeD31oIZupe6I/UVKcyynq58+EAKWNO20xNQNsTRN0cH5083ZaUst/4lKn3NrvI0t7iwYfzh4z37tr9NenIe1sJCBkxkP6kzbIokk1ndjlr0F/ETf2/1qXdJJ/UdeyQufMDkKV5HXpF9mWxnHHZDeBzSnIBHCkGZFHUitOLizWfnBKkg8cH5GoSCD8KIwSKuIxNBNH7SEeIx6i7BRRJPmZrQH76c/kH1q4/fz/3Go7oh30BkgVIdwHmWmjJJwHlOwh4dTR0Pa7P7xweuQau7RrVwNraQ8DV+c2+j/7ZqxftLO2frGufeN1WwzMlaVj7XRt8nWJvlvrRUxlsraTj6AU+8bqPpvRxyFX0fZXl0mOEjffswUZonJz52gWAuJl6x58DVx+/m/uN9aZgQoFA4INM20c6rbR89zvC7Ke01W+i4ISGfLsOZ4eFFgtXN8keQpDv8qlP26yYr+JfSx3ippjKsKkbo12RWhX29Hxj2WZfnmrciPtJSNyRk1tLPb5xlZE+RFaFytk8Y/FFLIlW0zyKyv8AjU4OrTibGkZT7YVvv2YsfP0M2L+PvVh8s1c7rif+431122jJ5wGbCIeBPE/CodF20RBYFz38PChgbhUkqxqSTjvq5vmkJWM4XrzOrR8pjnC53Nuq+QJd3CgYG2a8nnzBcR+y4PiKuCUtVXP76UKeuzTBY4SFGAqYA9wrRp2LzScP+Ysg/wBQ316AcgbmbeR1xR4V5Rpi5t36x48D99IeA+40a+xfWx6tjx3Vfrs3c3ec+NW9rLctsxp7zyFWujYLfDN6b9Tw+FFsEDVcXMUAJZt/Ic6uLp7g79yjgutWKsrDiCDWkd95KeuyfEV5PyYupY8/jj+hqezaae0bbxFEMkcyRwq5bZhfvGKtwi3dzu9Jo42J92RTIC6OTgrmic15SJ6Fo/RmHj98Tk/cRuY5I3XirAj4VPb/AGy8hKn0HjDE9BSokCKka4Ucq5A1NcQxb3cZ76n0mzZEQPvNMzOSzMSTzOuCMSFs8tV9vlQ9Yo//AM1od9jSVrk7mfYP+rdUMM6Xl07MTEwGwCavX3InxNPKsN/abRwJUePPfuIrBY4HLV5QrmyQ+zKPmD96QCCDWMEj7jOMADLE7hWjrf7Faoh3yHe57+nwqa6ihGXPuHOptJTSbk9EdedEkkknJ6+akhjDY5jjqvsbcJ6wpVoQt3asTgCVMn46rlw8rEcBurT0TQ21jcZ4Tg1Ed/vFMMMRWnEzo2Y81KH54++ZA1FSp3+c0mOB31oaHttIRbQ3IC/hV1e9kTHHvbmelMzOSzMSTzPnZ9HGu8GUtX6oV/2nVLdPNoy13nJVCxHQirMGSONc5JOK8pIQ+iJT/wBNkYfT9atZVNpbSs2NpEOaIyc1pVdrR12PyZ8N/wB+QDuIpo+hrBGouBzpnJ7hq0Gdg3s3NIgB/qonJJJyeZ+6mTbsEf2JDn3Nq0eBNo22B4FMeG6tHRAFBnIUHf31pyN5dFXqoMnYB+CkE1o8CXRFvk8EPyNW+ewiyeVX42rO6XrE/wBPUp32FwOJ1Z1aHH+G0j7o9UQQuA3CpF2HZQeFYNDiM6m4+ZbYltruDmULD4atDNnR8PcWHzqF5XhuY4QFm2wqknGa0g/ZaPvGY5IgfJ+FeTrFtHkezKwHyNIysPR4A4q49KKVfyEfL1KdtqRj03Vmt1b60IR2d/FzMYYfCgM0a56n5ahxFNjGuwbZuo88DkVMnZSyp7LEeFeTAEttsngsjfQGmcSaShjThEjM3vNaaONGXg6xkV5NSfsbmPo4PiKChAcLjJz4029WHd6i7BEZulE51YrhWhpFXSEQbg4ZPEVKhildOYNHzic6422HRuhBrS0ezdbYG6RQ1eSJyt2OhB8atLRbUSEyF3c5ZjzrTD7VtcoOCxP9K8m2xNcr1QHwNNvU+6jwo8T6hcyFm2BwHGsVwoms1Z7rmFvYYMT7jWkFxcE9VB1O+3s7uAxqwaAJGfMxz1X+JLCyk5qSteR7ftb5eqoamk7JC3Pl76u/StrnfvMb/SvJ0/42T+0fqK4x/CjwNHifv5H2EJ1Z1ZoKx4JVvHsJk8Wq9O0tq/tRCgCxAHM0ylCVI30tHhW1uA1JG8jbKKSe6oNHYIaYg/lFXkCCwkwgGACANTenopxj93IDXk1M0V5NsnjF9CKvZ5ZJ4tp+GMCrj+Hn/tt9K0Af8f742ofuvhTHCseg9QuJMtsA7h9dWKRC5C4pIUQDdk9dcvpWVk3QEeFA4IPSpJDIQSOXmW9i8uGf0UqKJIV2UXA+dO6RqWdsAc6FxHeWU3Z59EEEHVYASpcwH+dN1aDymkCpGDsMKu1w6MOf6Vc/w8/9tvpWgzjSMI6hh8qweyq4OIJj0Rvp9/K/ZoW58tWNUEfZpv4njRIIUBcEDeeupeFRMXsCvsS/XzFUuwVRkngKtrFYsPIMv05Cgc1LPHCpZ2x3Vc3T3LdEHBa0Oc/ak6oKIwSKsH2LpO/IqBOx07w3OGYfFamh7XY342TV1utrj+2/0rQ5xpK195+lBjs4rSMnZWN02f8AlkeO77+6bLBBy41wrNW8e2+TwWrOzlvZdhNwG9m5AVBoyztwMRBz1feaudHQXSOqxKJSvotjG+ipQsrDBBwRVhGZYbyNRvOwRUWjkUZkO0aFrDw7IYHWobKKF9sEk8geVBI1YsqDa4Eigd2audIKmUh3nryp3eRizMSep1aIbF0y+1GRU4xNKPzmo22JEbowNSf+o6MfmRIvyqaXstjdxbFXx2bO6P8AlN9KsZRBeW0hOArjJ7tXlDd+jHaqd59J/wBPvuFM2WY9Trt4WwiKMsx+ZqytEs4FjG9uLnqdUCEnapYDdX8sI5zMS3MAE1b2MFqD2SkE8WJyTTZD4xu1y3VtEd8oJ6AZNXV60+UT0Y/mfM0UcX0Xub6VejF1OPzVbwvNIqgbv5j3UZUN7Yx7QLh2OByGyaZVbG0OByK0ocaPuv6aAqPTl9HAsQI3DAcjJAqSR5XaSRizMckn76Q4jc9x1LBI6qw51HEicsmtB2weZ7hhuj3L/UdQ2skY3bsUvoBFxVlIkelbkk4XMu/45ptNx79mFz35Ap9MyNwgUD3k0+krhuAC+6pLmeUYaUkdBraN0VSRuNL+IVzNaM/joP8AV9Kns3nvJWzhMjfz4VNLDYRbMaZc8j9TWjWZ9JwOxyWZiT8Dq00+zo+Ue0VHzzS+oXH7l6AyQOtKNkAdBqsLfsbO3XG84dved9AYqBdptrkKkcRxu54KpbwGas8vcEHi6v4kakQvtY5DPmyS9qqLjh9anIygVcEDeMY1aM/joP8AV9K0rcTLdyxrIQgxgA4pQTCSTknfmtGfx9t7z9NXlA2LWJfak+gocgPUJxmJ6tk2pM8l36oI+1mhj9p1HiaIyMDVGuyoFaXmEOj7k7X41CL8asTi7g72xUUKtO6twUndUn7OSQId3DVHGZGwPianiWIqA2cjhqicI4YjcKdzIxY6tGfx0Hx+laVz9vuM9R9BQHoY7qsHEd7bMTgBwCffq05crNcpEpyIhv8AeawSQAMk8BQtJoC5mgfY2GAbZ4EjcaVUKSEvgjGB1++IyCDwNRxrGMDVo4ZvrX+saoV2nHQVv2uO7HCvKO5BeC2U7lG23x3CrZsXMDfnWrrMd1NsnG/PjvoAbBOqGbstr0c5pmZyWJ362XZxqtpOyuIH6OK03AVu45OUgHiN1Lsk4Y4HWuykkDNGhwmAccaGmrxYuz9HIGNvG+t5YknJ5mtA2S9hLdOu85VO7FbiO41pO1FrdMFHoONpfj6jZyCK7t3PASDOqFdlM9annjtoZJpDhUGTVxO9zNLM59J2zUSu8saouXLAAVpJdm4z1UVk8K2cDVyxRIIFIN+afiNd9F9qsY5Mb1CuKs7U3dwkQOBvLHuFRRQxoixoABwxWnLJBi6iGN+JB+tc6s4ewsII8bxEM+8jJokDFaeiDQQyc1fHj6loy4F5bxEn0h6LjvFO6RIWdwqKN5PCtMaVF8VhhyIVOSTxY01aAsAB9sffkYT9TWmo8OjdGI8d9L+IU5BNAHcdaDC0TknXZES2EQPNCvhurQMWGu2I3jCUxVSd+4HFTQieC5hI3MCPHfVrAZ7uCEj8UgBoum12ecMVJx3cKJwM1pZdqwn7tk/MepWt1NZSCSF8HmORq70jd3oAmkyo/lUYFGlRpJFRRkscAVbQC3toYf5FjwffWm02ow6nIGyc/LUBkinbkKAyQKYYNbQ2PM0O+1abPsORWjI+zS575j9BUsYJcAYLHOeh1AfZtOr/AH/k/wD/AGmiUyJJneoIHuOrSAzY3Q/yz6iOOo0TWi4u2v7VcZAfaPuXfRKld/4SK0jCDBgLu2GGrG7OqPGCaJydWN2aBxq0I+Gnj6gN4VafgcfnNTLlkOeHKgMZ38a0xmLSaSDoj+GokDJNX/8ABXX9s+orRIonOrydQG9dz/JEfE0QrqMjduIqWMPbzZHAZFTLsSyL0YijRrJxigM51Z3Y16KfYvYx7QI/WrTjKP6TUm8A5ocOOe+vKFcXMJ6x4+dW77dvA3tRqfEV1rSbbNhcn8oHiceq+TKjavG7kHjnVCoKMDwO4itIJsXk6/m1Aag2M9/m2TbN3bH84HjVrvklU80FbAjiVV4DV5Q/vrf+g1o5tqwtD/lKNWmn2bFx7TqP19V8mR+yuj+ZdUP7sVppNm+kPXP11ZJx56NsSI3ssD4GrY/t/elNkpkjBxw1eUDZuYV6R58TWihtaOszngtHia0/L/Dwjvc/Qeq+TJ9C7XvQ6os7Az8K8oUxcBu86jRxsigM+YQynDDB1WDbX2Zvaiz8gaJJLqVwMbjq01IJNISj2Aq1ooY0daf0fU5o8TV/cfabuWQH0c7K+4eq+TswS8kjJ/eR7vetEA4zyOaaRIIGkc4VELE9wqeZ7q0Mz8TOxP8Aq3+ZncRrRth1bGcGppRKwIGABq0RLsW9mWO4syeJ1MQASTgDnU8vbTSy+25PjWgdIIE+ySvgg5j6HurS16LaN40cF5MhcfyjgT6tbTvbTxTJxRs1aXtveRh4pP6hzFeUWkkWAWcTgu+O0xyHSot+jZO6Yfcx2dzKoZYzg8yQK2Ow0esYb0lBJPfxrRmkVvE2X9GVRvHI1py6+zWrorenKdke7nq2cqWyNxAx76PH1dSQdxPw1W+/Rtz/AHAfpqz6OPMjhllPoRk94qLRkh/euF7hxpksLIZfG1yB9I1LpiQkiJAo6kZNf8SnmxG+ADxwKDMpBViCOYq4ZnfaZiSRxJyaY4FCjx9XXjRqzcNY3icwQ3mAEkADJqO0ihVZbp9kE7l5/Gn0paxjZjUtjgAMCptK3Eu5MRju4+NEliSTknWjbSg1ONymmoGj6uDiia0UgkW7Q/zIBT2NyhwE2u9eFLo+5K52QO4nBpdG3JOG2VHXOa2bXR0e25y/LqaubmS6k23PuHIDzo5Sh7qkmV0wPXLO7a0dmC5DDBFDTXWD/ur/AI0P+h/3VJpiQjCRAHqTmpJHlYs7lj1P/wBcv//Z'
-        image_bytes = image_str.encode('ascii')
-        image_base64_bytes = base64.b64encode(image_bytes)
-        for n in range(count):
-            random_user = random.choice(user_objects)
-            recipe = Recipe.objects.create(
-                author=random_user,
-                name='Картошка',
-                image=image_base64_bytes.decode('ascii'),
-                text='Рецепт, созданный через скрипт',
-                cooking_time=10
+    def handle(self, *args, **options):
+        if options['users'] < 1:
+            raise CommandError('At least one user is needed')
+        if (options['processes'] > 1
+                and not connection.features.can_return_ids_from_bulk_insert):
+            raise CommandError(
+                f'{connection.vendor} does not return ids from bulk '
+                f'inserts, use --processes 1')
+        generated = User.objects.filter(username__startswith=PREFIX)
+        if generated.filter(recipes__isnull=False).exists():
+            if not options['clear']:
+                raise CommandError(
+                    'Generated data already exists, use --clear')
+            print('deleting generated data...')
+            Recipe.objects.filter(author__in=generated).delete()
+            generated.delete()
+        STATE.update(
+            seed=options['seed'],
+            password=make_password(PASSWORD),
+            follows=options['follows'],
+            favorites=options['favorites'],
+            carts=options['carts'],
+        )
+        pub_date = Recipe._meta.get_field('pub_date')
+        updated_at = Recipe._meta.get_field('updated_at')
+        # Dates come from the seed, not from the clock.
+        pub_date.auto_now_add = updated_at.auto_now = False
+        try:
+            self.run('users', create_users, options['users'], options)
+            users = [
+                pk for _, pk in sorted(
+                    (int(username[len(PREFIX):]), pk)
+                    for username, pk in generated.values_list(
+                        'username', 'id').iterator()
+                    if username[len(PREFIX):].isdigit()
+                )
+            ]
+            authors = users[:]
+            random.Random(f'{options["seed"]}:authors').shuffle(authors)
+            self.prepare(options)
+            STATE.update(
+                users=users,
+                authors=authors,
+                author_weights=zipf_cum_weights(len(authors),
+                                                options['zipf']),
+            )
+            self.run('recipes', create_recipes, options['count'], options)
+            recipes = list(Recipe.objects.filter(
+                author__in=generated
+            ).order_by('pub_date', 'id').values_list('id', flat=True))
+            random.Random(f'{options["seed"]}:recipes').shuffle(recipes)
+            STATE.update(
+                recipes=recipes,
+                recipe_weights=zipf_cum_weights(len(recipes),
+                                                options['zipf']),
             )
-            recipe.ingredients.set(
-                [random.choice(ingredient_amount_objects) for _ in
-                 range(random.randint(1, 5))])
-            recipe.tags.set(
-                [random.choice(tag_objects) for _ in
-                 range(random.randint(1, 2))])
+            self.run('social', create_social, len(users), options)
+        finally:
+            pub_date.auto_now_add = updated_at.auto_now = True
+        print('rebuilding counters, feeds and shopping lists...')
+        # The feed rebuild reads followers_count.
+        call_command('recount')
+        FeedItem.objects.rebuild()
+        call_command('rebuildshoppinglist')
+        for name in ('recipes', 'users'):
+            bump_version(name)
         print('DONE!')
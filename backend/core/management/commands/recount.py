@@ -0,0 +1,43 @@
+from core.models import Favorite, Recipe, Subscription
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from users.models import User
+
+
+def count_subquery(model, field):
+    return Coalesce(Subquery(
+        model.objects.filter(**{field: OuterRef('pk')}).order_by().values(
+            field).annotate(count=Count('id')).values('count')
+    ), 0)
+
+
+COUNTERS = (
+    (User, 'recipes_count', Recipe, 'author'),
+    (User, 'followers_count', Subscription, 'author'),
+    (Recipe, 'favorites_count', Favorite, 'recipe'),
+)
+
+
+class Command(BaseCommand):
+    help = ('Repairing drift of recipes_count, followers_count and '
+            'favorites_count counters')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help='only report drift, exit with an error if there is any')
+
+    def handle(self, *args, **options):
+        drift = 0
+        for model, counter, related_model, field in COUNTERS:
+            expression = count_subquery(related_model, field)
+            wrong = model.objects.annotate(
+                actual=expression).exclude(**{counter: F('actual')}).count()
+            print(f'{model.__name__}.{counter}: {wrong} wrong')
+            drift += wrong
+            if wrong and not options['check']:
+                model.objects.update(**{counter: expression})
+        if drift and options['check']:
+            raise CommandError('Counters have drifted')
+        print('DONE!')
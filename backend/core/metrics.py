@@ -0,0 +1,174 @@
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+# name: (type, help, buckets)
+METRICS = {
+    'foodgram_http_requests_total': (
+        'counter', 'HTTP requests by view, action, method and status.',
+        None),
+    'foodgram_http_request_duration_seconds': (
+        'histogram', 'Request latency by view and action.',
+        LATENCY_BUCKETS),
+    'foodgram_http_request_db_queries': (
+        'histogram', 'SQL queries per request by view and action.',
+        QUERY_BUCKETS),
+    'foodgram_http_request_db_seconds_total': (
+        'counter', 'Time spent in SQL by view and action.', None),
+    'foodgram_cache_requests_total': (
+        'counter', 'Cache lookups by cache and result.', None),
+}
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (
+        (key, str(value).replace('\\', r'\\').replace('"', r'\"').replace(
+            '\n', r'\n'))
+        for key, value in labels
+    )
+    return '{' + ','.join(f'{key}="{value}"' for key, value in escaped) + '}'
+
+
+class MetricsRegistry:
+    """
+    Counters and histograms of the current process.
+
+    Every gunicorn worker writes its values to a file of its own in
+    METRICS_DIR at most every METRICS_FLUSH_INTERVAL seconds, and a scrape
+    merges the files of all workers, so no shared service is needed. Files
+    of exited workers are kept, counters must not go back; empty the
+    directory when the service is redeployed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = None
+        self._path = None
+        self._values = {}
+        self._flushed_at = 0
+
+    def _get_values(self):
+        # Values inherited over fork belong to the parent process.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            # The start time keeps a reused pid from overwriting the file
+            # of an exited worker.
+            self._path = self.get_path(f'{self._pid}-{time.time_ns()}')
+            self._values = {}
+            self._flushed_at = time.monotonic()
+            atexit.register(self.flush)
+        return self._values
+
+    def inc(self, name, value=1, **labels):
+        if not settings.METRICS_ENABLED:
+            return
+        key = name, tuple(sorted(labels.items()))
+        with self._lock:
+            values = self._get_values()
+            values[key] = values.get(key, 0) + value
+        self._maybe_flush()
+
+    def observe(self, name, value, **labels):
+        if not settings.METRICS_ENABLED:
+            return
+        buckets = METRICS[name][2]
+        key = name, tuple(sorted(labels.items()))
+        with self._lock:
+            values = self._get_values()
+            # Per bucket counts, the last one is +Inf, then sum and count.
+            histogram = values.setdefault(key, [0] * (len(buckets) + 3))
+            histogram[bisect_left(buckets, value)] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if (time.monotonic() - self._flushed_at
+                >= settings.METRICS_FLUSH_INTERVAL):
+            self.flush()
+
+    def get_path(self, name):
+        return os.path.join(settings.METRICS_DIR, f'{name}.json')
+
+    def flush(self):
+        with self._lock:
+            values = [
+                [name, labels, value]
+                for (name, labels), value in self._get_values().items()
+            ]
+            self._flushed_at = time.monotonic()
+            path = self._path
+            os.makedirs(settings.METRICS_DIR, exist_ok=True)
+            with open(f'{path}.tmp', 'w') as file:
+                json.dump(values, file)
+            os.replace(f'{path}.tmp', path)
+
+    def collect(self):
+        self.flush()
+        merged = {}
+        for path in glob.glob(self.get_path('*')):
+            try:
+                with open(path) as file:
+                    values = json.load(file)
+            except (OSError, ValueError):
+                continue
+            for name, labels, value in values:
+                if name not in METRICS:
+                    continue
+                key = name, tuple(tuple(label) for label in labels)
+                if key not in merged:
+                    merged[key] = value
+                elif isinstance(value, list):
+                    merged[key] = [a + b for a, b in zip(merged[key], value)]
+                else:
+                    merged[key] += value
+        return merged
+
+    def render(self):
+        merged = self.collect()
+        lines = []
+        for name, (kind, description, buckets) in METRICS.items():
+            lines += [f'# HELP {name} {description}',
+                      f'# TYPE {name} {kind}']
+            for (metric, labels), value in sorted(merged.items()):
+                if metric != name:
+                    continue
+                if kind == 'counter':
+                    lines.append(
+                        f'{name}{format_labels(labels)} '
+                        f'{format_value(value)}')
+                    continue
+                cumulative = 0
+                for bound, count in zip(buckets + (float('inf'),), value):
+                    cumulative += count
+                    bucket_labels = labels + (('le', format_value(bound)),)
+                    lines.append(f'{name}_bucket'
+                                 f'{format_labels(bucket_labels)} '
+                                 f'{cumulative}')
+                lines += [
+                    f'{name}_sum{format_labels(labels)} '
+                    f'{format_value(value[-2])}',
+                    f'{name}_count{format_labels(labels)} {value[-1]}',
+                ]
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,272 @@
+import json
+import logging
+import random
+import re
+from contextlib import ExitStack
+from time import perf_counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_RES = (
+    (re.compile(r'\bIN \((?:\s*%s\s*,)*\s*%s\s*\)', re.IGNORECASE),
+     'IN (...)'),
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'%s'), '?'),
+    (re.compile(r'\s+'), ' '),
+)
+
+
+def fingerprint(sql):
+    """Strips literals and parameters, so repeated queries group together."""
+    for pattern, replacement in FINGERPRINT_RES:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.started = perf_counter()
+        self.queries = 0
+        self.db = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, perf_counter() - started)
+
+    def record(self, sql, elapsed):
+        self.queries += 1
+        self.db += elapsed
+
+    def wrap_connections(self, stack):
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(self))
+
+
+class CountedStream:
+    """
+    Streamed bodies run their queries after the middleware has returned,
+    so each chunk is produced under the counter and the callback fires
+    once the body is exhausted or the response is closed.
+    """
+
+    def __init__(self, content, counter, callback):
+        self.content = content
+        self.counter = counter
+        self.callback = callback
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with ExitStack() as stack:
+            self.counter.wrap_connections(stack)
+            chunk = next(self.content, None)
+        if chunk is None:
+            self.close()
+            raise StopIteration
+        return chunk
+
+    def close(self):
+        callback, self.callback = self.callback, None
+        if callback is not None:
+            callback()
+
+
+def count_streaming(response, counter, callback):
+    """Calls back right away unless the response body is streamed."""
+    if not response.streaming:
+        callback()
+        return
+    response.streaming_content = CountedStream(
+        response.streaming_content, counter, callback)
+
+
+class RequestTimer(QueryCounter):
+    def __init__(self):
+        super().__init__()
+        self.fingerprints = {}
+        self.slow = {}
+        self.view_started = self.view_ended = None
+        self.view_db = 0.0
+        self.render_started = self.render_ended = None
+
+    def record(self, sql, elapsed):
+        super().record(sql, elapsed)
+        key = fingerprint(sql)
+        count, total = self.fingerprints.get(key, (0, 0.0))
+        self.fingerprints[key] = count + 1, total + elapsed
+        if elapsed * 1000 >= settings.REQUEST_TIMING_SLOW_QUERY_MS:
+            count, slowest = self.slow.get(key, (0, 0.0))
+            self.slow[key] = count + 1, max(slowest, elapsed)
+
+    def start_view(self):
+        self.view_started = perf_counter()
+        self.view_db = self.db
+
+    def end_view(self):
+        self.view_ended = perf_counter()
+        self.view_db = self.db - self.view_db
+
+    def start_render(self):
+        self.render_started = perf_counter()
+
+    def end_render(self, response):
+        self.render_ended = perf_counter()
+
+    def get_timings(self):
+        ms = 1000
+        timings = {
+            'total': (perf_counter() - self.started) * ms,
+            'db': self.db * ms,
+        }
+        if self.view_started is not None:
+            view = (self.view_ended or perf_counter()) - self.view_started
+            timings['view'] = view * ms
+            # Everything the view did outside SQL, serializers mostly.
+            timings['app'] = max(view - self.view_db, 0) * ms
+        if self.render_ended is not None:
+            timings['render'] = (
+                self.render_ended - self.render_started) * ms
+        return timings
+
+    def get_repeated(self):
+        return sorted(
+            ((key, count, total)
+             for key, (count, total) in self.fingerprints.items()
+             if count >= settings.REQUEST_TIMING_REPEATED_QUERIES),
+            key=lambda item: -item[1]
+        )
+
+
+class RequestTimingMiddleware:
+    """
+    Opt-in with REQUEST_TIMING_ENABLED. Reports query count and time spent
+    in SQL, the view and rendering as a Server-Timing header and log lines.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_TIMING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if random.random() >= settings.REQUEST_TIMING_SAMPLE_RATE:
+            return self.get_response(request)
+        timer = request.timer = RequestTimer()
+        with ExitStack() as stack:
+            timer.wrap_connections(stack)
+            response = self.get_response(request)
+        if timer.view_started is not None and timer.view_ended is None:
+            timer.end_view()
+        if settings.REQUEST_TIMING_HEADER:
+            response['Server-Timing'] = self.get_header(
+                timer, timer.get_timings(), response.streaming)
+        count_streaming(response, timer, lambda: self.log(
+            request, response, timer, timer.get_timings()))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timer = getattr(request, 'timer', None)
+        if timer is not None:
+            timer.start_view()
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered after the view has returned.
+        timer = getattr(request, 'timer', None)
+        if timer is not None:
+            timer.end_view()
+            timer.start_render()
+            response.add_post_render_callback(timer.end_render)
+        return response
+
+    def get_header(self, timer, timings, streaming):
+        metrics = []
+        for name, duration in timings.items():
+            description = ''
+            if name == 'db':
+                description = f';desc="{timer.queries} queries"'
+            metrics.append(f'{name};dur={duration:.1f}{description}')
+        # Headers leave before the body, its queries only reach the log.
+        if streaming:
+            metrics.append('stream;desc="body not included, see log"')
+        return ', '.join(metrics)
+
+    def log(self, request, response, timer, timings):
+        match = request.resolver_match
+        view = match.view_name if match else None
+        logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'view': view,
+            'status': response.status_code,
+            'streaming': response.streaming,
+            'queries': timer.queries,
+            **{f'{name}_ms': round(duration, 2)
+               for name, duration in timings.items()},
+        }, ensure_ascii=False))
+        for key, (count, slowest) in timer.slow.items():
+            logger.warning(json.dumps({
+                'slow_query': key,
+                'view': view,
+                'count': count,
+                'max_ms': round(slowest * 1000, 2),
+            }, ensure_ascii=False))
+        for key, count, total in timer.get_repeated():
+            logger.warning(json.dumps({
+                'repeated_query': key,
+                'view': view,
+                'count': count,
+                'ms': round(total * 1000, 2),
+            }, ensure_ascii=False))
+
+
+class MetricsMiddleware:
+    """
+    Opt-in with METRICS_ENABLED. Feeds request latency and query counts
+    per view and action into the metrics served at /metrics.
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        request.metrics_labels = {'view': '', 'action': ''}
+        with ExitStack() as stack:
+            counter.wrap_connections(stack)
+            response = self.get_response(request)
+        count_streaming(response, counter, lambda: self.record(
+            request, response, counter))
+        return response
+
+    def record(self, request, response, counter):
+        labels = request.metrics_labels
+        metrics.inc('foodgram_http_requests_total', method=request.method,
+                    status=response.status_code, **labels)
+        metrics.observe('foodgram_http_request_duration_seconds',
+                        perf_counter() - counter.started, **labels)
+        metrics.observe('foodgram_http_request_db_queries',
+                        counter.queries, **labels)
+        metrics.inc('foodgram_http_request_db_seconds_total', counter.db,
+                    **labels)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Viewsets keep the method to action mapping on the view function.
+        view = getattr(view_func, 'cls', view_func)
+        actions = getattr(view_func, 'actions', None) or {}
+        request.metrics_labels = {
+            'view': view.__name__,
+            'action': actions.get(request.method.lower(), ''),
+        }
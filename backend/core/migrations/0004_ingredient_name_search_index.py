@@ -0,0 +1,40 @@
+from django.db import migrations
+
+POSTGRESQL_FORWARD = (
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX IF NOT EXISTS ingredient_name_trgm_idx '
+    'ON core_ingredient USING gin (UPPER(name::text) gin_trgm_ops)',
+)
+POSTGRESQL_BACKWARD = (
+    'DROP INDEX IF EXISTS ingredient_name_trgm_idx',
+)
+SQLITE_FORWARD = (
+    'CREATE INDEX IF NOT EXISTS ingredient_name_nocase_idx '
+    'ON core_ingredient (name COLLATE NOCASE)',
+)
+SQLITE_BACKWARD = (
+    'DROP INDEX IF EXISTS ingredient_name_nocase_idx',
+)
+
+
+def run_statements(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_shoppinglistitem'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_statements({'postgresql': POSTGRESQL_FORWARD,
+                            'sqlite': SQLITE_FORWARD}),
+            run_statements({'postgresql': POSTGRESQL_BACKWARD,
+                            'sqlite': SQLITE_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 2.2.16 on 2026-10-18 03:25
+
+import core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_recipe_image_processed'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='recipe',
+            name='image',
+            field=models.ImageField(storage=core.storage.ContentAddressedStorage(), upload_to='media/recipes/', verbose_name="Recipe's Image"),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 2.2.16 on 2026-10-18 03:26
+
+from django.db import migrations
+from django.db.models import Count, Min
+
+
+def merge_duplicate_ingredients(apps, schema_editor):
+    Ingredient = apps.get_model('core', 'Ingredient')
+    IngredientRecipe = apps.get_model('core', 'IngredientRecipe')
+    ShoppingListItem = apps.get_model('core', 'ShoppingListItem')
+    RecipeIngredients = apps.get_model('core', 'Recipe').ingredients.through
+    groups = Ingredient.objects.values('name', 'measurement_unit').annotate(
+        keep=Min('id'), total=Count('id')).filter(total__gt=1)
+    for group in groups:
+        keep = group['keep']
+        duplicates = Ingredient.objects.filter(
+            name=group['name'], measurement_unit=group['measurement_unit']
+        ).exclude(id=keep)
+        for ingredient_recipe in IngredientRecipe.objects.filter(
+                ingredient__in=duplicates):
+            existing = IngredientRecipe.objects.filter(
+                ingredient_id=keep, amount=ingredient_recipe.amount).first()
+            if existing is None:
+                ingredient_recipe.ingredient_id = keep
+                ingredient_recipe.save()
+                continue
+            links = RecipeIngredients.objects.filter(
+                ingredientrecipe=ingredient_recipe)
+            links.filter(recipe__in=RecipeIngredients.objects.filter(
+                ingredientrecipe=existing).values('recipe')).delete()
+            links.update(ingredientrecipe=existing)
+            ingredient_recipe.delete()
+        for item in ShoppingListItem.objects.filter(
+                ingredient__in=duplicates):
+            kept, created = ShoppingListItem.objects.get_or_create(
+                user_id=item.user_id, ingredient_id=keep,
+                defaults={'total_amount': item.total_amount})
+            if not created:
+                kept.total_amount += item.total_amount
+                kept.save()
+            item.delete()
+        duplicates.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_recipe_image_storage'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_ingredients,
+                             migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.16 on 2026-10-18 03:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_unique_ingredient'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='recipe',
+            options={'ordering': ['-pub_date', '-id']},
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 2.2.16 on 2026-10-18 14:05
+
+from django.db import migrations, models
+from django.utils import timezone
+
+VERSIONS = ('recipes', 'tags', 'ingredients', 'users')
+
+
+def create_versions(apps, schema_editor):
+    Version = apps.get_model('core', 'Version')
+    Version.objects.bulk_create(
+        [Version(name=name, value=1, updated_at=timezone.now())
+         for name in VERSIONS])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_recipe_ordering_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Version',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='Name')),
+                ('value', models.PositiveIntegerField(default=0, verbose_name='Value')),
+                ('updated_at', models.DateTimeField(verbose_name='Updated at')),
+            ],
+            options={
+                'db_table': 'versions',
+            },
+        ),
+        migrations.RunPython(create_versions, migrations.RunPython.noop),
+    ]
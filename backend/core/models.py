@@ -1,10 +1,28 @@
+from itertools import islice
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, Sum
+
+from .storage import ContentAddressedStorage
 
 User = get_user_model()
 
 CHOICES = {}
+BULK_BATCH_SIZE = 5000
+
+
+def bulk_create_in_batches(manager, objects, **kwargs):
+    # bulk_create() turns its argument into a list, so feed it slices to
+    # keep huge rebuilds within bounded memory.
+    objects = iter(objects)
+    while True:
+        batch = list(islice(objects, BULK_BATCH_SIZE))
+        if not batch:
+            return
+        manager.bulk_create(batch, **kwargs)
 
 
 class Ingredient(models.Model):
@@ -15,6 +33,10 @@ class Ingredient(models.Model):
         ordering = ['name']
         verbose_name = 'Ingredient'
         verbose_name_plural = 'Ingredients'
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'measurement_unit'],
+                                    name='unique_ingredient')
+        ]
 
     def __str__(self):
         return self.name
@@ -65,8 +87,11 @@ class Recipe(models.Model):
         max_length=200)
     image = models.ImageField(
         "Recipe's Image",
-        upload_to='media/recipes/'
+        upload_to='media/recipes/',
+        storage=ContentAddressedStorage()
     )
+    image_processed = models.BooleanField(
+        'Image variants ready', default=False, editable=False)
     text = models.TextField(
         "Recipe's text",
         max_length=2000
@@ -82,9 +107,18 @@ class Recipe(models.Model):
     cooking_time = models.IntegerField('Cooking time',
                                        validators=[MinValueValidator(1)])
     pub_date = models.DateTimeField('Publication date', auto_now_add=True)
+    updated_at = models.DateTimeField('Update date', auto_now=True)
+    favorites_count = models.IntegerField(
+        'Favorites count', default=0, editable=False)
 
     class Meta:
-        ordering = ['-pub_date']
+        ordering = ['-pub_date', '-id']
+        indexes = [
+            models.Index(fields=['-pub_date', '-id'],
+                         name='recipe_pub_date_id_idx'),
+            models.Index(fields=['author', '-pub_date'],
+                         name='recipe_author_pub_date_idx')
+        ]
 
     def __str__(self):
         return self.name
@@ -112,6 +146,12 @@ class Subscription(models.Model):
             models.UniqueConstraint(fields=['user', 'author'],
                                     name='unique_following')
         ]
+        indexes = [
+            models.Index(fields=['user', '-id'],
+                         name='subscription_user_id_idx'),
+            models.Index(fields=['author', 'user'],
+                         name='subscription_author_user_idx')
+        ]
 
     def __str__(self):
         return f'{self.user}, {self.author}'
@@ -139,6 +179,10 @@ class Favorite(models.Model):
             models.UniqueConstraint(fields=['user', 'recipe'],
                                     name='unique_favorite')
         ]
+        indexes = [
+            models.Index(fields=['recipe', 'user'],
+                         name='favorite_recipe_user_idx')
+        ]
 
     def __str__(self):
         return f'{self.user}, {self.recipe}'
@@ -166,6 +210,243 @@ class ShoppingCart(models.Model):
             models.UniqueConstraint(fields=['user', 'recipe'],
                                     name='unique_shopping_cart')
         ]
+        indexes = [
+            models.Index(fields=['recipe', 'user'],
+                         name='shopping_cart_recipe_user_idx')
+        ]
+
+    def __str__(self):
+        return f'{self.user}, {self.recipe}'
+
+
+class ShoppingListManager(models.Manager):
+    def recipe_amounts(self, recipe):
+        return dict(IngredientRecipe.objects.filter(
+            ingredients=recipe
+        ).values_list('ingredient').annotate(amount=Sum('amount')))
+
+    def apply(self, users, amounts):
+        users = list(users)
+        if not users or not amounts:
+            return
+        with transaction.atomic():
+            self.bulk_create(
+                [self.model(user_id=user, ingredient_id=ingredient,
+                            total_amount=0)
+                 for user in users
+                 for ingredient, amount in amounts.items() if amount > 0],
+                ignore_conflicts=True
+            )
+            for ingredient, amount in amounts.items():
+                if amount:
+                    self.filter(
+                        user_id__in=users, ingredient_id=ingredient
+                    ).update(total_amount=F('total_amount') + amount)
+            self.filter(user_id__in=users, total_amount__lte=0).delete()
+
+    def add_recipe(self, user_id, recipe):
+        self.apply([user_id], self.recipe_amounts(recipe))
+
+    def remove_recipe(self, user_id, recipe):
+        self.apply([user_id], self.negated_amounts(recipe))
+
+    def change_ingredients(self, recipe, ingredient_recipes, sign):
+        users = list(self.recipe_users(recipe))
+        if not users:
+            return
+        self.apply(users, {
+            ingredient: sign * amount
+            for ingredient, amount in ingredient_recipes.values_list(
+                'ingredient').annotate(amount=Sum('amount')).order_by()
+        })
+
+    def delete_recipe(self, recipe):
+        self.apply(self.recipe_users(recipe), self.negated_amounts(recipe))
+
+    def change_ingredient_recipe(self, ingredient_recipe, sign,
+                                 recipes=None):
+        # Users with several cart recipes sharing the row get it that
+        # many times, one update per multiplier.
+        carts = ShoppingCart.objects.filter(
+            recipe__ingredients=ingredient_recipe)
+        if recipes is not None:
+            carts = carts.filter(recipe__in=recipes)
+        users = {}
+        for user, count in carts.values_list('user').annotate(
+                count=Count('id')).order_by():
+            users.setdefault(count, []).append(user)
+        for count, group in users.items():
+            self.apply(group, {ingredient_recipe.ingredient_id:
+                               sign * ingredient_recipe.amount * count})
+
+    def negated_amounts(self, recipe):
+        return {
+            ingredient: -amount
+            for ingredient, amount in self.recipe_amounts(recipe).items()
+        }
+
+    def recipe_users(self, recipe):
+        return ShoppingCart.objects.filter(
+            recipe=recipe).values_list('user', flat=True)
+
+    def expected(self, user=None):
+        lookup = {'ingredients__shopping_recipe__user__isnull': False}
+        if user is not None:
+            lookup = {'ingredients__shopping_recipe__user': user}
+        return IngredientRecipe.objects.filter(**lookup).values_list(
+            'ingredients__shopping_recipe__user', 'ingredient'
+        ).annotate(total_amount=Sum('amount')).order_by()
+
+    def rebuild(self, user=None):
+        items = self.all() if user is None else self.filter(user=user)
+        with transaction.atomic():
+            items.delete()
+            bulk_create_in_batches(self, (
+                self.model(user_id=user_id, ingredient_id=ingredient,
+                           total_amount=total_amount)
+                for user_id, ingredient, total_amount
+                in self.expected(user).iterator()
+            ))
+
+
+class ShoppingListItem(models.Model):
+    user = models.ForeignKey(
+        User,
+        verbose_name='Пользователь',
+        related_name='shopping_list',
+        on_delete=models.CASCADE,
+    )
+    ingredient = models.ForeignKey(
+        Ingredient,
+        verbose_name='Ингредиент',
+        related_name='shopping_list_items',
+        on_delete=models.CASCADE,
+    )
+    total_amount = models.IntegerField('Общее количество')
+
+    objects = ShoppingListManager()
+
+    class Meta:
+        db_table = 'shopping_list'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'ingredient'],
+                                    name='unique_shopping_list_item')
+        ]
+
+    def __str__(self):
+        return f'{self.user}, {self.ingredient}, {self.total_amount}'
+
+
+class FeedManager(models.Manager):
+    def followers(self, author_id):
+        return Subscription.objects.filter(
+            author_id=author_id).values_list('user', flat=True)
+
+    def is_popular(self, author_id):
+        return User.objects.filter(
+            pk=author_id,
+            followers_count__gt=settings.FEED_FANOUT_LIMIT
+        ).exists()
+
+    def popular_authors(self, user):
+        return Subscription.objects.filter(
+            user=user,
+            author__followers_count__gt=settings.FEED_FANOUT_LIMIT
+        ).values_list('author', flat=True)
+
+    def fan_out(self, recipe):
+        if self.is_popular(recipe.author_id):
+            return
+        bulk_create_in_batches(self, (
+            self.model(user_id=user, recipe_id=recipe.id,
+                       pub_date=recipe.pub_date)
+            for user in self.followers(recipe.author_id).iterator()
+        ), ignore_conflicts=True)
+
+    def latest_recipes(self, author_id):
+        return Recipe.objects.filter(
+            author_id=author_id
+        ).order_by('-pub_date').values_list(
+            'id', 'pub_date')[:settings.FEED_BACKFILL]
+
+    def follow(self, user, author):
+        if self.is_popular(author.id):
+            return
+        self.bulk_create(
+            [self.model(user=user, recipe_id=recipe, pub_date=pub_date)
+             for recipe, pub_date in self.latest_recipes(author.id)],
+            ignore_conflicts=True
+        )
+
+    def backfill(self, author_id):
+        # An author back under the limit: nothing they published while
+        # over it, nor anything before a follow, reached the feed rows.
+        if self.is_popular(author_id):
+            return
+        recipes = list(self.latest_recipes(author_id))
+        bulk_create_in_batches(self, (
+            self.model(user_id=user, recipe_id=recipe, pub_date=pub_date)
+            for user in self.followers(author_id).iterator()
+            for recipe, pub_date in recipes
+        ), ignore_conflicts=True)
+
+    def unfollow(self, user, author):
+        self.filter(user=user, recipe__author=author).delete()
+
+    def rebuild(self):
+        with transaction.atomic():
+            self.all().delete()
+            bulk_create_in_batches(self, (
+                self.model(user_id=user, recipe_id=recipe, pub_date=pub_date)
+                for user, recipe, pub_date in Recipe.objects.filter(
+                    author__following__isnull=False
+                ).exclude(
+                    author__followers_count__gt=settings.FEED_FANOUT_LIMIT
+                ).values_list(
+                    'author__following__user', 'id', 'pub_date'
+                ).iterator()
+            ))
+
+
+class FeedItem(models.Model):
+    user = models.ForeignKey(
+        User,
+        verbose_name='Пользователь',
+        related_name='feed_items',
+        on_delete=models.CASCADE,
+    )
+    recipe = models.ForeignKey(
+        Recipe,
+        verbose_name='Рецепт',
+        related_name='feed_items',
+        on_delete=models.CASCADE,
+    )
+    pub_date = models.DateTimeField('Publication date')
+
+    objects = FeedManager()
+
+    class Meta:
+        db_table = 'feed'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'recipe'],
+                                    name='unique_feed_item')
+        ]
+        indexes = [
+            models.Index(fields=['user', '-pub_date', '-recipe'],
+                         name='feed_user_pub_date_idx')
+        ]
 
     def __str__(self):
         return f'{self.user}, {self.recipe}'
+
+
+class Version(models.Model):
+    name = models.CharField('Name', max_length=50, primary_key=True)
+    value = models.PositiveIntegerField('Value', default=0)
+    updated_at = models.DateTimeField('Updated at')
+
+    class Meta:
+        db_table = 'versions'
+
+    def __str__(self):
+        return f'{self.name}, {self.value}'
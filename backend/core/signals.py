@@ -0,0 +1,186 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete
+)
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .catalog import ingredient_catalog
+from .models import (
+    Favorite,
+    FeedItem,
+    Ingredient,
+    IngredientRecipe,
+    Recipe,
+    ShoppingCart,
+    ShoppingListItem,
+    Subscription,
+    Tag
+)
+from .versions import (
+    bump_cached_version,
+    bump_version,
+    get_token_version_name
+)
+
+User = get_user_model()
+
+
+@receiver([post_save, post_delete], sender=Ingredient)
+def invalidate_ingredient_catalog(**kwargs):
+    bump_version('ingredients')
+    ingredient_catalog.invalidate()
+
+
+@receiver([post_save, post_delete], sender=Tag)
+def bump_tags_version(**kwargs):
+    bump_version('tags')
+
+
+@receiver([post_save, post_delete], sender=User)
+def bump_users_version(**kwargs):
+    bump_version('users')
+
+
+@receiver(post_delete, sender=Token)
+def bump_token_version(instance, **kwargs):
+    # Logout, and deleted users through the cascade.
+    bump_cached_version(get_token_version_name(instance.key))
+
+
+@receiver(post_save, sender=User)
+def bump_user_token_version(instance, created, update_fields, **kwargs):
+    # Deactivation and password changes. Signups have no token yet, and
+    # a login only stamps last_login.
+    if created or update_fields == frozenset(['last_login']):
+        return
+    for key in Token.objects.filter(user=instance).values_list(
+            'key', flat=True):
+        bump_cached_version(get_token_version_name(key))
+
+
+@receiver([post_save, post_delete], sender=Recipe)
+@receiver(m2m_changed, sender=Recipe.tags.through)
+@receiver(m2m_changed, sender=Recipe.ingredients.through)
+def bump_recipes_version(**kwargs):
+    bump_version('recipes')
+
+
+@receiver(m2m_changed, sender=Recipe.ingredients.through)
+def change_shopping_lists(instance, action, reverse, pk_set, **kwargs):
+    # Removed rows are read before they go, added ones after they exist.
+    if action not in ('pre_remove', 'pre_clear', 'post_add'):
+        return
+    sign = 1 if action == 'post_add' else -1
+    if reverse:
+        ShoppingListItem.objects.change_ingredient_recipe(
+            instance, sign, pk_set)
+        return
+    ingredient_recipes = IngredientRecipe.objects.filter(ingredients=instance)
+    if pk_set is not None:
+        ingredient_recipes = ingredient_recipes.filter(pk__in=pk_set)
+    ShoppingListItem.objects.change_ingredients(
+        instance, ingredient_recipes, sign)
+
+
+@receiver(post_save, sender=Recipe)
+def increment_recipes_count(instance, created, **kwargs):
+    if created:
+        User.objects.filter(pk=instance.author_id).update(
+            recipes_count=F('recipes_count') + 1)
+
+
+@receiver(post_delete, sender=Recipe)
+def decrement_recipes_count(instance, **kwargs):
+    User.objects.filter(pk=instance.author_id).update(
+        recipes_count=F('recipes_count') - 1)
+
+
+@receiver(post_save, sender=Subscription)
+def increment_followers_count(instance, created, **kwargs):
+    if created:
+        User.objects.filter(pk=instance.author_id).update(
+            followers_count=F('followers_count') + 1)
+
+
+@receiver(post_delete, sender=Subscription)
+def decrement_followers_count(instance, **kwargs):
+    User.objects.filter(pk=instance.author_id).update(
+        followers_count=F('followers_count') - 1)
+    if User.objects.filter(
+        pk=instance.author_id,
+        followers_count=settings.FEED_FANOUT_LIMIT
+    ).exists():
+        # After commit, so a cascading author delete has finished first.
+        transaction.on_commit(
+            lambda: FeedItem.objects.backfill(instance.author_id))
+
+
+@receiver(post_save, sender=Favorite)
+def increment_favorites_count(instance, created, **kwargs):
+    if created:
+        Recipe.objects.filter(pk=instance.recipe_id).update(
+            favorites_count=F('favorites_count') + 1)
+
+
+@receiver(post_delete, sender=Favorite)
+def decrement_favorites_count(instance, **kwargs):
+    Recipe.objects.filter(pk=instance.recipe_id).update(
+        favorites_count=F('favorites_count') - 1)
+
+
+@receiver(post_save, sender=ShoppingCart)
+def add_to_shopping_list(instance, created, **kwargs):
+    if created:
+        ShoppingListItem.objects.add_recipe(instance.user_id,
+                                            instance.recipe_id)
+
+
+def get_deleted_recipes():
+    return set().union(*(
+        getattr(func, 'deleted_recipes', ())
+        for _, func in transaction.get_connection().run_on_commit
+    ))
+
+
+def mark_recipe_deleted(recipe_id):
+    # Kept with the on-commit callbacks of the current savepoint, so a
+    # rollback forgets the id together with the delete.
+    connection = transaction.get_connection()
+    savepoints = set(connection.savepoint_ids)
+    for callback_savepoints, func in connection.run_on_commit:
+        if (hasattr(func, 'deleted_recipes')
+                and callback_savepoints == savepoints):
+            func.deleted_recipes.add(recipe_id)
+            return
+
+    def forget():
+        pass
+    forget.deleted_recipes = {recipe_id}
+    transaction.on_commit(forget)
+
+
+@receiver(post_delete, sender=ShoppingCart)
+def remove_from_shopping_list(instance, **kwargs):
+    if instance.recipe_id not in get_deleted_recipes():
+        ShoppingListItem.objects.remove_recipe(instance.user_id,
+                                               instance.recipe_id)
+
+
+@receiver(pre_delete, sender=Recipe)
+def debit_recipe_from_shopping_lists(instance, **kwargs):
+    # Ingredients are still there, and one update covers every cart, the
+    # cascaded cart rows are skipped above.
+    ShoppingListItem.objects.delete_recipe(instance)
+    mark_recipe_deleted(instance.pk)
+
+
+@receiver(pre_delete, sender=IngredientRecipe)
+def debit_ingredient_from_shopping_lists(instance, **kwargs):
+    ShoppingListItem.objects.change_ingredient_recipe(instance, -1)
@@ -0,0 +1,45 @@
+import hashlib
+import os.path
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+
+def get_content_hash(content):
+    content_hash = hashlib.sha256()
+    for chunk in content.chunks():
+        content_hash.update(chunk)
+    content.seek(0)
+    return content_hash.hexdigest()
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """Names files by the SHA-256 of their content.
+
+    Saving a file that is already stored returns the existing name
+    without writing anything, so several recipes may share one file. Its
+    modification time is refreshed instead, clearmedia does not reclaim
+    files touched within --min-age.
+    """
+
+    def get_hashed_name(self, name, content):
+        directory, filename = os.path.split(name)
+        content_hash = get_content_hash(content)
+        extension = os.path.splitext(filename)[1].lower()
+        return os.path.join(
+            directory, content_hash[:2], f'{content_hash}{extension}')
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        name = self.get_hashed_name(name, content)
+        if self.exists(name):
+            os.utime(self.path(name))
+            return name
+        # A concurrent upload of the same content ends up under a suffixed
+        # name, which clearmedia later reports as a duplicate.
+        return super().save(name, content, max_length)
@@ -0,0 +1,65 @@
+import hashlib
+import time
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Version
+
+VERSION_KEY = 'version:{}'
+TOKEN_VERSION = 'tokens:{}'
+
+
+def get_versions(names):
+    """Name -> (value, updated_at) of the Version rows, in one query."""
+    versions = dict.fromkeys(names, (0, None))
+    versions.update(
+        (name, (value, updated_at))
+        for name, value, updated_at in Version.objects.filter(
+            name__in=names).values_list('name', 'value', 'updated_at')
+    )
+    return versions
+
+
+def get_version(name):
+    return get_versions([name])[name][0]
+
+
+def increment_version(name):
+    now = timezone.now()
+    if not Version.objects.filter(name=name).update(
+            value=F('value') + 1, updated_at=now):
+        Version.objects.get_or_create(
+            name=name, defaults={'value': 1, 'updated_at': now})
+
+
+def bump_version(name):
+    # Once per transaction and after commit, so writers do not queue up
+    # on the version row. A rolled back transaction drops the callback.
+    if any(getattr(func, 'version', None) == name
+           for _, func in transaction.get_connection().run_on_commit):
+        return
+    func = partial(increment_version, name)
+    func.version = name
+    transaction.on_commit(func)
+
+
+def get_cached_version(name):
+    key = VERSION_KEY.format(name)
+    version = cache.get(key)
+    if version is not None:
+        return version
+    cache.add(key, time.time(), None)
+    return cache.get(key)
+
+
+def bump_cached_version(name):
+    cache.set(VERSION_KEY.format(name), time.time(), None)
+
+
+def get_token_version_name(key):
+    # Raw token keys never end up in the cache backend.
+    return TOKEN_VERSION.format(hashlib.sha256(key.encode()).hexdigest())
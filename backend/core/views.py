@@ -0,0 +1,10 @@
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from .metrics import metrics
+
+
+@require_GET
+def metrics_view(request):
+    return HttpResponse(metrics.render(),
+                        content_type='text/plain; version=0.0.4')
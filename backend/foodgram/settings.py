@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -25,6 +26,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.MetricsMiddleware',
+    'core.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -66,6 +69,21 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND',
+            default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', default='foodgram'),
+    }
+}
+
+RECIPE_LIST_CACHE_TIMEOUT = int(
+    os.getenv('RECIPE_LIST_CACHE_TIMEOUT', default=600))
+
+FEED_FANOUT_LIMIT = int(os.getenv('FEED_FANOUT_LIMIT', default=5000))
+FEED_BACKFILL = int(os.getenv('FEED_BACKFILL', default=100))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -100,12 +118,36 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+UPLOAD_MAX_BODY_SIZE = int(
+    os.getenv('UPLOAD_MAX_BODY_SIZE', default=10 * 1024 * 1024))
+IMAGE_UPLOAD_MAX_SIZE = int(
+    os.getenv('IMAGE_UPLOAD_MAX_SIZE', default=7 * 1024 * 1024))
+IMAGE_UPLOAD_MAX_PIXELS = int(
+    os.getenv('IMAGE_UPLOAD_MAX_PIXELS', default=40_000_000))
+IMAGE_UPLOAD_SPOOL_SIZE = int(
+    os.getenv('IMAGE_UPLOAD_SPOOL_SIZE', default=512 * 1024))
+
+IMAGE_QUEUE = os.getenv('IMAGE_QUEUE', default='core.images.ThreadPoolQueue')
+IMAGE_WORKERS = int(os.getenv('IMAGE_WORKERS', default=2))
+IMAGE_VARIANT_FORMAT = os.getenv('IMAGE_VARIANT_FORMAT', default='WEBP')
+IMAGE_VARIANT_QUALITY = int(os.getenv('IMAGE_VARIANT_QUALITY', default=80))
+IMAGE_VARIANTS = {
+    'thumbnail': (320, 320),
+    'medium': (800, 800),
+    'full': (1600, 1600),
+}
+
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'api.authentication.CachedTokenAuthentication',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.LimitedJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
 }
 
@@ -126,6 +168,48 @@ DJOSER = {
     }
 }
 
+REQUEST_TIMING_ENABLED = (
+    os.getenv('REQUEST_TIMING_ENABLED', default='False') == 'True')
+REQUEST_TIMING_SAMPLE_RATE = float(
+    os.getenv('REQUEST_TIMING_SAMPLE_RATE', default=1.0))
+REQUEST_TIMING_HEADER = (
+    os.getenv('REQUEST_TIMING_HEADER', default='True') == 'True')
+REQUEST_TIMING_SLOW_QUERY_MS = float(
+    os.getenv('REQUEST_TIMING_SLOW_QUERY_MS', default=100))
+REQUEST_TIMING_REPEATED_QUERIES = int(
+    os.getenv('REQUEST_TIMING_REPEATED_QUERIES', default=10))
+
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', default='False') == 'True'
+METRICS_DIR = os.getenv('METRICS_DIR', default=os.path.join(
+    tempfile.gettempdir(), 'foodgram-metrics'))
+METRICS_FLUSH_INTERVAL = float(
+    os.getenv('METRICS_FLUSH_INTERVAL', default=1))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'core.middleware': {
+            'handlers': ['console'],
+            'level': os.getenv('REQUEST_TIMING_LOG_LEVEL', default='INFO'),
+            'propagate': False,
+        },
+    },
+}
+
+TOKEN_CACHE_TTL = int(os.getenv('TOKEN_CACHE_TTL', default=60))
+TOKEN_CACHE_SIZE = int(os.getenv('TOKEN_CACHE_SIZE', default=10000))
+TOKEN_CACHE_SHARED = (
+    os.getenv('TOKEN_CACHE_SHARED', default='False') == 'True')
+
+INGREDIENT_SEARCH_LIMIT = int(os.getenv('INGREDIENT_SEARCH_LIMIT', default=50))
+INGREDIENT_CATALOG_IN_MEMORY = (
+    os.getenv('INGREDIENT_CATALOG_IN_MEMORY', default='False') == 'True')
+INGREDIENT_CATALOG_TTL = int(os.getenv('INGREDIENT_CATALOG_TTL', default=300))
+
 EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 EMAIL_FILE_PATH = os.path.join(BASE_DIR, 'sent_emails')
 DEFAULT_FROM_EMAIL = 'info@foodgram.ru'
@@ -6,6 +6,7 @@ User = get_user_model()
 
 class UserAdmin(admin.ModelAdmin):
     list_filter = ('username', 'email')
+    readonly_fields = ('recipes_count', 'followers_count')
 
 
 admin.site.register(User, UserAdmin)
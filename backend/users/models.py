@@ -22,6 +22,10 @@ class User(AbstractUser):
         'Имя', max_length=150, blank=False)
     last_name = models.CharField(
         'Фамилия', max_length=150, blank=False)
+    recipes_count = models.IntegerField(
+        'Количество рецептов', default=0, editable=False)
+    followers_count = models.IntegerField(
+        'Количество подписчиков', default=0, editable=False)
 
     class Meta:
         ordering = ['username']